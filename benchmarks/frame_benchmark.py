@@ -0,0 +1,220 @@
+"""
+Frame-time benchmark over the scripted scenarios in benchmarks/scenarios.py.
+
+Run from the project root:
+    python -m benchmarks.frame_benchmark run [--frames N] [--only NAME ...] [--out FILE]
+    python -m benchmarks.frame_benchmark compare BASELINE CURRENT [--threshold 0.10]
+    python -m benchmarks.frame_benchmark list
+
+`run` plays every scenario headless (drawing to a dummy display) and prints
+a JSON report; --out also writes it to a file, e.g. benchmarks/baseline.json
+to keep as the reference. Per scenario:
+- fps, p50_ms, p99_ms, mean_ms: wall time of Game.step() over the timed
+  frames (after WARMUP_FRAMES untimed ones)
+- phases: mean ms per frame of each profiler phase (core/profiler.py)
+- alloc_kb_per_frame: Python heap allocated and freed again within a frame
+  (tracemalloc peak above the frame's starting size), measured in a second
+  pass of ALLOC_FRAMES frames on a fresh game because tracemalloc and the
+  allocation tracker slow everything down
+- net_kb_per_frame: what that pass kept (steady growth points at a leak)
+- surfaces_per_frame, surface_kb_per_frame: new Surfaces (constructed,
+  rendered text, transforms, loaded images) in that pass, counted by
+  core/alloc_tracker.py
+
+`compare` checks CURRENT against BASELINE and exits with status 1 when any
+scenario got worse by more than the threshold (default 10%) on fps, p50,
+p99 or allocations.
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout to the JSON report
+
+import pygame
+
+from benchmarks.scenarios import SCENARIOS, new_game
+from config import game_settings as settings
+from core.alloc_tracker import alloc_tracker
+from core.profiler import profiler
+
+WARMUP_FRAMES = 60
+DEFAULT_FRAMES = 600
+ALLOC_FRAMES = 120
+
+# Metric -> True when bigger is better
+COMPARED_METRICS = {
+    "fps": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "alloc_kb_per_frame": False,
+    "surface_kb_per_frame": False,
+}
+
+
+def percentile(samples, fraction):
+    # Nearest rank on sorted samples
+    return samples[round((len(samples) - 1) * fraction)]
+
+
+def play(game, scenario, frames, first_inputs=()):
+    # Frames of the scenario, returning the wall time of each in ms
+    times = []
+    inputs = first_inputs
+    for _ in range(frames):
+        inputs = list(inputs) + list(scenario.frame(game))
+        start = time.perf_counter()
+        game.step(inputs=inputs)
+        times.append((time.perf_counter() - start) * 1000)
+        inputs = ()
+    return times
+
+
+def measure_allocations(scenario, frames, seed=1):
+    # A game of its own, with the Surface wrappers in place before its fonts are made
+    log_file, settings.alloc_log_file = settings.alloc_log_file, None
+    alloc_tracker.install()
+    try:
+        game = new_game(seed)
+        play(game, scenario, WARMUP_FRAMES, scenario.setup(game))
+        alloc_tracker.window = {}
+        alloc_tracker.window_frames = 0
+
+        tracemalloc.start()
+        start_size = tracemalloc.get_traced_memory()[0]
+        churn = 0
+        for _ in range(frames):
+            inputs = scenario.frame(game)
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            game.step(inputs=inputs)
+            churn += tracemalloc.get_traced_memory()[1] - before
+        end_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        surfaces = alloc_tracker.window.values()
+    finally:
+        alloc_tracker.uninstall()
+        settings.alloc_log_file = log_file
+    return {
+        "alloc_kb_per_frame": round(churn / frames / 1024, 2),
+        "net_kb_per_frame": round((end_size - start_size) / frames / 1024, 3),
+        "surfaces_per_frame": round(sum(calls for calls, _ in surfaces) / frames, 2),
+        "surface_kb_per_frame": round(sum(size for _, size in surfaces) / frames / 1024, 2),
+    }
+
+
+def run_scenario(scenario, frames, seed=1):
+    game = new_game(seed)
+    first_inputs = scenario.setup(game)
+    play(game, scenario, WARMUP_FRAMES, first_inputs)
+
+    profiler.reset()
+    profiler.enabled = True
+    times = play(game, scenario, frames)
+    phases = {name: round(figures["mean"], 3) for name, figures in profiler.stats().items() if name != "frame"}
+    profiler.enabled = False
+
+    ordered = sorted(times)
+    mean_ms = sum(times) / len(times)
+    return {
+        "frames": frames,
+        "enemies": len(game.enemy_list),
+        "fps": round(1000 / mean_ms, 1),
+        "mean_ms": round(mean_ms, 3),
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3),
+        **measure_allocations(scenario, ALLOC_FRAMES, seed),
+        "phases": phases,
+    }
+
+
+def run(names, frames, seed=1):
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "seed": seed,
+        "scenarios": {},
+    }
+    for name in names:
+        print(f"Running {name} ({frames} frames)...", file=sys.stderr)
+        with contextlib.redirect_stdout(io.StringIO()):  # The game's own messages would end up in the report
+            report["scenarios"][name] = run_scenario(SCENARIOS[name], frames, seed)
+    return report
+
+
+def compare(baseline, current, threshold, metrics=COMPARED_METRICS):
+    """Print a table of changes; returns the list of (scenario, metric) that regressed past `threshold`."""
+    regressions = []
+    print(f"{'scenario':<18} {'metric':<20} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, base in baseline["scenarios"].items():
+        now = current["scenarios"].get(name)
+        if now is None:
+            print(f"{name:<18} missing from the current run")
+            continue
+        for metric, higher_is_better in metrics.items():
+            before, after = base.get(metric), now.get(metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before if before else 0.0
+            worse = -change if higher_is_better else change
+            flag = ""
+            if worse > threshold:
+                regressions.append((name, metric))
+                flag = "  REGRESSION"
+            print(f"{name:<18} {metric:<20} {before:>10.2f} {after:>10.2f} {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame-time benchmark over scripted headless scenarios.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the scenarios and print a JSON report")
+    run_parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Timed frames per scenario")
+    run_parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), help="Run just these scenarios")
+    run_parser.add_argument("--seed", type=int, default=1, help="Random seed for every scenario")
+    run_parser.add_argument("--out", metavar="FILE", help="Also write the report to this file")
+
+    compare_parser = commands.add_parser("compare", help="Compare a report against a baseline report")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="Relative change that counts as a regression (0.10 = 10%%)")
+
+    commands.add_parser("list", help="List the scenarios")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<18} {scenario.description}")
+    elif args.command == "run":
+        report = run(args.only or list(SCENARIOS), args.frames, args.seed)
+        text = json.dumps(report, indent=2)
+        print(text)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+    else:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, "r", encoding="utf-8") as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Spawns a large wave of every entity type and prints the memory cost per entity.
+
+Run from the project root:
+    python -m benchmarks.memory_report [count]
+
+For each type it prints:
+- dict layout: what the instance would cost with a per-instance __dict__
+  (object header + a dict holding the same attributes, approximate)
+- slots layout: what the instance costs now that the classes use __slots__
+- traced: Python heap growth per entity while the wave was spawned
+  (tracemalloc, includes lists, rects and strings owned by the entity, but
+  not SDL surface pixels)
+"""
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config import constants
+from effects.particles import Particle
+from effects.plus_one import PlusXEffect
+from effects.shockwave import Shockwave
+from enemies.checkpoint_divider import CheckpointDivider
+from enemies.enemy_battleship import EnemyBattleship
+from enemies.enemy_cluster_bomb import EnemyClusterBomb
+from enemies.enemy_gunship import EnemyGunship
+from enemies.enemy_meteor import EnemyMeteor
+from enemies.enemy_proximity_mine import EnemyProximityMines
+from enemies.enemy_shell import EnemyShell
+from enemies.enemy_sucide_drone import EnemySuicideDrone
+from core.entity_store import EntityStore
+from player import Player
+from shooting.bullet import Bullet
+from headless import temporary_checkpoint_manager
+
+DEFAULT_COUNT = 500
+
+
+def slot_names(cls):
+    names = []
+    for klass in cls.__mro__:
+        names.extend(getattr(klass, "__slots__", ()))
+    return names
+
+
+def dict_layout_size(obj):
+    # Object header without slots plus a dict holding the same attribute values
+    values = {name: getattr(obj, name) for name in slot_names(type(obj)) if hasattr(obj, name)}
+    return object.__basicsize__ + 2 * 8 + sys.getsizeof(values)  # header + __dict__/__weakref__ pointers
+
+
+def build_factories(player, store):
+    host = EnemyGunship(player, store)  # Shells need a ship to spawn from
+    checkpoints = temporary_checkpoint_manager()  # Dividers must not touch the player's checkpoint files
+    return [
+        ("Particle", lambda: Particle(100, 100, (255, 255, 0))),
+        ("Bullet", lambda: Bullet((100, 100), host, "a")),
+        ("Shockwave", lambda: Shockwave(100, 100)),
+        ("PlusXEffect", lambda: PlusXEffect(100, 100, 5)),
+        ("EnemyMeteor", lambda: EnemyMeteor(player)),
+        ("EnemyProximityMines", lambda: EnemyProximityMines(player)),
+        ("EnemyClusterBomb", lambda: EnemyClusterBomb(player)),
+        ("EnemySuicideDrone", lambda: EnemySuicideDrone(player)),
+        ("EnemyShell", lambda: EnemyShell(player, host)),
+        ("EnemyGunship", lambda: EnemyGunship(player, store)),
+        ("EnemyBattleship", lambda: EnemyBattleship(player, store)),
+        ("CheckpointDivider", lambda: CheckpointDivider(player, checkpoints, 1)),
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+
+    pygame.init()
+    pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+    player = Player()
+    store = EntityStore()
+
+    print(f"Spawning {count} of each entity type\n")
+    print(f"{'entity':<20} {'dict layout':>12} {'slots layout':>13} {'saved':>7} {'traced/entity':>14}")
+
+    total_dict = total_slots = 0
+    for name, factory in build_factories(player, store):
+        factory()  # Warm up asset loading so it is not counted
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        wave = [factory() for _ in range(count)]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        traced = sum(stat.size_diff for stat in after.compare_to(before, "filename")) / count
+
+        slots_size = sys.getsizeof(wave[0])
+        dict_size = dict_layout_size(wave[0])
+        total_dict += dict_size * count
+        total_slots += slots_size * count
+        print(f"{name:<20} {dict_size:>10} B {slots_size:>11} B {dict_size - slots_size:>5} B {traced:>12.0f} B")
+        del wave
+
+    print(f"\nInstance overhead for the whole wave: {total_dict / 1024:.1f} KiB with __dict__, "
+          f"{total_slots / 1024:.1f} KiB with __slots__")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
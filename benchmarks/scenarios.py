@@ -0,0 +1,170 @@
+"""
+Scripted scenes for the frame benchmark (benchmarks/frame_benchmark.py).
+
+Each scenario starts a seeded headless game drawing to a dummy display,
+swaps the campaign for an empty one so only the scene's own entities are
+on screen, and then calls its `frame` hook before every game frame to keep
+the scene at full strength (top up meteors, fire the next burst...).
+
+The player can't die during a scenario: health and ammo are set high
+enough to last, so every frame does the same kind of work.
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from campaign.scheduler import CampaignScheduler, MAIN_TRACK
+from campaign.timeline import CampaignTimeline
+from config import constants
+from core import rng
+from core.auto_typer import AutoTyper
+from enemies.enemy_battleship import EnemyBattleship
+from enemies.enemy_cluster_bomb import EnemyClusterBomb
+from enemies.enemy_meteor import EnemyMeteor
+from enemies.enemy_proximity_mine import EnemyProximityMines
+from enemies.enemy_sucide_drone import EnemySuicideDrone
+from game import Game
+from headless import temporary_checkpoint_manager
+
+PLAYER_HEALTH = 1_000_000
+PLAYER_AMMO = 1_000_000
+
+METEOR_COUNT = 50
+PARTICLE_BURST = 1000
+LABELLED_ENEMY_COUNT = 200
+
+
+# =============================================
+# SpammingBattleship Class (a battleship on a hair trigger)
+# =============================================
+class SpammingBattleship(EnemyBattleship):
+    """Fires shells and launches drones ten times as often as the campaign's battleship."""
+    __slots__ = ()
+
+    def should_fire(self):
+        return rng.gameplay.random() < 0.1
+
+    def should_spawn_drone(self):
+        return rng.gameplay.random() < 0.05
+
+
+# =============================================
+# Scenario Class
+# =============================================
+class Scenario:
+    """A named scene: `setup(game)` once, `frame(game)` before each frame; both return this frame's input events."""
+    def __init__(self, name, description, setup, frame):
+        self.name = name
+        self.description = description
+        self.setup = setup
+        self.frame = frame
+
+
+def new_game(seed=1):
+    """A headless game on an empty campaign, drawing every frame to a dummy display."""
+    pygame.init()
+    screen = pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+    game = Game(1, screen=screen, headless=True, seed=seed, checkpoint_manager=temporary_checkpoint_manager())
+    game.render = True
+    game.timeline = CampaignTimeline.compile([])
+    game.campaign = CampaignScheduler(game.handle_json_event)
+    game.main_track = game.campaign.start_track(MAIN_TRACK, game.timeline)
+    game.player.health = PLAYER_HEALTH
+    game.player.ammo = PLAYER_AMMO
+    return game
+
+
+def count_alive(game, enemy_type):
+    return sum(1 for enemy in game.enemy_list if isinstance(enemy, enemy_type))
+
+
+def place_on_screen(enemy):
+    # Anywhere on screen instead of the spawn point above it
+    enemy.rect.x = rng.gameplay.randint(0, constants.SCREEN_WIDTH - enemy.rect.width)
+    enemy.rect.y = rng.gameplay.randint(0, constants.SCREEN_HEIGHT - enemy.rect.height - 100)
+    return enemy
+
+
+# ---------- Meteor shower: 50 meteors on screen, shot at by the bot ----------
+def meteor_shower_setup(game):
+    game.auto_typer = AutoTyper(8)
+    for _ in range(METEOR_COUNT):
+        game.enemy_list.add(place_on_screen(EnemyMeteor(game.player)))
+    return ()
+
+
+def meteor_shower_frame(game):
+    for _ in range(METEOR_COUNT - count_alive(game, EnemyMeteor)):
+        game.enemy_list.add(EnemyMeteor(game.player, target_player=True))
+    return game.auto_typer.inputs(game)
+
+
+# ---------- Battleship: shells and drones every few frames ----------
+def battleship_setup(game):
+    game.auto_typer = AutoTyper(8)
+    return ()
+
+
+def battleship_frame(game):
+    if count_alive(game, EnemyBattleship) == 0:
+        game.enemy_list.add(SpammingBattleship(game.player, game.enemy_list))
+    return game.auto_typer.inputs(game)
+
+
+# ---------- Particle burst: 1000 particles, again as soon as they have faded ----------
+def particle_burst_setup(game):
+    return ()
+
+
+def particle_burst_frame(game):
+    if not game.bullets_manager.particles:
+        game.bullets_manager.create_particle_effect(
+            rng.gameplay.randint(100, constants.SCREEN_WIDTH - 100),
+            rng.gameplay.randint(100, constants.SCREEN_HEIGHT - 100),
+            amount=PARTICLE_BURST)
+    return ()
+
+
+# ---------- 200 labelled enemies: words drawn on every one of them ----------
+LABELLED_TYPES = (EnemyMeteor, EnemyProximityMines, EnemyClusterBomb, EnemySuicideDrone)
+
+
+def labelled_enemies_setup(game):
+    for i in range(LABELLED_ENEMY_COUNT):
+        game.enemy_list.add(place_on_screen(LABELLED_TYPES[i % len(LABELLED_TYPES)](game.player)))
+    return ()
+
+
+def labelled_enemies_frame(game):
+    missing = LABELLED_ENEMY_COUNT - sum(1 for enemy in game.enemy_list if enemy.word)
+    for i in range(missing):
+        game.enemy_list.add(place_on_screen(LABELLED_TYPES[i % len(LABELLED_TYPES)](game.player)))
+    return ()
+
+
+# ---------- Menu idle: the in-game menu open over a paused game ----------
+def menu_idle_setup(game):
+    return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode="\x1b"),
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_ESCAPE, mod=0, unicode="\x1b")]
+
+
+def menu_idle_frame(game):
+    return ()
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    Scenario("meteor_shower", f"{METEOR_COUNT} meteors falling, the bot shooting them",
+             meteor_shower_setup, meteor_shower_frame),
+    Scenario("battleship", "A battleship spamming shells and suicide drones",
+             battleship_setup, battleship_frame),
+    Scenario("particle_burst", f"Bursts of {PARTICLE_BURST} hit particles",
+             particle_burst_setup, particle_burst_frame),
+    Scenario("labelled_enemies", f"{LABELLED_ENEMY_COUNT} enemies on screen with their word labels",
+             labelled_enemies_setup, labelled_enemies_frame),
+    Scenario("menu_idle", "In-game menu open, game paused",
+             menu_idle_setup, menu_idle_frame),
+)}
@@ -0,0 +1,89 @@
+"""
+Compares the collision grid against brute-force rect checks.
+
+Run from the project root:
+    python -m benchmarks.spatial_hash_benchmark
+
+Entities are spread at a constant density (the field grows with the entity
+count, like a long wave queued above the screen), so a grid query should cost
+about the same at every size while the brute-force scan grows linearly.
+"""
+import random
+import time
+
+import pygame
+
+from config import constants
+from core.spatial_hash import SpatialHash
+
+ENTITY_COUNTS = (125, 250, 500, 1000, 2000)
+ENTITIES_PER_SCREEN = 40   # Roughly a busy meteor shower
+QUERIES = 1000             # Player/bullet sized probes per run
+REPEATS = 5
+
+
+class Body:
+    # Minimal stand-in for an enemy: the grid only needs a `rect`
+    def __init__(self, rect):
+        self.rect = rect
+
+
+def make_field(count, rng):
+    screens = max(1, count / ENTITIES_PER_SCREEN)
+    height = int(constants.SCREEN_HEIGHT * screens)
+    bodies = []
+    for _ in range(count):
+        size = rng.choice((16, 28, 43, 89, 101, 120))
+        x = rng.randint(0, constants.SCREEN_WIDTH - size)
+        y = rng.randint(0, height - size)
+        bodies.append(Body(pygame.Rect(x, y, size, size)))
+    probes = [pygame.Rect(rng.randint(0, constants.SCREEN_WIDTH), rng.randint(0, height), 20, 20)
+              for _ in range(QUERIES)]
+    return bodies, probes
+
+
+def brute_force(bodies, probes):
+    hits = 0
+    for probe in probes:
+        for body in bodies:
+            if body.rect.colliderect(probe):
+                hits += 1
+    return hits
+
+
+def with_grid(grid, probes):
+    hits = 0
+    for probe in probes:
+        hits += len(grid.query_rect(probe))
+    return hits
+
+
+def best_of(func, *args):
+    best = float("inf")
+    result = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    rng = random.Random(1234)
+    print(f"{'entities':>8} {'rebuild ms':>11} {'grid us/query':>14} {'brute us/query':>15} {'speedup':>8}")
+    for count in ENTITY_COUNTS:
+        bodies, probes = make_field(count, rng)
+        grid = SpatialHash(constants.COLLISION_CELL_SIZE)
+
+        rebuild_time, _ = best_of(grid.rebuild, bodies)
+        grid_time, grid_hits = best_of(with_grid, grid, probes)
+        brute_time, brute_hits = best_of(brute_force, bodies, probes)
+        assert grid_hits == brute_hits, "grid and brute force disagree"
+
+        grid_us = grid_time / QUERIES * 1e6
+        brute_us = brute_time / QUERIES * 1e6
+        print(f"{count:>8} {rebuild_time * 1000:>11.3f} {grid_us:>14.2f} {brute_us:>15.2f} {brute_us / grid_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
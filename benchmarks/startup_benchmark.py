@@ -0,0 +1,144 @@
+"""
+Cold versus warm startup benchmark: launches main.py until the start menu is
+interactive, several times, and reports how long each milestone took.
+
+Run from the project root:
+    python -m benchmarks.startup_benchmark run [--runs N] [--out FILE]
+    python -m benchmarks.startup_benchmark compare BASELINE CURRENT [--threshold 0.10]
+
+Every run is a fresh `python main.py --exit-after-startup` on a dummy
+display and audio driver, so nothing of one run is left in the next one's
+process. Two modes:
+- cold: an empty bytecode cache (PYTHONPYCACHEPREFIX pointing at a new
+  directory) every run, so every imported module is compiled again, as on
+  the first launch after installing or updating. The operating system's
+  file cache is not dropped, which needs root.
+- warm: a bytecode cache filled by one untimed launch first, as on every
+  launch after that.
+
+Per mode, medians over the runs:
+- process_ms: wall time from starting the interpreter to its exit
+- window_ms, first_frame_ms, interactive_ms: the startup tracer's milestones
+  (core/startup_tracer.py, counted from main.py's first import, so the
+  interpreter's own startup is only in process_ms)
+- breakdown_ms: self time of imports, asset loads, font loads, pygame/display
+  init and the rest before the menu was interactive
+- slowest_imports_ms, slowest_assets_ms: from the median run by interactive_ms
+
+`compare` checks CURRENT against BASELINE the way the frame benchmark does
+and exits with status 1 when a milestone got slower by more than the
+threshold (default 10%).
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.frame_benchmark import compare
+
+DEFAULT_RUNS = 5
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Metric -> True when bigger is better
+COMPARED_METRICS = {
+    "process_ms": False,
+    "window_ms": False,
+    "first_frame_ms": False,
+    "interactive_ms": False,
+}
+
+
+def launch(pycache_dir, trace_path):
+    """One launch of main.py up to the interactive menu: (wall ms, the tracer's JSON)."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONPYCACHEPREFIX=pycache_dir)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [sys.executable, "main.py", "--exit-after-startup", "--startup-json", trace_path]
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+    wall_ms = (time.perf_counter() - start) * 1000
+    with open(trace_path, "r", encoding="utf-8") as f:
+        return wall_ms, json.load(f)
+
+
+def summarize(launches):
+    # Medians over the runs; the per-item lists come from the median run
+    milestones = {name: statistics.median(trace["milestones_ms"][name] for _, trace in launches)
+                  for name in ("window", "first_frame", "interactive")}
+    kinds = sorted({kind for _, trace in launches for kind in trace["breakdown_ms"]})
+    ordered = sorted(launches, key=lambda run: run[1]["milestones_ms"]["interactive"])
+    median_trace = ordered[len(ordered) // 2][1]
+    return {
+        "runs": len(launches),
+        "process_ms": round(statistics.median(wall_ms for wall_ms, _ in launches), 1),
+        **{f"{name}_ms": round(ms, 1) for name, ms in milestones.items()},
+        "breakdown_ms": {kind: round(statistics.median(trace["breakdown_ms"].get(kind, 0.0) for _, trace in launches), 1)
+                         for kind in kinds},
+        "slowest_imports_ms": median_trace["slowest_imports_ms"],
+        "slowest_assets_ms": median_trace["slowest_assets_ms"],
+    }
+
+
+def run(runs):
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="startup_benchmark_") as scratch:
+        trace_path = os.path.join(scratch, "trace.json")
+
+        print(f"Cold: {runs} launches, each with an empty bytecode cache...", file=sys.stderr)
+        report["scenarios"]["cold"] = summarize(
+            [launch(os.path.join(scratch, f"cold_{i}"), trace_path) for i in range(runs)])
+
+        print(f"Warm: 1 launch to fill the bytecode cache, then {runs}...", file=sys.stderr)
+        warm_cache = os.path.join(scratch, "warm")
+        launch(warm_cache, trace_path)
+        report["scenarios"]["warm"] = summarize([launch(warm_cache, trace_path) for _ in range(runs)])
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold and warm startup benchmark of main.py.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Launch the game repeatedly and print a JSON report")
+    run_parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Timed launches per mode")
+    run_parser.add_argument("--out", metavar="FILE", help="Also write the report to this file")
+
+    compare_parser = commands.add_parser("compare", help="Compare a report against a baseline report")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="Relative change that counts as a regression (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run(args.runs)
+        text = json.dumps(report, indent=2)
+        print(text)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+    else:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, "r", encoding="utf-8") as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold, COMPARED_METRICS)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
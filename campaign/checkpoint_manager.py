@@ -3,17 +3,59 @@ import os
 import datetime
 import pygame
 
+from config import game_settings as settings
 from config.loader import Loader
+from core.journal import Journal
+from core.persistence import writer
+
+# Checkpoint journals by path, shared by every CheckpointManager in the process (menus and games):
+# the file is replayed once, after that a read only stats it and picks up what changed
+_journals = {}
+
 
 class CheckpointManager:
-    # Manages game checkpoints by saving, loading, and listing them in a JSON file.
+    # Manages game checkpoints by saving, loading, and listing them.
+    # They live in an append-only journal (core/journal.py) next to the JSON file name given,
+    # e.g. campaign/checkpoints.journal: a save appends one fsync'd record instead of rewriting the file.
+    # The JSON file is only read once, to seed a journal that doesn't exist yet.
+    # Saves are written behind by core/persistence.py, so crossing a checkpoint never waits on the disk;
+    # reads flush the queued saves first.
     def __init__(self, file_name="campaign/checkpoints.json"):
         # Store both the relative filename and its absolute path.
         self.file_name = file_name
         self.file_path = Loader.resource_path(file_name)
+        self.journal_path = os.path.splitext(self.file_path)[0] + ".journal"
+        self.journal = _journals.get(self.journal_path)
+        if self.journal is None:
+            seed_journal = not os.path.exists(self.journal_path)
+            self.journal = _journals[self.journal_path] = Journal(self.journal_path, settings.checkpoint_compact_after)
+            if seed_journal:
+                self.import_json_checkpoints()
+
+    @staticmethod
+    def normalize_id(checkpoint_id):
+        # Ensure the checkpoint id is an int if possible.
+        try:
+            return int(checkpoint_id)
+        except (ValueError, TypeError):
+            return checkpoint_id
+
+    def import_json_checkpoints(self):
+        # Copy the checkpoints of the old JSON file (or the shipped default) into a new journal
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+            return
+        try:
+            checkpoints_list = Loader.load_json(self.file_name)
+        except json.JSONDecodeError:
+            print("Warning: Checkpoint file is corrupted. Starting with no checkpoints.")
+            return
+        for cp in checkpoints_list:
+            self.journal.put(self.normalize_id(cp.get("id")), cp)
+        print(f"Imported {len(checkpoints_list)} checkpoint(s) from {self.file_name}")
 
     def save_checkpoint(self, checkpoint_id, player):
         # Build checkpoint data using the player's current state.
+        checkpoint_id = self.normalize_id(checkpoint_id)
         checkpoint_data = {
             "id": checkpoint_id,
             "states": {
@@ -24,77 +66,26 @@ class CheckpointManager:
             "timestamp": datetime.datetime.now().isoformat()
         }
 
-        existing_checkpoints = {}
-
-        # Load existing checkpoints if the file exists and is not empty.
-        if os.path.exists(self.file_path) and os.path.getsize(self.file_path) > 0:
-            try:
-                checkpoints_list = Loader.load_json(self.file_name)
-                # Convert the list of checkpoints to a dict keyed by id.
-                for cp in checkpoints_list:
-                    cp_id = cp.get("id")
-                    try:
-                        cp_id = int(cp_id)
-                    except (ValueError, TypeError):
-                        pass
-                    existing_checkpoints[cp_id] = cp
-            except (json.JSONDecodeError, KeyError):
-                print("Warning: Checkpoint file is corrupted. Resetting checkpoints.")
-                existing_checkpoints = {}
+        # Insert or update the checkpoint in the background (a newer save of the same id replaces a queued one)
+        writer.submit(("checkpoint", self.journal_path, checkpoint_id), self.write_checkpoint, checkpoint_data)
 
-        # Ensure the checkpoint id is an int if possible.
-        try:
-            checkpoint_id = int(checkpoint_id)
-        except (ValueError, TypeError):
-            pass
-        checkpoint_data["id"] = checkpoint_id
-
-        # Insert or update the checkpoint.
-        existing_checkpoints[checkpoint_id] = checkpoint_data
-
-        # Save the updated checkpoints back to the file.
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(list(existing_checkpoints.values()), f, indent=4)
+    def write_checkpoint(self, checkpoint_data):
+        # Runs on the persistence thread: one record appended, whatever the number of checkpoints
+        self.journal.put(checkpoint_data["id"], checkpoint_data)
         print(f"Checkpoint '{checkpoint_data.get('id')}' saved successfully!")
 
     def json_file_load_checkpoints(self):
-        # Loads and returns a list of all saved checkpoints.
-        if os.path.exists(self.file_path) and os.path.getsize(self.file_path) > 0:
-            try:
-                return Loader.load_json(self.file_name)
-            except json.JSONDecodeError:
-                print("Error: Checkpoint file is corrupted. Returning an empty list.")
-                return []
-        return []
+        # Returns a list of all saved checkpoints.
+        writer.flush()
+        return [checkpoint for _, checkpoint in self.journal.items()]
 
     def load_checkpoint_by_id(self, checkpoint_id):
         # Loads a specific checkpoint by its id.
-        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
-            print("No checkpoints found.")
-            return None
-
-        try:
-            checkpoints = Loader.load_json(self.file_name)
-            try:
-                checkpoint_id = int(checkpoint_id)
-            except (ValueError, TypeError):
-                pass
-
-            for checkpoint in checkpoints:
-                cp_id = checkpoint.get("id")
-                try:
-                    cp_id = int(cp_id)
-                except (ValueError, TypeError):
-                    pass
-                if cp_id == checkpoint_id:
-                    return checkpoint
-
+        writer.flush()
+        checkpoint = self.journal.get(self.normalize_id(checkpoint_id))
+        if checkpoint is None:
             print(f"Checkpoint '{checkpoint_id}' not found.")
-            return None
-
-        except json.JSONDecodeError:
-            print("Error: Checkpoint file is corrupted.")
-            return None
+        return checkpoint
 
     # def build_checkpoint(self, json_object, player):
     #     # Constructs a checkpoint dictionary from a given JSON object and player state.
@@ -128,15 +119,12 @@ class CheckpointManager:
         return  checkpoint_list
 
     def delete_all_except_checkpoint_1(self):
-        # Load existing checkpoints
-        checkpoints = self.json_file_load_checkpoints()
-
-        # Filter only checkpoint with id = 1
-        filtered_checkpoints = [cp for cp in checkpoints if cp.get("id") == 1]
-
-        # Save back only the remaining checkpoint
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(filtered_checkpoints, f, indent=4)
+        # Delete every checkpoint but the one with id = 1
+        writer.flush()
+        for checkpoint_id, _ in self.journal.items():
+            if checkpoint_id != 1:
+                self.journal.delete(checkpoint_id)
+        self.journal.compact()
 
         print("Deleted all checkpoints except checkpoint with id = 1.")
 
@@ -0,0 +1,138 @@
+import sys
+from types import MappingProxyType
+
+from campaign import jcon
+from config import game_settings as settings
+from core import rng
+
+# Enemy type -> class name, the key of settings.endless_frame_costs
+ENEMY_CLASS_NAMES = {
+    jcon.EnemyType.ENEMY_METEOR.value: "EnemyMeteor",
+    jcon.EnemyType.ENEMY_PROXIMITY_MINE.value: "EnemyProximityMines",
+    jcon.EnemyType.ENEMY_CLUSTER_BOMB.value: "EnemyClusterBomb",
+    jcon.EnemyType.ENEMY_SUICIDE_DRONE.value: "EnemySuicideDrone",
+    jcon.EnemyType.ENEMY_GUNSHIP.value: "EnemyGunship",
+    jcon.EnemyType.ENEMY_BATTLESHIP.value: "EnemyBattleship",
+}
+
+# Lines for the wave announcements ({wave} is filled in)
+WAVE_TAUNTS = (
+    "Alien: Wave {wave}. You are still alive? Not for long.",
+    "Alien: Wave {wave}. I have ships to spare, human.",
+    "Alien: Wave {wave}. Every rock in this sector answers to me.",
+    "Alien: Wave {wave}. Your fingers must be getting tired.",
+)
+
+
+# =============================================
+# Endless waves (generated campaign events)
+# =============================================
+def endless_waves(frame_load, wave=1):
+    """
+    Yield campaign events ({"delay": ms, "action": {...}}) forever, one at a
+    time, only when the scheduler asks for the next one.
+
+    Each wave gets a difficulty budget (settings.endless_wave_budget) that
+    is spent on enemies priced by settings.endless_enemy_costs; gunships
+    only join on boss waves. Every spawn first waits out its spacing as an
+    empty event, then checks `frame_load()`, the estimated cost of what is
+    on screen now (see Game.live_frame_load), and idles in small steps
+    while the spawn would push it past settings.endless_max_frame_load.
+    The spawn itself has no delay: the scheduler generates the next event
+    when the previous one fires, so the check and the spawn happen on the
+    same tick and nothing can arrive in between.
+
+    Boss spawns make the track wait for "boss_defeated" like any campaign
+    track, so the next wave starts once the gunship is down.
+    """
+    costs = settings.endless_enemy_costs
+    while True:
+        yield {"delay": settings.endless_wave_break, "action": {"message": {
+            "sender": "alien", "text_message": rng.gameplay.choice(WAVE_TAUNTS).format(wave=wave)}}}
+
+        shower = wave % settings.endless_shower_every == 0
+        if shower:
+            yield {"delay": 0, "action": {"trigger": {jcon.METEOR_SHOWER: True}}}
+
+        boss_wave = wave % settings.endless_boss_every == 0
+        budget = settings.endless_wave_budget[0] + settings.endless_wave_budget[1] * (wave - 1)
+        if boss_wave:
+            budget -= costs[jcon.EnemyType.ENEMY_GUNSHIP.value]  # The gunship closes the wave
+
+        affordable = [enemy_type for enemy_type in costs
+                      if enemy_type != jcon.EnemyType.ENEMY_GUNSHIP.value and costs[enemy_type] <= budget]
+        while affordable:
+            # Cheaper enemies come more often; meteors are also where the ammo comes from
+            enemy_type = rng.gameplay.choices(affordable, weights=[1 / costs[t] for t in affordable])[0]
+            yield {"delay": spawn_spacing(wave), "action": {}}
+            while frame_load() + spawn_load(enemy_type) > settings.endless_max_frame_load:
+                yield {"delay": settings.endless_idle_step, "action": {}}  # Screen is full, look again shortly
+            budget -= costs[enemy_type]
+            yield {"delay": 0, "action": {"spawn": {jcon.ENEMY_TYPE: enemy_type}}}
+            affordable = [t for t in affordable if costs[t] <= budget]
+
+        if boss_wave:
+            yield {"delay": settings.endless_wave_break, "action": {}}
+            while frame_load() + spawn_load(jcon.EnemyType.ENEMY_GUNSHIP.value) > settings.endless_max_frame_load:
+                yield {"delay": settings.endless_idle_step, "action": {}}
+            yield {"delay": 0, "action": {"spawn": {
+                jcon.ENEMY_TYPE: jcon.EnemyType.ENEMY_GUNSHIP.value}}}
+
+        if shower:
+            yield {"delay": settings.endless_wave_break, "action": {"trigger": {jcon.METEOR_SHOWER: False}}}
+        wave += 1
+
+
+def spawn_load(enemy_type):
+    return settings.endless_frame_costs.get(ENEMY_CLASS_NAMES.get(enemy_type), 1.0)
+
+
+def spawn_spacing(wave):
+    # Spawns come closer together as the waves go on, down to the minimum
+    slowest, fastest = settings.endless_spawn_spacing
+    return max(fastest, slowest - (wave - 1) * settings.endless_spacing_step)
+
+
+# =============================================
+# GeneratedTimeline Class (scheduler track over a generator)
+# =============================================
+class GeneratedTimeline:
+    """
+    Lets the scheduler play a generator of events like a CampaignTimeline.
+    Only the event the track is on is kept; the next one is generated when
+    the track asks for it, so it reflects the game as it is at that moment.
+    """
+    tracks = MappingProxyType({})
+    checkpoints = MappingProxyType({})
+
+    def __init__(self, events):
+        self.events = iter(events)
+        self.index = -1
+        self.current = (0, {})
+        self.length = sys.maxsize  # Unknown until the generator ends
+
+    def __len__(self):
+        return self.length
+
+    def delay(self, index):
+        return self.event(index)[0]
+
+    def action(self, index):
+        return self.event(index)[1]
+
+    def event(self, index):
+        while self.index < index:
+            try:
+                event = next(self.events)
+            except StopIteration:
+                self.length = self.index + 1
+                return 0, {}
+            self.index += 1
+            self.current = (event.get("delay", 0), event["action"])
+        return self.current
+
+    def checkpoint_start(self, checkpoint_id):
+        return 0, 0  # Endless runs have no checkpoints
+
+    def close(self):
+        pass
@@ -0,0 +1,176 @@
+import heapq
+from itertools import count
+
+# Name of the main campaign track ("events" in game_event.json)
+MAIN_TRACK = "main"
+
+
+# =============================================
+# Track Class (one timeline played from an index)
+# =============================================
+class Track:
+    """
+    Plays a CampaignTimeline (or a StreamingTimeline, which only has the
+    next few events in memory): each event fires `delay` ms after the one
+    before it. While waiting on a condition the track is off the heap.
+    """
+    __slots__ = ("name", "timeline", "index", "last_time", "waiting_on", "active", "due_sequence")
+
+    def __init__(self, name, timeline, index, last_time):
+        self.name = name
+        self.timeline = timeline
+        self.index = index            # Next event to fire
+        self.last_time = last_time    # Scheduler time the previous event fired (or the track started/resumed)
+        self.waiting_on = None        # Condition this track is suspended on
+        self.active = True
+        self.due_sequence = None      # Sequence number of this track's live heap entry
+
+    def next_time(self):
+        return self.last_time + self.timeline.delay(self.index)
+
+    def is_done(self):
+        return self.index >= len(self.timeline)
+
+    def fire(self, scheduler, due_time):
+        action = self.timeline.action(self.index)
+        self.index += 1
+        self.last_time = due_time  # Absolute times, so a late tick does not push later events back
+        scheduler.handler(action)
+
+
+# =============================================
+# Emitter Class (repeating action)
+# =============================================
+class Emitter:
+    """Runs the same action every `every` ms, `remaining` more times (None = until stopped)."""
+    __slots__ = ("name", "action", "every", "remaining", "last_time", "active", "due_sequence")
+
+    def __init__(self, name, action, every, remaining, last_time):
+        self.name = name
+        self.action = action
+        self.every = every
+        self.remaining = remaining
+        self.last_time = last_time
+        self.active = True
+        self.due_sequence = None
+
+    def next_time(self):
+        return self.last_time + self.every
+
+    def is_done(self):
+        return self.remaining is not None and self.remaining <= 0
+
+    def fire(self, scheduler, due_time):
+        if self.remaining is not None:
+            self.remaining -= 1
+        self.last_time = due_time
+        scheduler.handler(self.action)
+
+
+# =============================================
+# CampaignScheduler Class (priority queue of tracks and emitters)
+# =============================================
+class CampaignScheduler:
+    """
+    Runs any number of tracks and emitters side by side on one campaign clock.
+
+    - Every running track/emitter has exactly one entry in a heap keyed by
+      the time of its next action, so firing an action and scheduling the
+      next one costs O(log n) however many timers are running.
+    - Stopping one just marks it inactive; its stale heap entry is skipped
+      when it comes up (lazy deletion).
+    - `wait(condition)` takes the track whose action is running off the heap
+      and subscribes it to the condition; `signal(condition)` puts every
+      subscriber back. Nothing is polled per frame.
+
+    `handler(action)` runs an action (Game.handle_json_event). Actions can
+    call back into the scheduler (start_track, start_emitter, stop, wait,
+    signal) while they run.
+    """
+    def __init__(self, handler):
+        self.handler = handler
+        self.now = 0              # Campaign clock (ms)
+        self.heap = []            # (due time, sequence, track or emitter)
+        self.sequence = count()   # Tie-breaker: equal times fire in scheduling order
+        self.running = {}         # name -> Track/Emitter that has not finished
+        self.subscribers = {}     # condition -> [Track, ...]
+        self.current = None       # Track/Emitter whose action is running
+
+    # ---------- Setup ----------
+    def start_track(self, name, timeline, index=0):
+        """Start (or restart) a track from event `index`; its first delay counts from now."""
+        self.stop(name)
+        track = Track(name, timeline, index, self.now)
+        self.running[name] = track
+        self.schedule(track)
+        return track
+
+    def start_emitter(self, name, action, every, repeat_count=None):
+        """Run `action` now and then every `every` ms, `repeat_count` times in total (None = until stopped)."""
+        self.stop(name)
+        emitter = Emitter(name, action, max(every, 1), repeat_count, self.now - every)
+        self.running[name] = emitter
+        self.schedule(emitter)
+        return emitter
+
+    def stop(self, name):
+        runner = self.running.pop(name, None)
+        if runner is not None:
+            runner.active = False
+            if isinstance(runner, Track) and runner.waiting_on is not None:
+                self.subscribers[runner.waiting_on].remove(runner)
+
+    def get_track(self, name):
+        runner = self.running.get(name)
+        return runner if isinstance(runner, Track) else None
+
+    # ---------- Conditions ----------
+    def wait(self, condition):
+        """Suspend the track whose action is running until `condition` is signalled."""
+        track = self.current
+        if not isinstance(track, Track) or track.waiting_on is not None:
+            return
+        track.waiting_on = condition
+        track.due_sequence = None  # Drops its heap entry (if run_due already re-queued it)
+        self.subscribers.setdefault(condition, []).append(track)
+
+    def signal(self, condition):
+        """Resume every track waiting on `condition`; their next delay counts from now."""
+        for track in self.subscribers.pop(condition, ()):
+            track.waiting_on = None
+            track.last_time = self.now
+            self.schedule(track)
+
+    # ---------- Time ----------
+    def advance(self, dt):
+        self.now += dt
+        self.run_due()
+
+    def run_due(self):
+        # Fire every action due by now, earliest first (several per tick if the frame was long)
+        heap = self.heap
+        while heap and heap[0][0] <= self.now:
+            due_time, sequence, runner = heapq.heappop(heap)
+            if not runner.active or runner.due_sequence != sequence:
+                continue  # Stopped, or suspended on a condition
+            runner.due_sequence = None
+            self.current = runner
+            runner.fire(self, due_time)
+            self.current = None
+            if runner.active and self.running.get(runner.name) is runner:
+                if getattr(runner, "waiting_on", None) is None:
+                    self.schedule(runner)
+
+    def schedule(self, runner):
+        if runner.is_done():
+            runner.active = False
+            if self.running.get(runner.name) is runner:
+                del self.running[runner.name]
+            return
+        sequence = next(self.sequence)
+        runner.due_sequence = sequence
+        heapq.heappush(self.heap, (runner.next_time(), sequence, runner))
+
+    def is_finished(self):
+        """Nothing left to run: every track and emitter has ended (tracks waiting on a condition count as running)."""
+        return not self.running
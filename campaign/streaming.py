@@ -0,0 +1,195 @@
+"""
+JSON Lines campaigns, read a few events at a time.
+
+A .jsonl campaign has one event per line, in the same shape as the entries
+of "events" in game_event.json:
+    {"delay": 3000, "action": {"checkpoint": {"id": "1"}}}
+    {"delay": 10000, "action": {"spawn": {"enemy_type": "enemy_meteor"}}}
+Blank lines are skipped. There are no extra tracks in this format.
+
+Run from the project root:
+    python -m campaign.streaming convert campaign/game_event.json campaign/game_event.jsonl
+    python -m campaign.streaming index campaign/game_event.jsonl
+"""
+import json
+import os
+import sys
+from bisect import bisect_right
+from collections import deque
+from types import MappingProxyType
+
+from config import game_settings as settings
+from config.loader import Loader
+
+INDEX_VERSION = 1
+
+
+# =============================================
+# Sidecar offset index (<campaign>.jsonl.idx)
+# =============================================
+def build_offset_index(path):
+    """
+    One pass over the file: the number of events, and for every checkpoint
+    its event index, byte offset and campaign time. Only the current line is
+    in memory at any time.
+    """
+    checkpoints = {}
+    event_index = 0
+    campaign_time = 0
+    with open(path, "rb") as f:
+        offset = 0
+        for line in f:
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            campaign_time += event.get("delay", 0)
+            action = event.get("action")
+            checkpoint_info = action.get("checkpoint") if isinstance(action, dict) else None
+            if isinstance(checkpoint_info, dict) and "id" in checkpoint_info:
+                # Stored at the start of the event's delay, the same place CampaignTimeline seeks to
+                checkpoints[str(checkpoint_info["id"])] = [event_index, line_offset, campaign_time - event.get("delay", 0)]
+            event_index += 1
+    return {"events": event_index, "checkpoints": checkpoints}
+
+
+def load_offset_index(path):
+    """The sidecar index for `path`, rebuilt when the campaign file's size or mtime changed."""
+    stat = os.stat(path)
+    source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "version": INDEX_VERSION}
+    index_path = f"{path}.idx"
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("source") == source:
+                return index
+        except (OSError, ValueError) as e:
+            print(f"Rebuilding unreadable campaign index {index_path}: {e}")
+
+    index = build_offset_index(path)
+    index["source"] = source
+    try:
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        print(f"Could not write campaign index {index_path}: {e}")
+    return index
+
+
+# =============================================
+# StreamingTimeline Class (lazy reader for .jsonl campaigns)
+# =============================================
+class StreamingTimeline:
+    """
+    Plays like a CampaignTimeline (the scheduler only calls delay(), action()
+    and len()), but keeps at most `lookahead` events in memory.
+
+    Events are read in order as the track reaches them, topped up in batches
+    once fewer than half the lookahead are left. Jumping to a checkpoint
+    seeks straight to its byte offset from the sidecar index, so startup and
+    memory don't grow with the size of the campaign.
+    """
+    tracks = MappingProxyType({})  # The JSON Lines format has only the main track
+
+    def __init__(self, file_name, lookahead=None):
+        self.path = Loader.resource_path(file_name)
+        index = load_offset_index(self.path)
+        self.event_count = index["events"]
+        self.checkpoints = MappingProxyType({checkpoint_id: entry[0] for checkpoint_id, entry in index["checkpoints"].items()})
+        self.checkpoint_entries = index["checkpoints"]
+        # (event index, byte offset) to restart reading from, sorted by index
+        self.seek_points = sorted([(0, 0)] + [(entry[0], entry[1]) for entry in index["checkpoints"].values()])
+        self.lookahead = max(lookahead or settings.campaign_lookahead, 2)
+
+        self.file = open(self.path, "rb")
+        self.buffer = deque()   # (delay, action) for events buffer_start, buffer_start + 1, ...
+        self.buffer_start = 0
+
+    def __len__(self):
+        return self.event_count
+
+    def delay(self, index):
+        return self.event(index)[0]
+
+    def action(self, index):
+        return self.event(index)[1]
+
+    def event(self, index):
+        if index < self.buffer_start:
+            self.seek(index)
+        # Drop what the track has passed, then top up once less than half the lookahead is left
+        while self.buffer and self.buffer_start < index:
+            self.buffer.popleft()
+            self.buffer_start += 1
+        if len(self.buffer) < self.lookahead // 2:
+            self.fill(index)
+        return self.buffer[index - self.buffer_start]
+
+    def fill(self, index):
+        # Read on until `lookahead` events from `index` are buffered; lines before `index` are skipped unparsed
+        read_index = self.buffer_start + len(self.buffer)
+        end_index = min(index + self.lookahead, self.event_count)
+        while read_index < end_index:
+            line = self.file.readline()
+            if not line:
+                raise ValueError(f"{self.path} ended after {read_index} events, its index says {self.event_count}")
+            if not line.strip():
+                continue
+            read_index += 1
+            if read_index <= index:
+                self.buffer_start = read_index  # Buffer is empty while skipping
+                continue
+            event = json.loads(line)
+            self.buffer.append((event.get("delay", 0), event["action"]))
+
+    def seek(self, index):
+        # Restart reading from the nearest checkpoint at or before `index`
+        seek_index, offset = self.seek_points[bisect_right(self.seek_points, (index, float("inf"))) - 1]
+        self.file.seek(offset)
+        self.buffer.clear()
+        self.buffer_start = seek_index
+
+    def checkpoint_start(self, checkpoint_id):
+        """(index, campaign time) to seek to for a checkpoint; unknown ids start from the beginning."""
+        entry = self.checkpoint_entries.get(str(checkpoint_id))
+        if entry is None:
+            print(f"Checkpoint '{checkpoint_id}' is not in the campaign, starting from the beginning")
+            return 0, 0
+        event_index, _, start_time = entry
+        self.seek(event_index)
+        return event_index, start_time
+
+    def close(self):
+        self.file.close()
+
+
+# =============================================
+# Command line
+# =============================================
+def convert(json_file, jsonl_file):
+    """Write the main track of a game_event.json style file as JSON Lines."""
+    with open(json_file, "r", encoding="utf-8") as f:
+        events = json.load(f)["events"]
+    with open(jsonl_file, "w", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    print(f"Wrote {len(events)} events to {jsonl_file}")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "convert":
+        convert(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) == 3 and sys.argv[1] == "index":
+        index = load_offset_index(sys.argv[2])
+        print(f"{sys.argv[2]}: {index['events']} events, {len(index['checkpoints'])} checkpoints")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
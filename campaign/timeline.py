@@ -0,0 +1,166 @@
+import hashlib
+import os
+import pickle
+from itertools import accumulate
+from types import MappingProxyType
+
+from campaign.validator import CampaignError, check_campaign
+from config import game_settings as settings
+from config.loader import Loader
+
+# Bump when CampaignTimeline changes shape, so old cache files are ignored
+TIMELINE_VERSION = 2
+
+
+# =============================================
+# CampaignTimeline Class (compiled game_event.json)
+# =============================================
+class CampaignTimeline:
+    """
+    The campaign event list compiled once into an immutable timeline:
+
+    - times[i]   absolute campaign time (ms) of event i, the running sum of the
+                 per-event delays in game_event.json
+    - actions[i] the event's action (a dict, or a list of dicts)
+    - checkpoints  checkpoint id (str) -> index of its event
+    - tracks     name -> CampaignTimeline for the extra tracks ("tracks" in
+                 game_event.json), started by {"track": {"name": ...}} actions
+
+    Times count from the start of the track. CampaignScheduler plays a
+    timeline on its own clock, which stands still while the game is paused.
+    Treat the actions as read-only, the same timeline is shared by every Game.
+    """
+    __slots__ = ("source_hash", "times", "actions", "checkpoints", "tracks")
+
+    def __init__(self, source_hash, times, actions, checkpoints, tracks=None):
+        self.source_hash = source_hash
+        self.times = tuple(times)
+        self.actions = tuple(actions)
+        self.checkpoints = MappingProxyType(dict(checkpoints))
+        self.tracks = MappingProxyType(dict(tracks or {}))
+
+    @classmethod
+    def compile(cls, events, source_hash=None, tracks=None):
+        times = accumulate(event.get("delay", 0) for event in events)
+        checkpoints = {}
+        for index, event in enumerate(events):
+            action = event.get("action", {})
+            # Only single-action events carry a checkpoint (the same rule build_checkpoint_map had)
+            checkpoint_info = action.get("checkpoint") if isinstance(action, dict) else None
+            if isinstance(checkpoint_info, dict) and "id" in checkpoint_info:
+                checkpoints[str(checkpoint_info["id"])] = index
+        compiled_tracks = {name: cls.compile(track_events, source_hash) for name, track_events in (tracks or {}).items()}
+        return cls(source_hash, times, [event["action"] for event in events], checkpoints, compiled_tracks)
+
+    def __len__(self):
+        return len(self.times)
+
+    def __getstate__(self):
+        return self.source_hash, self.times, self.actions, dict(self.checkpoints), dict(self.tracks)
+
+    def __setstate__(self, state):
+        source_hash, times, actions, checkpoints, tracks = state
+        self.source_hash = source_hash
+        self.times = times
+        self.actions = actions
+        self.checkpoints = MappingProxyType(checkpoints)
+        self.tracks = MappingProxyType(tracks)
+
+    def delay(self, index):
+        """Milliseconds between event `index` and the one before it."""
+        return self.times[index] - self.start_time(index)
+
+    def action(self, index):
+        return self.actions[index]
+
+    def start_time(self, index):
+        """Campaign time from which event `index` counts its delay (when the event before it fired)."""
+        return self.times[index - 1] if index > 0 else 0
+
+    def close(self):
+        pass  # Shared and fully in memory, nothing to release (StreamingTimeline closes its file)
+
+    def checkpoint_start(self, checkpoint_id):
+        """(index, campaign time) to seek to for a checkpoint; unknown ids start from the beginning."""
+        index = self.checkpoints.get(str(checkpoint_id))
+        if index is None:
+            print(f"Checkpoint '{checkpoint_id}' is not in the campaign, starting from the beginning")
+            index = 0
+        return index, self.start_time(index)
+
+
+# Compiled timelines by content hash, shared by every Game in the process
+_timelines = {}
+
+
+def open_campaign(file_name):
+    """
+    The timeline a Game plays: the shared compiled timeline for a .json
+    campaign, or a new StreamingTimeline (it has its own read position)
+    for a .jsonl one.
+    """
+    if file_name.endswith(".jsonl"):
+        from campaign.streaming import StreamingTimeline
+        return StreamingTimeline(file_name)
+    return load_timeline(file_name)
+
+
+def load_timeline(file_name="campaign/game_event.json"):
+    """
+    Return the compiled timeline for a campaign file.
+
+    The file is hashed on every call (cheap); it is only parsed and compiled
+    when that hash has not been seen before, in memory or in the on-disk
+    cache (settings.campaign_cache_dir).
+
+    The first load in a process also validates the file (campaign/validator.py,
+    a cached verdict when the file is unchanged) and raises CampaignError
+    when it is broken.
+    """
+    path = Loader.resource_path(file_name)
+    with open(path, "rb") as f:
+        source_hash = hashlib.sha1(f.read()).hexdigest()
+
+    timeline = _timelines.get(source_hash)
+    if timeline is not None:
+        return timeline
+
+    if settings.validate_campaign:
+        errors = check_campaign(file_name)
+        if errors:
+            raise CampaignError(file_name, errors)
+
+    cache_path = os.path.join(Loader.resource_path(settings.campaign_cache_dir),
+                              f"timeline_v{TIMELINE_VERSION}_{source_hash}.pickle")
+    timeline = read_cached_timeline(cache_path)
+    if timeline is None:
+        data = Loader.load_json(file_name)
+        timeline = CampaignTimeline.compile(data["events"], source_hash, data.get("tracks"))
+        write_cached_timeline(cache_path, timeline)
+
+    _timelines[source_hash] = timeline
+    return timeline
+
+
+def read_cached_timeline(cache_path):
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            timeline = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+        print(f"Ignoring unreadable timeline cache {cache_path}: {e}")
+        return None
+    return timeline if isinstance(timeline, CampaignTimeline) else None
+
+
+def write_cached_timeline(cache_path, timeline):
+    # The cache is an optimisation only: a read-only install just compiles on every start
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(timeline, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Could not write timeline cache {cache_path}: {e}")
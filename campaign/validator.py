@@ -0,0 +1,308 @@
+"""
+Checks a campaign file before the game plays it.
+
+Run from the project root (exit code 1 when the campaign is broken):
+    python -m campaign.validator [campaign/game_event.json]
+
+The game runs the same check when it first loads a campaign file. The
+verdict is cached by content hash (campaign file, schema and validator
+version), so an unchanged campaign costs one file hash at startup.
+"""
+import hashlib
+import json
+import os
+import sys
+
+from campaign import jcon
+from campaign.scheduler import MAIN_TRACK
+from config import game_settings as settings
+from config.loader import Loader
+
+SCHEMA_FILE = "campaign/game_event_schema.json"
+VALIDATOR_VERSION = 1  # Bump when the checks change, so cached verdicts are redone
+
+# Conditions the game signals by itself (see Game.on_enemy_killed)
+BUILT_IN_CONDITIONS = {"boss_defeated"}
+
+
+class CampaignError(ValueError):
+    """Raised when a campaign file fails validation."""
+    def __init__(self, file_name, errors):
+        super().__init__(f"{file_name} has {len(errors)} error(s):\n  " + "\n  ".join(errors))
+        self.errors = errors
+
+
+# =============================================
+# Schema checks (the JSON Schema keywords game_event_schema.json uses)
+# =============================================
+JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+}
+
+
+def check_schema(instance, schema, root, path="$"):
+    """
+    Return a list of "path: problem" strings for `instance` against `schema`.
+
+    Supports type, enum, minimum, minLength/maxLength, properties, required,
+    additionalProperties, items, minItems, oneOf and local $refs, which is
+    everything campaign/game_event_schema.json uses.
+    """
+    if "$ref" in schema:
+        schema = resolve_ref(schema["$ref"], root)
+
+    if "oneOf" in schema:
+        return check_one_of(instance, schema["oneOf"], root, path)
+
+    expected = schema.get("type")
+    if expected is not None and not type_matches(instance, expected):
+        return [f"{path}: expected {expected}, got {type(instance).__name__}"]
+
+    errors = []
+    if "enum" in schema and instance not in schema["enum"]:
+        errors.append(f"{path}: {instance!r} is not one of {schema['enum']}")
+    if "minimum" in schema and instance < schema["minimum"]:
+        errors.append(f"{path}: {instance} is below the minimum {schema['minimum']}")
+    if "minLength" in schema and len(instance) < schema["minLength"]:
+        errors.append(f"{path}: shorter than {schema['minLength']} characters")
+    if "maxLength" in schema and len(instance) > schema["maxLength"]:
+        errors.append(f"{path}: longer than {schema['maxLength']} characters")
+    if "minItems" in schema and len(instance) < schema["minItems"]:
+        errors.append(f"{path}: needs at least {schema['minItems']} item(s)")
+
+    if isinstance(instance, dict):
+        properties = schema.get("properties", {})
+        for key in schema.get("required", ()):
+            if key not in instance:
+                errors.append(f"{path}: missing '{key}'")
+        extra = schema.get("additionalProperties", True)
+        for key, value in instance.items():
+            if key in properties:
+                errors += check_schema(value, properties[key], root, f"{path}.{key}")
+            elif extra is False:
+                errors.append(f"{path}: unexpected '{key}'")
+            elif isinstance(extra, dict):
+                errors += check_schema(value, extra, root, f"{path}.{key}")
+
+    if isinstance(instance, list) and "items" in schema:
+        for index, item in enumerate(instance):
+            errors += check_schema(item, schema["items"], root, f"{path}[{index}]")
+    return errors
+
+
+def type_matches(instance, expected):
+    # bool is an int subclass in Python, JSON keeps them apart
+    return isinstance(instance, JSON_TYPES[expected]) and (expected == "boolean" or not isinstance(instance, bool))
+
+
+def check_one_of(instance, variants, root, path):
+    results = [check_schema(instance, variant, root, path) for variant in variants]
+    matches = sum(1 for errors in results if not errors)
+    if matches == 1:
+        return []
+    if matches > 1:
+        return [f"{path}: matches more than one allowed form"]
+
+    # Nothing matched: if only one form fits the value's type and keys (e.g. the "spawn" action), report its errors
+    candidates = []
+    for variant, errors in zip(variants, results):
+        variant = resolve_ref(variant["$ref"], root) if "$ref" in variant else variant
+        if "type" in variant and not type_matches(instance, variant["type"]):
+            continue
+        required = variant.get("required", ())
+        if isinstance(instance, dict) and not all(key in instance for key in required):
+            continue
+        candidates.append(errors)
+    if len(candidates) == 1:
+        return candidates[0]
+    return [f"{path}: matches none of the allowed forms"]
+
+
+def resolve_ref(ref, root):
+    if not ref.startswith("#/"):
+        raise ValueError(f"Only local $refs are supported, got {ref}")
+    node = root
+    for part in ref[2:].split("/"):
+        node = node[part]
+    return node
+
+
+# =============================================
+# Campaign checks
+# =============================================
+def iter_actions(action):
+    # One event's action dicts: a list of them, or one, plus the actions repeat emitters run
+    for single in action if isinstance(action, list) else (action,):
+        if not isinstance(single, dict):
+            continue
+        yield single
+        repeat = single.get("repeat")
+        if isinstance(repeat, dict) and isinstance(repeat.get("action"), dict):
+            yield repeat["action"]
+
+
+def check_enemy_types(tracks):
+    known = {enemy_type.value for enemy_type in jcon.EnemyType}
+    errors = []
+    for track_name, events in tracks.items():
+        for index, event in enumerate(events):
+            for action in iter_actions(event.get("action")):
+                spawn = action.get("spawn")
+                if isinstance(spawn, dict) and spawn.get(jcon.ENEMY_TYPE) not in known:
+                    errors.append(f"{track_name}[{index}]: unknown enemy type {spawn.get(jcon.ENEMY_TYPE)!r}")
+    return errors
+
+
+def check_checkpoints(tracks):
+    # Checkpoints are loaded by id from the main track only (CampaignTimeline.checkpoints), and the
+    # level screen unlocks them by count, so the ids have to be 1..N with each one a single-action event
+    errors = []
+    seen = {}
+    for track_name, events in tracks.items():
+        for index, event in enumerate(events):
+            action = event.get("action")
+            for single in iter_actions(action):
+                checkpoint = single.get("checkpoint")
+                if not isinstance(checkpoint, dict):
+                    continue
+                where = f"{track_name}[{index}]"
+                if track_name != "events" or single is not action:
+                    errors.append(f"{where}: checkpoint {checkpoint.get('id')!r} can't be loaded "
+                                  f"(checkpoints must be single actions on the main track)")
+                    continue
+                checkpoint_id = str(checkpoint.get("id"))
+                if checkpoint_id in seen:
+                    errors.append(f"{where}: duplicate checkpoint id {checkpoint_id!r} (first at {seen[checkpoint_id]})")
+                    continue
+                seen[checkpoint_id] = where
+
+    numbers = set()
+    for checkpoint_id, where in seen.items():
+        if checkpoint_id.isdigit():
+            numbers.add(int(checkpoint_id))
+        else:
+            errors.append(f"{where}: checkpoint id {checkpoint_id!r} is not a number")
+    if numbers:
+        missing = sorted(set(range(1, max(numbers) + 1)) - numbers)
+        if missing:
+            errors.append(f"missing checkpoint id(s) {', '.join(map(str, missing))}")
+    return errors
+
+
+def check_reachability(tracks):
+    """
+    Events no run of the campaign can get to:
+    - every event of a track that no reachable track starts
+    - events after a wait on a condition nothing signals
+    - events after a track stops itself
+    Also flags "track" actions naming tracks that don't exist.
+    """
+    errors = []
+    signalled = set(BUILT_IN_CONDITIONS)
+    for events in tracks.values():
+        for event in events:
+            for action in iter_actions(event.get("action")):
+                if isinstance(action.get("signal"), dict):
+                    signalled.add(action["signal"].get("condition"))
+
+    reachable = {"events"}
+    pending = ["events"]
+    while pending:
+        track_name = pending.pop()
+        for index, event in enumerate(tracks[track_name]):
+            where = f"{track_name}[{index}]"
+            dead_end = None
+            for action in iter_actions(event.get("action")):
+                started = action.get("track")
+                if isinstance(started, dict):
+                    name = started.get("name")
+                    if name not in tracks or name == "events":
+                        errors.append(f"{where}: unknown track {name!r}")
+                    elif name not in reachable:
+                        reachable.add(name)
+                        pending.append(name)
+                wait = action.get("wait")
+                if isinstance(wait, dict) and wait.get("condition") not in signalled:
+                    dead_end = f"waits on {wait.get('condition')!r}, which is never signalled"
+                stop = action.get("stop")
+                if isinstance(stop, dict) and stop.get("id") == (MAIN_TRACK if track_name == "events" else track_name):
+                    dead_end = "stops its own track"
+            if dead_end is not None and index + 1 < len(tracks[track_name]):
+                errors.append(f"{where} {dead_end}: the {len(tracks[track_name]) - index - 1} event(s) after it never run")
+                break
+
+    for track_name in tracks:
+        if track_name not in reachable and tracks[track_name]:
+            errors.append(f"tracks.{track_name}: never started, its {len(tracks[track_name])} event(s) never run")
+    return errors
+
+
+def validate_campaign(data, schema):
+    """Every problem with a parsed campaign, as a list of messages (empty when it is fine)."""
+    errors = check_schema(data, schema, schema)
+    if not isinstance(data, dict) or not isinstance(data.get("events"), list):
+        return errors  # No event list to look into
+
+    # The other checks skip anything the schema check already rejected as the wrong shape
+    tracks = {"events": data["events"]}
+    if isinstance(data.get("tracks"), dict):
+        tracks.update((name, events) for name, events in data["tracks"].items() if isinstance(events, list))
+    tracks = {name: [event for event in events if isinstance(event, dict)] for name, events in tracks.items()}
+    return errors + check_enemy_types(tracks) + check_checkpoints(tracks) + check_reachability(tracks)
+
+
+# =============================================
+# Cached verdicts
+# =============================================
+def campaign_hash(file_name):
+    digest = hashlib.sha1(f"validator v{VALIDATOR_VERSION}\n".encode("utf-8"))
+    for name in (file_name, SCHEMA_FILE):
+        with open(Loader.resource_path(name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def check_campaign(file_name="campaign/game_event.json"):
+    """
+    Validate a campaign file unless an earlier run already passed the same
+    contents. Returns the list of errors (empty = valid).
+    """
+    content_hash = campaign_hash(file_name)
+    verdict_path = os.path.join(Loader.resource_path(settings.campaign_cache_dir), f"verdict_{content_hash}.json")
+    if os.path.exists(verdict_path):
+        try:
+            with open(verdict_path, "r", encoding="utf-8") as f:
+                return json.load(f)["errors"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable verdict {verdict_path}: {e}")
+
+    try:
+        errors = validate_campaign(Loader.load_json(file_name), Loader.load_json(SCHEMA_FILE))
+    except json.JSONDecodeError as e:
+        errors = [f"not valid JSON: {e}"]
+
+    try:
+        os.makedirs(os.path.dirname(verdict_path), exist_ok=True)
+        with open(verdict_path, "w", encoding="utf-8") as f:
+            json.dump({"file": file_name, "ok": not errors, "errors": errors}, f, indent=4)
+    except OSError as e:
+        print(f"Could not write verdict {verdict_path}: {e}")
+    return errors
+
+
+def main():
+    file_name = sys.argv[1] if len(sys.argv) > 1 else "campaign/game_event.json"
+    errors = check_campaign(file_name)
+    if errors:
+        print(CampaignError(file_name, errors))
+        sys.exit(1)
+    print(f"{file_name} is valid")
+
+
+if __name__ == "__main__":
+    main()
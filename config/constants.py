@@ -20,4 +20,7 @@ BULLET_HEIGHT = 3
 BULLET_SPEED = 10
 
 # Enemy settings
-ENEMY_SPEED = 2
\ No newline at end of file
+ENEMY_SPEED = 2
+
+# Collision settings
+COLLISION_CELL_SIZE = 100  # Spatial hash cell size, about the size of the largest meteor/ship sprite
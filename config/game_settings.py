@@ -2,3 +2,112 @@
 # random time between meteor spawn
 meteor_spawn_interval = (2000, 3000)
 
+# Bullet upgrades (0 / False keeps the basic gun behaviour; --splash / --pierce turn them on)
+bullet_splash_radius = 0      # Enemies within this radius of a hit lose a letter too
+bullet_pierce = False         # Non-target enemies a bullet flies through lose a letter, once per bullet
+
+# Radius of the per-tick grid query that wakes proximity mines and cluster bombs
+proximity_query_radius = 300
+
+# Object pool high-water marks: idle objects kept for reuse beyond this are left to the GC
+pool_high_water = {
+    "Bullet": 64,
+    "Particle": 400,      # 20 particles per hit
+    "Shockwave": 16,
+    "PlusXEffect": 16,
+    "EnemyShell": 64,
+}
+
+# Input recording: when True every game session is saved as a replay file in replay_dir
+record_replay = False
+replay_dir = "replays"
+
+# Hit-stop on kills: the simulation runs at hit_stop_time_scale (0 = frozen) for this many ms
+hit_stop_duration = 50
+hit_stop_time_scale = 0.0
+
+# View culling: skip draw calls whose bounds miss the screen (F7 shows the per-frame counters)
+view_culling = True
+cull_offscreen_trails = True   # Also stop trail bookkeeping while an enemy is off-screen
+
+# Fast-forward (campaign testing): F10 cycles through the speeds, Shift+F10 drops back to 1x
+fast_forward = 1                        # Simulation frames per displayed frame when the game starts
+fast_forward_speeds = (1, 4, 16, 64, 256)
+fast_forward_render_every = 4           # Draw every k-th displayed frame while fast-forwarding (0 = don't draw, F8 toggles)
+fast_forward_until = None               # Drop back to 1x when this checkpoint id ("8") or enemy type ("enemy_battleship") comes up
+fast_forward_autoplay = True            # Let the headless bot type during fast-forward so bosses go down and the campaign keeps moving
+
+# Compiled campaign timelines are cached here, keyed by the hash of the campaign file
+campaign_cache_dir = ".cache"
+
+# Check the campaign file (schema, enemy types, checkpoint ids, unreachable events) when it is first loaded
+validate_campaign = True
+
+# Campaign played by Game: game_event.json, or a .jsonl file streamed a few events at a time
+campaign_file = "campaign/game_event.json"
+campaign_lookahead = 64       # Events a .jsonl campaign keeps in memory ahead of the one playing
+
+# Endless mode (main.py/headless.py --endless): generated waves instead of a campaign file, see campaign/endless.py
+endless_mode = False
+endless_enemy_costs = {       # Difficulty points per spawn
+    "enemy_meteor": 1,
+    "enemy_proximity_mine": 2,
+    "enemy_cluster_bomb": 3,
+    "enemy_suicide_drone": 3,
+    "enemy_gunship": 15,      # Boss waves only
+}
+endless_wave_budget = (8, 3)          # Points for wave 1, and how many more each later wave gets
+endless_boss_every = 5                # Every n-th wave ends with a gunship
+endless_shower_every = 3              # Meteor shower during every n-th wave
+endless_spawn_spacing = (3000, 800)   # ms between spawns in wave 1, and the shortest it gets
+endless_spacing_step = 150            # ms less between spawns with every wave
+endless_wave_break = 6000             # ms between waves
+endless_idle_step = 500               # ms between checks while the screen is full
+
+# Frame-cost model for endless mode: estimated load per live enemy (by class, children included)
+# and the most the generator lets on screen at once
+endless_frame_costs = {
+    "EnemyMeteor": 1.0,
+    "EnemyProximityMines": 1.0,
+    "EnemyClusterBomb": 1.5,
+    "EnemySuicideDrone": 1.5,
+    "EnemyShell": 0.5,
+    "EnemyGunship": 6.0,
+    "EnemyBattleship": 8.0,
+}
+endless_max_frame_load = 40
+endless_frame_budget_ms = 12          # Windowed only: no new spawns while a frame's update takes longer than this
+
+# Checkpoint journal: compact once it holds this many records (and at least twice as many as checkpoints)
+checkpoint_compact_after = 64
+
+# Write-behind saves (core/persistence.py): checkpoints and screenshots are written on a background thread
+write_behind = True               # False writes inline on the game thread
+write_behind_interval = 500       # ms the thread holds writes so repeated saves of the same key coalesce
+write_behind_max_pending = 64     # Queued keys before a new save waits for the thread to catch up
+
+# World snapshots (core/snapshot.py): the whole simulation, taken every snapshot_interval ms of game time
+snapshot_interval = 5000                        # 0 = no automatic snapshots
+snapshot_history = 12                           # Snapshots kept in memory for rewinding
+practice_mode = False                           # F5 takes a snapshot, F6 rewinds to the last one (again: further back)
+snapshot_autosave_file = "saves/autosave.tss"   # The latest snapshot is also written here in the background (None = don't)
+
+# Frame profiler (core/profiler.py): per-phase timings of the game loop, F3 shows them on screen
+profiler_enabled = False          # Time every frame from the start (F3 turns it on while the overlay is shown)
+profiler_window = 600             # Frames the rolling mean/p95/p99 are taken over
+profiler_overlay_refresh = 500    # ms between overlay updates
+trace_max_frames = 1800           # F4 trace captures stop by themselves after this many frames
+trace_dir = "traces"              # Where trace_<date>.json files go (open them in ui.perfetto.dev or chrome://tracing)
+
+# Allocation tracker (core/alloc_tracker.py): new Surfaces per frame by caller, F2 shows them on screen
+alloc_tracking = False                        # Opt-in: wraps pygame.Surface, Font.render, transform.*, image.load
+alloc_tracemalloc = False                     # Also trace the Python heap (churn per frame; slow)
+alloc_tracemalloc_every = 300                 # Frames between the "which files grew" tracemalloc comparisons
+alloc_log_file = "logs/allocations.jsonl"     # One JSON line per frame (None = no log)
+alloc_log_every = 60                          # Frames of log lines handed to the background writer at once
+alloc_overlay_rows = 10                       # Callers listed on the overlay
+
+# Startup tracer (core/startup_tracer.py): time to window / first frame / interactive menu, by import, asset and font
+startup_report = False            # Print the breakdown once the start menu is interactive (--startup-report)
+startup_report_file = None        # Also write the trace as JSON here (--startup-json)
+exit_after_startup = False        # Quit as soon as the menu is interactive, for benchmarks/startup_benchmark.py
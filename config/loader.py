@@ -1,9 +1,35 @@
 import os
 import sys
+import weakref
 import pygame
 import json
 
+from core.startup_tracer import startup
+
+
+class NullSound:
+    """
+    Silent stand-in for pygame Sound and Channel objects.
+    Returned when the mixer is not running (headless mode or no audio device).
+    """
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, *args):
+        pass
+
+    def get_busy(self):
+        return False
+
+
 class Loader:
+    # Where every loaded image/font came from, e.g. ("image", "assets/...png", True), so world
+    # snapshots (core/snapshot.py) can store a reference instead of the pixels
+    asset_sources = weakref.WeakKeyDictionary()
+
     @staticmethod
     def resource_path(relative_path):
         """
@@ -26,18 +52,32 @@ class Loader:
         If convert_alpha is True, the image is converted for optimal display with per-pixel alpha.
         """
         path = Loader.resource_path(relative_path)
-        image = pygame.image.load(path)
-        if convert_alpha:
-            return image.convert_alpha()
-        return image.convert()
+        with startup.section("asset", relative_path):
+            image = pygame.image.load(path)
+            if pygame.display.get_surface() is not None:  # Headless: there is no display format to convert to
+                image = image.convert_alpha() if convert_alpha else image.convert()
+        Loader.asset_sources[image] = ("image", relative_path, convert_alpha)
+        return image
 
     @staticmethod
     def load_sound(relative_path):
         """
         Load a sound file from the specified relative path.
         """
+        if not pygame.mixer.get_init():
+            return NullSound()  # Headless: keep callers working without audio
         path = Loader.resource_path(relative_path)
-        return pygame.mixer.Sound(path)
+        with startup.section("asset", relative_path):
+            return pygame.mixer.Sound(path)
+
+    @staticmethod
+    def get_channel(index):
+        """
+        Return mixer channel `index`, or a silent stand-in when the mixer is not running.
+        """
+        if not pygame.mixer.get_init():
+            return NullSound()
+        return pygame.mixer.Channel(index)
 
     @staticmethod
     def load_music(relative_path):
@@ -46,7 +86,8 @@ class Loader:
         This sets up the music stream for playback.
         """
         path = Loader.resource_path(relative_path)
-        pygame.mixer.music.load(path)
+        with startup.section("asset", relative_path):
+            pygame.mixer.music.load(path)
 
     @staticmethod
     def load_json(relative_path):
@@ -54,13 +95,31 @@ class Loader:
         Load and parse a JSON file from the specified relative path.
         """
         path = Loader.resource_path(relative_path)
-        with open(path, "r", encoding="utf-8") as file:
+        with startup.section("asset", relative_path), open(path, "r", encoding="utf-8") as file:
             return json.load(file)
 
     @staticmethod
     def load_font(relative_path, size):
         """
-        Load a font from the specified relative path and size.
+        Load a font from the specified relative path and size (None = pygame's default font).
         """
-        path = Loader.resource_path(relative_path)
-        return pygame.font.Font(path, size)
+        path = Loader.resource_path(relative_path) if relative_path is not None else None
+        with startup.section("font", f"{relative_path or 'default'} {size}"):
+            font = pygame.font.Font(path, size)
+        Loader.asset_sources[font] = ("font", relative_path, size)
+        return font
+
+    @staticmethod
+    def load_asset(source):
+        """
+        Load an image/font again from its entry in asset_sources.
+        """
+        kind = source[0]
+        if kind == "image":
+            return Loader.load_image(source[1], source[2])
+        if kind == "font":
+            return Loader.load_font(source[1], source[2])
+        if kind == "scaled_image":
+            from config.utils import loader_scale_image
+            return loader_scale_image(source[1], source[2])
+        raise ValueError(f"Unknown asset source {source!r}")
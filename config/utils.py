@@ -1,20 +1,21 @@
-import random
 import string
 
 import pygame
 import sys, os
 
 from config.loader import Loader
+from core import rng
 
 
 def loader_scale_image(image_path, target_height):
-    # Use the resource_path helper to get the correct path.
-    image_path = Loader.resource_path(image_path)
-    image = pygame.image.load(image_path).convert_alpha()
+    # Loader resolves the path and skips the display conversion when running headless.
+    image = Loader.load_image(image_path)
     original_width, original_height = image.get_size()
     aspect_ratio = original_width / original_height
     new_width = int(target_height * aspect_ratio)
-    return pygame.transform.smoothscale(image, (new_width, target_height))
+    scaled = pygame.transform.smoothscale(image, (new_width, target_height))
+    Loader.asset_sources[scaled] = ("scaled_image", image_path, target_height)
+    return scaled
 
 
 def color(hex_color: str):
@@ -67,10 +68,10 @@ def draw_transparent_circle_with_gradient(surface, color, center, radius, alpha=
     surface.blit(circle_surface, (center[0] - radius, center[1] - radius))
 
 def generate_random_word(min,max):
-    length = random.randint(min, max)  # Choose a random length between 5 and 20
-    word = ''.join(random.choices(string.ascii_lowercase, k=length))
+    length = rng.words.randint(min, max)  # Choose a random length between 5 and 20
+    word = ''.join(rng.words.choices(string.ascii_lowercase, k=length))
     return word
 
 def generate_random_letter():
     # Choose one random letter from the lowercase alphabet.
-    return random.choice(string.ascii_lowercase)
+    return rng.words.choice(string.ascii_lowercase)
@@ -0,0 +1,260 @@
+import json
+import os
+import sys
+import tracemalloc
+
+import pygame
+
+from config import game_settings as settings
+from config.loader import Loader
+from core.persistence import writer
+
+# pygame.transform functions that return a new Surface
+TRANSFORM_FUNCTIONS = (
+    "rotate", "rotozoom", "scale", "scale2x", "scale_by", "smoothscale", "smoothscale_by",
+    "flip", "chop", "laplacian", "grayscale",
+)
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# =============================================
+# Tracked pygame types (installed by AllocationTracker)
+# =============================================
+class TrackedSurface(pygame.SurfaceType):
+    """pygame.Surface while tracking is on: every construction is counted."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        alloc_tracker.record("Surface", self)
+
+
+class TrackedFont(pygame.font.FontType):
+    """pygame.font.Font while tracking is on: every render() is counted."""
+    def render(self, *args, **kwargs):
+        surface = super().render(*args, **kwargs)
+        alloc_tracker.record("font.render", surface)
+        return surface
+
+
+def tracked_function(kind, function):
+    def wrapper(*args, **kwargs):
+        surface = function(*args, **kwargs)
+        alloc_tracker.record(kind, surface)
+        return surface
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    wrapper.original = function
+    return wrapper
+
+
+# =============================================
+# AllocationTracker Class (Surface allocations per frame and caller)
+# =============================================
+class AllocationTracker:
+    """
+    Opt-in (settings.alloc_tracking, --track-allocations): counts the new
+    Surfaces the game makes every frame, by what made them and where.
+
+    install() swaps pygame.Surface and pygame.font.Font for subclasses that
+    report each construction / render(), and wraps pygame.image.load and
+    the pygame.transform functions listed in TRANSFORM_FUNCTIONS. Every new
+    Surface is booked as calls and pixel bytes under (kind, caller), the
+    caller being "<module>:<function>" of the code that asked for it, e.g.
+    ("Surface", "effects.shockwave:draw"). Fonts created before install()
+    are not tracked, so install it before the game starts.
+
+    With settings.alloc_tracemalloc the Python heap is traced as well: the
+    churn of a frame (peak above its starting size) and its net growth, plus
+    every alloc_tracemalloc_every frames the files whose memory grew most.
+
+    Per-frame figures go to settings.alloc_log_file (JSON Lines, written by
+    the background writer in batches); F2 shows the biggest callers of the
+    last second on screen.
+    """
+    def __init__(self):
+        self.installed = False
+        self.originals = {}
+        self.frame = {}             # (kind, caller) -> [calls, bytes] this frame
+        self.frames = 0
+        self.python_before = 0
+        self.python_churn = 0       # Bytes allocated and freed within the last frame (tracemalloc mode)
+        self.python_net = 0
+        self.python_snapshot = None
+
+        # Log file, written in batches of settings.alloc_log_every frames
+        self.log_path = None
+        self.log_lines = []
+        self.log_batches = 0
+
+        # Overlay: averages over the frames since the last refresh
+        self.show_overlay = False
+        self.window = {}
+        self.window_frames = 0
+        self.window_python_churn = 0
+        self.font = None
+        self.overlay_lines = []
+        self.next_overlay_refresh = 0
+
+    # ---------- Installing ----------
+    def install(self):
+        if self.installed:
+            return
+        self.originals = {
+            (pygame, "Surface"): pygame.Surface,
+            (pygame.font, "Font"): pygame.font.Font,
+            (pygame.image, "load"): pygame.image.load,
+        }
+        for name in TRANSFORM_FUNCTIONS:
+            self.originals[(pygame.transform, name)] = getattr(pygame.transform, name)
+
+        pygame.Surface = TrackedSurface
+        pygame.font.Font = TrackedFont
+        pygame.image.load = tracked_function("image.load", pygame.image.load)
+        for name in TRANSFORM_FUNCTIONS:
+            setattr(pygame.transform, name, tracked_function(f"transform.{name}", getattr(pygame.transform, name)))
+
+        if settings.alloc_tracemalloc:
+            tracemalloc.start()
+            self.python_snapshot = tracemalloc.take_snapshot()
+        if settings.alloc_log_file:
+            self.log_path = Loader.resource_path(settings.alloc_log_file)
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            writer.submit(("alloc_log", self.log_path, 0), write_log_lines, self.log_path, [], "w")
+        self.installed = True
+        print("Allocation tracking on" + (" (with tracemalloc)" if settings.alloc_tracemalloc else ""))
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        for (module, name), original in self.originals.items():
+            setattr(module, name, original)
+        self.originals = {}
+        if tracemalloc.is_tracing() and settings.alloc_tracemalloc:
+            tracemalloc.stop()
+        self.flush_log()
+        self.installed = False
+        self.show_overlay = False
+
+    # ---------- Counting ----------
+    def record(self, kind, surface):
+        # Called from the wrappers: two frames up is the code that asked for the Surface
+        caller = sys._getframe(2)
+        key = (kind, f"{caller.f_globals.get('__name__', '?')}:{caller.f_code.co_name}")
+        entry = self.frame.get(key)
+        if entry is None:
+            entry = self.frame[key] = [0, 0]
+        entry[0] += 1
+        entry[1] += surface_bytes(surface)
+
+    def begin_frame(self):
+        if self.installed and settings.alloc_tracemalloc:
+            tracemalloc.reset_peak()
+            self.python_before = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self):
+        if not self.installed:
+            return
+        self.frames += 1
+        record = {
+            "frame": self.frames,
+            "calls": sum(entry[0] for entry in self.frame.values()),
+            "bytes": sum(entry[1] for entry in self.frame.values()),
+            "sites": {f"{kind} {caller}": entry for (kind, caller), entry in self.frame.items()},
+        }
+        if settings.alloc_tracemalloc:
+            current, peak = tracemalloc.get_traced_memory()
+            self.python_churn = peak - self.python_before
+            self.python_net = current - self.python_before
+            record["python_churn"] = self.python_churn
+            record["python_net"] = self.python_net
+            self.window_python_churn += self.python_churn
+            if self.frames % settings.alloc_tracemalloc_every == 0:
+                record["python_growth"] = self.python_growth()
+
+        for key, (calls, size) in self.frame.items():
+            total = self.window.get(key)
+            if total is None:
+                total = self.window[key] = [0, 0]
+            total[0] += calls
+            total[1] += size
+        self.window_frames += 1
+        self.frame = {}
+
+        if self.log_path:
+            self.log_lines.append(json.dumps(record, separators=(",", ":")))
+            if len(self.log_lines) >= settings.alloc_log_every:
+                self.flush_log()
+
+    def python_growth(self, top=5):
+        # Files whose traced memory grew most since the last look (net, so this finds leaks, not churn)
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self.python_snapshot, "filename")
+        self.python_snapshot = snapshot
+        root = os.path.dirname(Loader.resource_path(""))
+        return {os.path.relpath(stat.traceback[0].filename, root): stat.size_diff
+                for stat in stats[:top] if stat.size_diff > 0}
+
+    def flush_log(self):
+        if self.log_path and self.log_lines:
+            self.log_batches += 1
+            writer.submit(("alloc_log", self.log_path, self.log_batches), write_log_lines,
+                          self.log_path, self.log_lines, "a")
+            self.log_lines = []
+
+    def totals(self):
+        """{(kind, caller): [calls, bytes]} over the frames since the last overlay refresh, biggest first."""
+        return dict(sorted(self.window.items(), key=lambda item: item[1][1], reverse=True))
+
+    # ---------- Overlay ----------
+    def toggle_overlay(self):
+        if not self.installed:
+            print("Allocation tracking is off (settings.alloc_tracking, or start with --track-allocations)")
+            return
+        self.show_overlay = not self.show_overlay
+        self.next_overlay_refresh = 0
+        self.window = {}
+        self.window_frames = 0
+        self.window_python_churn = 0
+
+    def draw_overlay(self, screen):
+        if not self.show_overlay:
+            return
+        now = pygame.time.get_ticks()
+        if now >= self.next_overlay_refresh and self.window_frames:
+            self.next_overlay_refresh = now + settings.profiler_overlay_refresh
+            if self.font is None:
+                # The unpatched type, so the overlay's own text isn't counted
+                self.font = pygame.font.FontType(pygame.font.match_font("consolas, couriernew, monospace"), 14)
+            frames = self.window_frames
+            lines = [f"{'allocations per frame':<44} {'calls':>6} {'KB':>8}"]
+            for (kind, caller), (calls, size) in list(self.totals().items())[:settings.alloc_overlay_rows]:
+                lines.append(f"{(kind + ' ' + caller)[:44]:<44} {calls / frames:>6.1f} {size / frames / 1024:>8.1f}")
+            if settings.alloc_tracemalloc:
+                lines.append(f"{'python churn':<44} {'':>6} {self.window_python_churn / frames / 1024:>8.1f}")
+            self.overlay_lines = [self.font.render(line, True, (0, 255, 255)) for line in lines]
+            self.window = {}
+            self.window_frames = 0
+            self.window_python_churn = 0
+
+        if not self.overlay_lines:
+            return
+        line_height = self.overlay_lines[0].get_height()
+        width = max(line.get_width() for line in self.overlay_lines) + 12
+        height = line_height * len(self.overlay_lines) + 8
+        left = screen.get_width() - width - 6
+        top = 160  # Under the ammo/health display
+        screen.fill((0, 0, 0), (left, top, width, height))
+        for i, line in enumerate(self.overlay_lines):
+            screen.blit(line, (left + 6, top + 4 + i * line_height))
+
+
+def write_log_lines(path, lines, mode):
+    with open(path, mode, encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+
+
+# Shared by the game loop and the tracked pygame types
+alloc_tracker = AllocationTracker()
@@ -0,0 +1,37 @@
+import pygame
+
+from core import game_clock
+
+
+# =============================================
+# AutoTyper Class (stand-in for the player's keyboard)
+# =============================================
+class AutoTyper:
+    """
+    A simple bot for headless runs and fast-forward: it presses the first
+    letter of the oldest enemy that still has a word, at most
+    `keys_per_second` keys per second of game time.
+    """
+    def __init__(self, keys_per_second=8):
+        self.key_interval = 1000 / keys_per_second
+        self.next_key_time = 0
+
+    def inputs(self, game):
+        """Return this frame's key events: one letter for the oldest enemy, or nothing."""
+        now = game_clock.get_ticks()
+        if now < self.next_key_time:
+            return []
+
+        target = None
+        for enemy in game.enemy_list:
+            if enemy.word and (target is None or enemy.handle < target.handle):
+                target = enemy
+        if target is None:
+            return []
+
+        self.next_key_time = now + self.key_interval
+        letter = target.word[0].lower()
+        return [
+            pygame.event.Event(pygame.KEYDOWN, key=ord(letter), unicode=letter),
+            pygame.event.Event(pygame.KEYUP, key=ord(letter), unicode=letter),
+        ]
@@ -0,0 +1,48 @@
+import pygame
+
+from config import constants, game_settings as settings
+
+
+# =============================================
+# ViewCuller Class (skip draw calls that would land off-screen)
+# =============================================
+class ViewCuller:
+    """
+    Tests draw bounds against the screen rect and counts, per category
+    ("enemies", "clouds", "trails"...), how many draws were made or skipped.
+
+    Counters cover one frame: begin_frame() moves the running counts to
+    `last_drawn` / `last_culled` and starts again from zero.
+    """
+    def __init__(self):
+        self.view = pygame.Rect(0, 0, constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)
+        self.drawn = {}
+        self.culled = {}
+        self.last_drawn = {}
+        self.last_culled = {}
+
+    def begin_frame(self):
+        self.view.size = (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)  # main.py resizes the screen at startup
+        self.last_drawn, self.drawn = self.drawn, {}
+        self.last_culled, self.culled = self.culled, {}
+
+    def is_visible(self, rect, category):
+        """True when `rect` touches the screen. With view_culling off everything counts as visible."""
+        if not settings.view_culling or self.view.colliderect(rect):
+            self.drawn[category] = self.drawn.get(category, 0) + 1
+            return True
+        self.culled[category] = self.culled.get(category, 0) + 1
+        return False
+
+    def report(self):
+        """One line with last frame's counts, e.g. 'enemies 3/12 culled  clouds 9/11 culled'."""
+        parts = []
+        for category in sorted(set(self.last_drawn) | set(self.last_culled)):
+            culled = self.last_culled.get(category, 0)
+            total = culled + self.last_drawn.get(category, 0)
+            parts.append(f"{category} {culled}/{total} culled")
+        return "  ".join(parts)
+
+
+# Shared by everything that draws during a game frame
+view_culler = ViewCuller()
@@ -0,0 +1,108 @@
+# =============================================
+# EntityStore Class (dense array with stable handles)
+# =============================================
+class EntityStore:
+    """
+    Holds live game entities in a dense list.
+
+    - Every entity gets a stable integer `handle` when it is added.
+    - `kill()` only flips the entity's `alive` flag, so membership tests and
+      removals are O(1) and it is always safe to kill while iterating.
+    - `spawn()` queues an entity that is added at the next `compact()`, so
+      enemies can create children (shells, drones) mid-iteration.
+    - `compact()` runs once per tick: dead entities are swap-removed with the
+      last element (O(1) each), pooled ones go back to their ObjectPool, and
+      queued spawns are added.
+    - Functions in `kill_listeners` are called with every killed entity, so
+      game code can react to a death without scanning the store each tick.
+
+    Because of the swap-remove, the iteration order is not the spawn order.
+    Use the handle when the oldest entity is needed.
+    """
+    def __init__(self):
+        self.entities = []     # Dense list of entities (dead ones stay until compact())
+        self.by_handle = {}    # handle -> entity
+        self.pending = []      # Deferred spawns, added on the next compact()
+        self.dead = []         # Entities killed since the last compact()
+        self.next_handle = 1
+        self.live_count = 0
+        self.kill_listeners = []  # f(entity), called once per kill
+
+    def add(self, entity):
+        """Add an entity immediately. Do not call while iterating the store."""
+        entity.handle = self.next_handle
+        self.next_handle += 1
+        entity.alive = True
+        entity.store_index = len(self.entities)
+        self.entities.append(entity)
+        self.by_handle[entity.handle] = entity
+        self.live_count += 1
+        return entity.handle
+
+    def spawn(self, entity):
+        """Queue an entity to be added on the next compact() (safe mid-iteration)."""
+        self.pending.append(entity)
+
+    def kill(self, entity):
+        """Mark an entity as dead. It is skipped by iteration and removed on compact()."""
+        if not entity.alive or self.by_handle.get(entity.handle) is not entity:
+            return
+        entity.alive = False
+        self.dead.append(entity)
+        self.live_count -= 1
+        for listener in self.kill_listeners:
+            listener(entity)
+
+    def compact(self):
+        """Swap-remove dead entities and add queued spawns."""
+        entities = self.entities
+        for entity in self.dead:
+            index = entity.store_index
+            last = entities.pop()
+            if last is not entity:
+                entities[index] = last
+                last.store_index = index
+            entity.store_index = -1
+            del self.by_handle[entity.handle]
+            if entity.pool is not None:
+                entity.pool.release(entity)
+        self.dead.clear()
+
+        if self.pending:
+            pending = self.pending
+            self.pending = []
+            for entity in pending:
+                self.add(entity)
+
+    def clear(self):
+        for entity in self.entities + self.pending:
+            entity.alive = False
+            entity.store_index = -1
+            if entity.pool is not None:
+                entity.pool.release(entity)
+        self.entities.clear()
+        self.by_handle.clear()
+        self.pending.clear()
+        self.dead.clear()
+        self.live_count = 0
+
+    def get(self, handle):
+        """Return the live entity for a handle, or None."""
+        entity = self.by_handle.get(handle)
+        if entity is not None and entity.alive:
+            return entity
+        return None
+
+    def __contains__(self, entity):
+        return entity.alive and self.by_handle.get(entity.handle) is entity
+
+    def __iter__(self):
+        # Iterate by index so entities killed mid-loop are skipped without copying the list
+        entities = self.entities
+        for i in range(len(entities)):
+            entity = entities[i]
+            if entity.alive:
+                yield entity
+
+    def __len__(self):
+        return self.live_count
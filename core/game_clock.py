@@ -0,0 +1,81 @@
+import pygame
+
+
+# =============================================
+# Clocks (where gameplay code gets its milliseconds from)
+# =============================================
+class RealClock:
+    """Wall-clock time straight from pygame (menus)."""
+
+    def start_frame(self, dt):
+        pass
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class FrameClock:
+    """
+    Wall-clock time sampled once per frame (the windowed game).
+
+    Everything during a frame sees the same time, so a recorded session can
+    be replayed with the exact same ticks.
+
+    advance() runs the clock ahead of wall time (extra fast-forward frames);
+    the lead is kept, so time never goes backwards.
+    """
+    __slots__ = ("ticks", "offset")
+
+    def __init__(self):
+        self.offset = 0
+        self.ticks = pygame.time.get_ticks()
+
+    def advance(self, dt):
+        self.offset += dt
+        self.ticks += dt
+
+    def start_frame(self, dt):
+        self.ticks = pygame.time.get_ticks() + self.offset
+
+    def get_ticks(self):
+        return self.ticks
+
+
+class ManualClock:
+    """
+    Simulated time that only moves when `advance()` is called.
+
+    Used by headless runs and replays so the game can run faster than real
+    time and produce the same timings on every machine.
+    """
+    __slots__ = ("ticks",)
+
+    def __init__(self, start=0):
+        self.ticks = start
+
+    def advance(self, dt):
+        self.ticks += dt
+
+    def start_frame(self, dt):
+        self.advance(dt)
+
+    def get_ticks(self):
+        return int(self.ticks)
+
+
+# Gameplay code calls game_clock.get_ticks() instead of pygame.time.get_ticks()
+_clock = RealClock()
+
+
+def get_ticks():
+    return _clock.get_ticks()
+
+
+def set_clock(clock):
+    """Install the clock used by get_ticks() (Game does this on startup)."""
+    global _clock
+    _clock = clock
+
+
+def get_clock():
+    return _clock
@@ -0,0 +1,53 @@
+from core import game_clock
+
+
+# =============================================
+# HitStop Class (kill feedback without blocking the main loop)
+# =============================================
+class HitStop:
+    """
+    Freezes (time_scale 0) or slows down the simulation for a short time
+    after a kill. The main loop keeps running: input is still handled and
+    every frame is still drawn, only the simulation steps are skipped.
+
+    With a time_scale of e.g. 0.25 the simulation advances on one frame in
+    four while the hit-stop lasts (movement in this game is per frame).
+    Timers that run on game time (the campaign clock, and with it the meteor
+    shower) take their elapsed time through scaled_elapsed() instead.
+    """
+    __slots__ = ("end_time", "time_scale", "accumulator")
+
+    def __init__(self):
+        self.end_time = 0
+        self.time_scale = 1.0
+        self.accumulator = 0.0
+
+    def trigger(self, duration, time_scale=0.0):
+        """Start (or extend) a hit-stop of `duration` ms. Overlapping kills don't stack the duration."""
+        now = game_clock.get_ticks()
+        if now >= self.end_time:
+            self.time_scale = time_scale
+            self.accumulator = 0.0
+        else:
+            self.time_scale = min(self.time_scale, time_scale)
+        self.end_time = max(self.end_time, now + duration)
+
+    def is_active(self):
+        return game_clock.get_ticks() < self.end_time
+
+    def scaled_elapsed(self, start, end):
+        """Simulation ms between two game_clock readings: the part before end_time runs at time_scale."""
+        slowed = max(0, min(end, self.end_time) - start)
+        return end - start - slowed + slowed * self.time_scale
+
+    def should_step(self):
+        """Call once per frame: True when the simulation should advance this frame."""
+        if not self.is_active():
+            self.time_scale = 1.0
+            self.accumulator = 0.0
+            return True
+        self.accumulator += self.time_scale
+        if self.accumulator >= 1.0:
+            self.accumulator -= 1.0
+            return True
+        return False
@@ -0,0 +1,178 @@
+import json
+import os
+import zlib
+
+
+# =============================================
+# Journal Class (append-only key/value log on disk)
+# =============================================
+class Journal:
+    """
+    A small key/value store kept as an append-only log, one record per line:
+
+        <crc32 of the JSON, 8 hex digits> {"op": "put", "key": ..., "value": ...}
+        <crc32> {"op": "del", "key": ...}
+
+    - put()/delete() append one line and fsync it, so a save costs the same
+      however big the file is, and a record is either fully on disk or not.
+    - Loading replays the log into `index` (key -> value). A line with a bad
+      checksum is skipped; a torn last line (crash mid-write) is cut off so
+      new records don't get appended to the garbage. Earlier records are
+      never rewritten in place, so a crash can't damage them.
+    - Once the log holds more than `compact_after` records and at least
+      twice as many as there are live keys, it is compacted: the live
+      records go to a temp file (fsync'd) that atomically replaces the log.
+    - Other Journal objects (or processes) may append to the same file:
+      refresh() reads just the bytes added since the last look, or reloads
+      everything after another writer compacted or rewrote the file. When
+      the file's size and mtime are unchanged it costs one stat().
+    """
+    def __init__(self, path, compact_after=64):
+        self.path = path
+        self.compact_after = compact_after
+        self.index = {}
+        self.record_count = 0   # Records in the file (live or superseded)
+        self.read_offset = 0    # Bytes of the file already replayed into the index
+        self.file_id = None     # (device, inode) of the file the index was built from
+        self.mtime_ns = None    # Modification time of the file as of the last read or write
+        self.refresh()
+
+    # ---------- Reading ----------
+    def refresh(self):
+        """Bring the index up to date with the file."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.index.clear()
+            self.record_count = self.read_offset = 0
+            self.file_id = self.mtime_ns = None
+            return
+
+        file_id = (stat.st_dev, stat.st_ino)
+        rewritten = stat.st_size == self.read_offset and stat.st_mtime_ns != self.mtime_ns
+        if file_id != self.file_id or stat.st_size < self.read_offset or rewritten:
+            # New file (first load, or compacted/rewritten by someone else): replay from the start
+            self.index.clear()
+            self.record_count = self.read_offset = 0
+            self.file_id = file_id
+        self.mtime_ns = stat.st_mtime_ns
+        if stat.st_size > self.read_offset:
+            self.replay()
+
+    def replay(self):
+        with open(self.path, "rb") as f:
+            f.seek(self.read_offset)
+            data = f.read()
+
+        offset = self.read_offset
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                # Torn write at the end of the file: drop it so the next append starts on a clean line
+                print(f"Journal {self.path}: discarding an incomplete last record ({len(line)} bytes)")
+                self.truncate(offset)
+                break
+            offset += len(line)
+            record = self.decode(line)
+            if record is None:
+                print(f"Journal {self.path}: skipping a damaged record at byte {offset - len(line)}")
+                continue
+            self.apply(record)
+        self.read_offset = offset
+
+    @staticmethod
+    def decode(line):
+        checksum, _, payload = line.rstrip(b"\n").partition(b" ")
+        try:
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def apply(self, record):
+        self.record_count += 1
+        if record.get("op") == "put":
+            self.index[record["key"]] = record["value"]
+        elif record.get("op") == "del":
+            self.index.pop(record["key"], None)
+
+    def truncate(self, size):
+        with open(self.path, "r+b") as f:
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+            self.mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+
+    def get(self, key, default=None):
+        self.refresh()
+        return self.index.get(key, default)
+
+    def items(self):
+        self.refresh()
+        return list(self.index.items())
+
+    # ---------- Writing ----------
+    def put(self, key, value):
+        self.append({"op": "put", "key": key, "value": value})
+
+    def delete(self, key):
+        self.refresh()
+        if key in self.index:
+            self.append({"op": "del", "key": key})
+
+    def append(self, record):
+        self.refresh()
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        line = b"%08x %s\n" % (zlib.crc32(payload), payload)
+        with open(self.path, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+            end = f.tell()
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+
+        if self.file_id is not None and end - len(line) == self.read_offset:
+            self.read_offset = end
+            self.mtime_ns = mtime_ns
+            self.apply(record)
+        else:
+            self.refresh()  # New file, or another writer got in first: replay what we haven't seen (ours included)
+
+        if self.record_count > self.compact_after and self.record_count >= 2 * len(self.index):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the log with one record per live key, replacing the file atomically."""
+        self.refresh()
+        lines = []
+        for key, value in self.index.items():
+            payload = json.dumps({"op": "put", "key": key, "value": value}, separators=(",", ":")).encode("utf-8")
+            lines.append(b"%08x %s\n" % (zlib.crc32(payload), payload))
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        sync_directory(os.path.dirname(os.path.abspath(self.path)))
+
+        stat = os.stat(self.path)
+        self.file_id = (stat.st_dev, stat.st_ino)
+        self.mtime_ns = stat.st_mtime_ns
+        self.read_offset = stat.st_size
+        self.record_count = len(lines)
+
+
+def sync_directory(directory):
+    # Makes the rename itself durable on POSIX; Windows can't open directories and doesn't need it
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
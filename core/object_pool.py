@@ -0,0 +1,88 @@
+import weakref
+
+# Every pool registers itself here so report_pools() can list them all
+_pools = weakref.WeakSet()
+
+
+# =============================================
+# ObjectPool Class (recycles short-lived objects)
+# =============================================
+class ObjectPool:
+    """
+    Recycles short-lived objects (bullets, particles, shells...) instead of
+    allocating new ones.
+
+    Pooled classes follow a small protocol:
+    - the constructor and `reset(...)` take the same arguments,
+    - `reset(...)` puts a used object back into a freshly-constructed state,
+    - the pool stores itself on the object as `pool`, so whoever drops the
+      object can hand it back with `obj.pool.release(obj)`,
+    - an optional `on_release()` drops references an idle object should not
+      keep alive (a bullet's target, for instance).
+    """
+    def __init__(self, factory, high_water=64, name=None):
+        """
+        :param factory: Class (or callable) used when the pool is empty.
+        :param high_water: Maximum number of idle objects kept for reuse;
+                           anything released beyond this is left to the GC.
+        :param name: Label used in reports (defaults to the factory name).
+        """
+        self.factory = factory
+        self.high_water = high_water
+        self.name = name or getattr(factory, "__name__", "pool")
+        self.free = []
+
+        # Statistics
+        self.created = 0        # Objects built by the factory
+        self.reused = 0         # Allocations avoided
+        self.discarded = 0      # Releases dropped because the pool was full
+        self.in_use = 0
+        self.peak_in_use = 0
+
+        _pools.add(self)
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            obj.pool = self
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return obj
+
+    def release(self, obj):
+        self.in_use -= 1
+        on_release = getattr(obj, "on_release", None)
+        if on_release is not None:
+            on_release()
+        if len(self.free) < self.high_water:
+            self.free.append(obj)
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "idle": len(self.free),
+            "high_water": self.high_water,
+        }
+
+
+def report_pools():
+    """Print one line per live pool with the number of allocations avoided."""
+    for pool in sorted(_pools, key=lambda p: p.name):
+        s = pool.stats()
+        total = s["created"] + s["reused"]
+        ratio = (s["reused"] / total * 100) if total else 0
+        print(f"Pool {s['name']:<12} created {s['created']:>6}  reused {s['reused']:>7} ({ratio:5.1f}% avoided)  "
+              f"peak {s['peak_in_use']:>4}  idle {s['idle']:>4}/{s['high_water']}  discarded {s['discarded']}")
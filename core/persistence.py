@@ -0,0 +1,180 @@
+import atexit
+import json
+import os
+import threading
+import time
+
+import pygame
+
+from config import game_settings as settings
+
+
+# =============================================
+# PersistenceWorker Class (write-behind disk I/O)
+# =============================================
+class PersistenceWorker:
+    """
+    Runs disk writes on a background thread so the game thread never waits
+    on the disk.
+
+    - submit(key, write, *args) queues `write(*args)` and returns at once.
+      A write for a key that is still queued replaces the queued one (only
+      the latest checkpoint/settings/screenshot for a key is worth writing)
+      and moves to the back, so writes still land in the order they were
+      last asked for.
+    - The thread writes what is queued every `flush_interval` ms, or right
+      away once flush() is called (on pygame.QUIT and at exit).
+    - The queue holds at most `max_pending` keys; submitting a new key to a
+      full queue waits until the thread has made room.
+    - With settings.write_behind off every write runs inline on the caller.
+
+    stats()/report() give the queue depth (now and peak) and the flush
+    latency (how long each batch of writes took).
+    """
+    def __init__(self, max_pending=None, flush_interval=None):
+        self.max_pending = max_pending or settings.write_behind_max_pending
+        self.flush_interval = (flush_interval if flush_interval is not None else settings.write_behind_interval) / 1000
+        self.pending = {}                    # key -> (write, args), oldest first
+        self.condition = threading.Condition()
+        self.flush_requested = False
+        self.busy = False                    # A batch is being written
+        self.thread = None
+
+        # Metrics
+        self.submitted = 0
+        self.coalesced = 0
+        self.written = 0
+        self.failed = 0
+        self.peak_depth = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    # ---------- Game thread ----------
+    def submit(self, key, write, *args):
+        if not settings.write_behind:
+            self.run_write(key, write, args)
+            return
+        with self.condition:
+            self.start()
+            self.submitted += 1
+            if key in self.pending:
+                del self.pending[key]
+                self.coalesced += 1
+            else:
+                while len(self.pending) >= self.max_pending:
+                    self.flush_requested = True
+                    self.condition.notify_all()
+                    self.condition.wait()
+            self.pending[key] = (write, args)
+            self.peak_depth = max(self.peak_depth, len(self.pending))
+            self.condition.notify_all()
+
+    def save_json(self, path, data, **dump_options):
+        """Write `data` to `path` as JSON in the background (temp file + rename, so it is never half-written)."""
+        self.submit(("json", path), write_json_file, path, data, dump_options)
+
+    def save_bytes(self, path, data):
+        """Write `data` to `path` in the background (temp file + rename)."""
+        self.submit(("bytes", path), write_bytes_file, path, data)
+
+    def save_surface(self, surface, path):
+        """Save a copy of `surface` (e.g. the screen) as an image in the background."""
+        self.submit(("image", path), pygame.image.save, surface.copy(), path)
+
+    def flush(self, timeout=5.0):
+        """Write everything queued now and wait until it is on disk (or `timeout` seconds passed)."""
+        with self.condition:
+            if self.thread is None:
+                return True
+            self.flush_requested = True
+            self.condition.notify_all()
+            return self.condition.wait_for(lambda: not self.pending and not self.busy, timeout)
+
+    def depth(self):
+        return len(self.pending)
+
+    # ---------- Background thread ----------
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="persistence", daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending)
+                # Give repeated writes to the same key a chance to coalesce, unless someone is waiting
+                self.condition.wait_for(lambda: self.flush_requested, self.flush_interval)
+                batch = list(self.pending.items())
+                self.pending.clear()
+                self.flush_requested = False
+                self.busy = True
+                self.condition.notify_all()  # Room in the queue again
+
+            flush_start = time.perf_counter()
+            for key, (write, args) in batch:
+                self.run_write(key, write, args)
+            flush_ms = (time.perf_counter() - flush_start) * 1000
+
+            with self.condition:
+                self.busy = False
+                self.flushes += 1
+                self.last_flush_ms = flush_ms
+                self.max_flush_ms = max(self.max_flush_ms, flush_ms)
+                self.total_flush_ms += flush_ms
+                self.condition.notify_all()
+
+    def run_write(self, key, write, args):
+        try:
+            write(*args)
+            self.written += 1
+        except Exception as e:  # A failed save must not take the thread (and every later save) down with it
+            self.failed += 1
+            print(f"Background write {key} failed: {e}")
+
+    # ---------- Metrics ----------
+    def stats(self):
+        return {
+            "depth": len(self.pending),
+            "peak_depth": self.peak_depth,
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "written": self.written,
+            "failed": self.failed,
+            "flushes": self.flushes,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+            "mean_flush_ms": self.total_flush_ms / self.flushes if self.flushes else 0.0,
+        }
+
+    def report(self):
+        """One line of metrics, e.g. for the F9 report."""
+        s = self.stats()
+        return (f"Writes queued {s['depth']} (peak {s['peak_depth']})  submitted {s['submitted']}  "
+                f"coalesced {s['coalesced']}  written {s['written']}  failed {s['failed']}  "
+                f"flush {s['last_flush_ms']:.1f} ms (mean {s['mean_flush_ms']:.1f}, max {s['max_flush_ms']:.1f})")
+
+
+def write_bytes_file(path, data):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def write_json_file(path, data, dump_options):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_options)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+# Shared by everything that saves to disk while the game runs
+writer = PersistenceWorker()
+atexit.register(writer.flush)  # Daemon thread: don't lose queued saves when the program ends
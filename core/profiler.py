@@ -0,0 +1,288 @@
+import datetime
+import os
+import time
+
+import pygame
+
+from config import game_settings as settings
+from config.loader import Loader
+from core.persistence import writer, write_json_file
+from core.ring_buffer import RingBuffer
+
+
+# =============================================
+# Phase Class (one timed part of the game loop)
+# =============================================
+class Phase:
+    """
+    Context manager timing one part of the frame. A phase may run several
+    times in a frame (fast-forward); its times add up until end_frame().
+    While a trace is being captured every run is also added to `trace`.
+    """
+    __slots__ = ("name", "start", "frame_ms", "history", "trace")
+
+    def __init__(self, name, window, trace=None):
+        self.name = name
+        self.start = 0.0
+        self.frame_ms = 0.0
+        self.history = RingBuffer(window)  # ms per frame, last `window` frames
+        self.trace = trace                 # The capture's event list, or None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        self.frame_ms += (end - self.start) * 1000
+        if self.trace is not None:
+            self.trace.append(("X", self.name, self.start, end, None))
+        return False
+
+
+class Span:
+    """A trace-only timed section (e.g. one enemy's move): recorded while capturing, never in the stats."""
+    __slots__ = ("name", "start", "trace")
+
+    def __init__(self, name, trace):
+        self.name = name
+        self.start = 0.0
+        self.trace = trace
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.append(("X", self.name, self.start, time.perf_counter(), None))
+        return False
+
+
+class NullPhase:
+    """What phase() hands out while profiling is off: entering and leaving it does nothing."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_PHASE = NullPhase()
+
+
+# =============================================
+# FrameProfiler Class (per-phase frame timings)
+# =============================================
+class FrameProfiler:
+    """
+    Times the phases of each frame and keeps the last `window` frames of
+    every phase, for rolling mean / p95 / p99 figures and the overlay.
+
+        with profiler.phase("bullets"):
+            ...
+
+    While `enabled` is False phase() returns a shared no-op, so the hooks in
+    the game loop cost one attribute check and an empty `with` per phase.
+    begin_frame()/end_frame() bracket a frame; "frame" is the whole of it.
+
+    start_trace()/stop_trace() capture up to settings.trace_max_frames
+    frames as Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev):
+    the phases as nested spans, span() sections such as each enemy's move
+    and draw, and instant() events such as campaign actions and kills.
+    While capturing, events are kept as raw tuples; turning them into JSON
+    and writing the file happens on the background writer thread.
+    """
+    def __init__(self, window=None):
+        self.window = window or settings.profiler_window
+        self.enabled = settings.profiler_enabled
+        self.show_overlay = False
+        self.phases = {}            # name -> Phase, in the order they first ran
+        self.frame = Phase("frame", self.window)
+        self.frames = 0             # Frames ended since the start
+
+        # Trace capture (None while not capturing)
+        self.trace = None
+        self.trace_origin = 0.0         # perf_counter() the trace's timestamps count from
+        self.trace_frames = 0
+        self.trace_was_enabled = False  # `enabled` before the capture turned it on
+        self.spans = {}                 # (name, owner type) -> Span, for the current capture
+
+        # Overlay: the figures are recomputed and rendered every profiler_overlay_refresh ms, not every frame
+        self.font = None
+        self.overlay_lines = []
+        self.next_overlay_refresh = 0
+
+    def phase(self, name):
+        if not self.enabled:
+            return NULL_PHASE
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = Phase(name, self.window, self.trace)
+        return phase
+
+    def span(self, name, owner=None):
+        """A section that only shows up in traces, named "<type of owner>.<name>" when an owner is given."""
+        if self.trace is None:
+            return NULL_PHASE
+        key = (name, type(owner))
+        span = self.spans.get(key)
+        if span is None:
+            label = name if owner is None else f"{type(owner).__name__}.{name}"
+            span = self.spans[key] = Span(label, self.trace)
+        return span
+
+    def instant(self, name, **args):
+        """A point in time on the trace (a campaign action, a kill...). Free while not capturing."""
+        if self.trace is not None:
+            self.trace.append(("i", name, time.perf_counter(), None, args))
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame.start = time.perf_counter()
+
+    def end_frame(self):
+        self.frames += 1  # Counted even while off, so trace frame numbers are frames since the start
+        if not self.enabled:
+            return
+        end = time.perf_counter()
+        self.frame.history.append((end - self.frame.start) * 1000)
+        for phase in self.phases.values():
+            phase.history.append(phase.frame_ms)  # 0 for phases that didn't run, so the means stay per frame
+            phase.frame_ms = 0.0
+
+        if self.trace is not None:
+            self.trace.append(("X", "frame", self.frame.start, end, {"frame": self.frames}))
+            self.trace_frames += 1
+            if self.trace_frames >= settings.trace_max_frames:
+                self.stop_trace()
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self.show_overlay = False
+
+    def toggle_overlay(self):
+        # The overlay needs the timings, so showing it turns profiling on (and hiding it off again)
+        self.show_overlay = not self.show_overlay
+        self.enabled = self.show_overlay or settings.profiler_enabled or self.trace is not None
+        self.next_overlay_refresh = 0
+
+    # ---------- Trace capture ----------
+    def start_trace(self):
+        if self.trace is not None:
+            return
+        self.trace = []
+        self.trace_origin = time.perf_counter()
+        self.trace_frames = 0
+        self.trace_was_enabled = self.enabled
+        self.enabled = True
+        self.spans = {}
+        for phase in self.phases.values():
+            phase.trace = self.trace
+        print(f"Trace capture started (stops by itself after {settings.trace_max_frames} frames)")
+
+    def stop_trace(self, path=None):
+        """End the capture and write it in the background; returns the file's path (None if not capturing)."""
+        if self.trace is None:
+            return None
+        events, origin = self.trace, self.trace_origin
+        self.trace = None
+        self.spans = {}
+        for phase in self.phases.values():
+            phase.trace = None
+        self.enabled = self.trace_was_enabled or self.show_overlay
+
+        if path is None:
+            trace_dir = Loader.resource_path(settings.trace_dir)
+            os.makedirs(trace_dir, exist_ok=True)
+            path = os.path.join(trace_dir, f"trace_{datetime.datetime.now():%Y%m%d_%H%M%S}.json")
+        writer.submit(("trace", path), write_trace_file, path, events, origin)
+        print(f"Trace of {self.trace_frames} frames ({len(events)} events) is being written to {path}")
+        return path
+
+    def toggle_trace(self):
+        if self.trace is None:
+            self.start_trace()
+        else:
+            self.stop_trace()
+
+    def reset(self):
+        self.phases.clear()
+        self.frame = Phase("frame", self.window)
+
+    # ---------- Figures ----------
+    @staticmethod
+    def summarize(history):
+        """mean / p50 / p95 / p99 / max of a phase's history in ms (nearest-rank percentiles)."""
+        samples = sorted(history)
+        if not samples:
+            return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        last = len(samples) - 1
+        return {
+            "mean": sum(samples) / len(samples),
+            "p50": samples[round(last * 0.50)],
+            "p95": samples[round(last * 0.95)],
+            "p99": samples[round(last * 0.99)],
+            "max": samples[last],
+        }
+
+    def stats(self):
+        """{phase name: summarize(...)} with the whole frame first."""
+        result = {"frame": self.summarize(self.frame.history)}
+        for name, phase in self.phases.items():
+            result[name] = self.summarize(phase.history)
+        return result
+
+    def report(self):
+        lines = [f"{'phase':<16} {'mean':>7} {'p95':>7} {'p99':>7}   ms over {len(self.frame.history)} frames"]
+        for name, figures in self.stats().items():
+            lines.append(f"{name:<16} {figures['mean']:>7.2f} {figures['p95']:>7.2f} {figures['p99']:>7.2f}")
+        return "\n".join(lines)
+
+    # ---------- Overlay ----------
+    def draw_overlay(self, screen):
+        if not self.show_overlay:
+            return
+        now = pygame.time.get_ticks()
+        if now >= self.next_overlay_refresh:
+            self.next_overlay_refresh = now + settings.profiler_overlay_refresh
+            if self.font is None:
+                self.font = pygame.font.Font(pygame.font.match_font("consolas, couriernew, monospace"), 14)
+            self.overlay_lines = [self.font.render(line, True, (255, 255, 0)) for line in self.report().splitlines()]
+
+        if not self.overlay_lines:
+            return
+        line_height = self.overlay_lines[0].get_height()
+        width = max(line.get_width() for line in self.overlay_lines) + 12
+        height = line_height * len(self.overlay_lines) + 8
+        top = screen.get_height() - height - 90  # Above the arrow-key hints
+        screen.fill((0, 0, 0), (6, top, width, height))
+        for i, line in enumerate(self.overlay_lines):
+            screen.blit(line, (12, top + 4 + i * line_height))
+
+
+def write_trace_file(path, events, origin):
+    # Runs on the writer thread: raw (phase, name, start, end, args) tuples -> trace-event JSON
+    pid = os.getpid()
+    trace_events = [
+        {"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": "Typing Shooter"}},
+        {"ph": "M", "name": "thread_name", "pid": pid, "tid": 0, "args": {"name": "game loop"}},
+    ]
+    for kind, name, start, end, args in events:
+        if start < origin:
+            continue  # Started before the capture did (the frame the hotkey was pressed in)
+        event = {"ph": kind, "name": name, "pid": pid, "tid": 0, "ts": round((start - origin) * 1e6, 1)}
+        if kind == "X":
+            event["dur"] = round((end - start) * 1e6, 1)
+        else:
+            event["s"] = "t"
+        if args:
+            event["args"] = args
+        trace_events.append(event)
+    write_json_file(path, {"traceEvents": trace_events, "displayTimeUnit": "ms"}, {"separators": (",", ":")})
+
+
+# Shared by the game loop and everything it calls
+profiler = FrameProfiler()
@@ -0,0 +1,135 @@
+import json
+import struct
+import zlib
+from array import array
+
+import pygame
+
+# =============================================
+# Replay file format
+# =============================================
+# MAGIC, then a little-endian uint16 version and uint32 header length, then
+# a JSON header (seed, checkpoint, screen size, start tick, counts) and a zlib
+# block holding:
+#   - one uint16 clock delta (ms) per frame
+#   - one packed record per input event, stamped with its frame number
+MAGIC = b"TSRP"
+REPLAY_VERSION = 2  # 2: key events keep their modifier state
+PREFIX = struct.Struct("<4sHI")
+EVENT = struct.Struct("<IBiIhhBH")  # frame, type, key, unicode codepoint, x, y, button, modifier keys
+
+# Event types worth recording, and their one-byte codes in the file
+EVENT_CODES = {
+    pygame.KEYDOWN: 0,
+    pygame.KEYUP: 1,
+    pygame.MOUSEBUTTONDOWN: 2,
+    pygame.MOUSEBUTTONUP: 3,
+    pygame.MOUSEMOTION: 4,
+}
+EVENT_TYPES = {code: event_type for event_type, code in EVENT_CODES.items()}
+
+
+# =============================================
+# ReplayRecorder Class
+# =============================================
+class ReplayRecorder:
+    """
+    Records what reaches Game.process_events: the clock at the start of every
+    frame and every key/mouse event, stamped with the frame it arrived in.
+    """
+    def __init__(self, seed, checkpoint, start_ticks, screen_size):
+        self.header = {
+            "seed": seed,
+            "checkpoint": checkpoint,
+            "start_ticks": start_ticks,
+            "screen_width": screen_size[0],
+            "screen_height": screen_size[1],
+        }
+        self.frame = -1
+        self.last_ticks = start_ticks
+        self.frame_deltas = array("H")
+        self.events = bytearray()
+        self.event_count = 0
+
+    def begin_frame(self, ticks):
+        self.frame += 1
+        self.frame_deltas.append(min(max(ticks - self.last_ticks, 0), 0xFFFF))
+        self.last_ticks = ticks
+
+    def record(self, event):
+        code = EVENT_CODES.get(event.type)
+        if code is None:
+            return
+        unicode_text = getattr(event, "unicode", "")
+        x, y = getattr(event, "pos", (0, 0))
+        self.events += EVENT.pack(
+            self.frame,
+            code,
+            getattr(event, "key", 0),
+            ord(unicode_text) if len(unicode_text) == 1 else 0,
+            x,
+            y,
+            getattr(event, "button", 0),
+            getattr(event, "mod", 0) & 0xFFFF,
+        )
+        self.event_count += 1
+
+    def save(self, path):
+        header = dict(self.header, frames=len(self.frame_deltas), events=self.event_count)
+        header_bytes = json.dumps(header).encode("utf-8")
+        body = zlib.compress(self.frame_deltas.tobytes() + bytes(self.events), 9)
+        with open(path, "wb") as f:
+            f.write(PREFIX.pack(MAGIC, REPLAY_VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            f.write(body)
+        print(f"Replay saved to {path} ({len(self.frame_deltas)} frames, {self.event_count} events)")
+
+
+# =============================================
+# Replay Class (loaded recording)
+# =============================================
+class Replay:
+    def __init__(self, header, frame_deltas, events_by_frame):
+        self.header = header
+        self.frame_deltas = frame_deltas
+        self.events_by_frame = events_by_frame  # frame -> [pygame.event.Event, ...]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, header_length = PREFIX.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"{path} is replay version {version}, expected {REPLAY_VERSION}")
+
+        start = PREFIX.size
+        header = json.loads(data[start:start + header_length].decode("utf-8"))
+        body = zlib.decompress(data[start + header_length:])
+
+        frame_deltas = array("H")
+        frame_deltas.frombytes(body[:header["frames"] * frame_deltas.itemsize])
+
+        events_by_frame = {}
+        for frame, code, key, codepoint, x, y, button, mod in EVENT.iter_unpack(body[header["frames"] * frame_deltas.itemsize:]):
+            events_by_frame.setdefault(frame, []).append(cls.make_event(code, key, codepoint, x, y, button, mod))
+        return cls(header, frame_deltas, events_by_frame)
+
+    @staticmethod
+    def make_event(code, key, codepoint, x, y, button, mod=0):
+        event_type = EVENT_TYPES[code]
+        if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+            return pygame.event.Event(event_type, key=key, unicode=chr(codepoint) if codepoint else "", mod=mod)
+        if event_type == pygame.MOUSEMOTION:
+            return pygame.event.Event(event_type, pos=(x, y))
+        return pygame.event.Event(event_type, pos=(x, y), button=button)
+
+    def __len__(self):
+        return len(self.frame_deltas)
+
+    def frames(self):
+        """Yield (dt, events) for every recorded frame, ready for Game.step()."""
+        for frame, dt in enumerate(self.frame_deltas):
+            yield dt, self.events_by_frame.get(frame, ())
@@ -0,0 +1,58 @@
+# =============================================
+# RingBuffer Class (fixed-capacity position history)
+# =============================================
+class RingBuffer:
+    """
+    Fixed-capacity history backed by a preallocated list.
+
+    Appending when full overwrites (and returns) the oldest item in O(1),
+    replacing the `list.append()` + `list.pop(0)` pattern. Index 0 is always
+    the oldest item, so trails can be drawn oldest (faintest) to newest.
+    """
+    __slots__ = ("items", "capacity", "start", "size")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.items = [None] * capacity
+        self.start = 0   # Index of the oldest item
+        self.size = 0
+
+    def append(self, item):
+        """Add an item; returns the evicted oldest item when full, otherwise None."""
+        if self.size < self.capacity:
+            self.items[(self.start + self.size) % self.capacity] = item
+            self.size += 1
+            return None
+        evicted = self.items[self.start]
+        self.items[self.start] = item
+        self.start = (self.start + 1) % self.capacity
+        return evicted
+
+    def clear(self):
+        self.start = 0
+        self.size = 0
+
+    def is_full(self):
+        return self.size == self.capacity
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("RingBuffer index out of range")
+        return self.items[(self.start + index) % self.capacity]
+
+    def __iter__(self):
+        items, capacity, start = self.items, self.capacity, self.start
+        for i in range(self.size):
+            yield items[(start + i) % capacity]
+
+    def fade_items(self):
+        """Yield (fade, item) oldest first, with fade going from 0 up to just below 1."""
+        size = self.size
+        items, capacity, start = self.items, self.capacity, self.start
+        for i in range(size):
+            yield i / size, items[(start + i) % capacity]
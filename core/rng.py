@@ -0,0 +1,41 @@
+import random
+
+# =============================================
+# Named random streams
+# =============================================
+# Each stream has its own generator so e.g. extra particles on screen never
+# change which enemies spawn or which words they carry. All three are seeded
+# from one master seed, so a seed plus the recorded inputs replays a session
+# exactly.
+#
+# Usage:  from core import rng
+#         rng.gameplay.randint(...)   # spawns, speeds, angles, fire chances, drops
+#         rng.visuals.uniform(...)    # stars, clouds, particles, effect jitter
+#         rng.words.choice(...)       # enemy words and the meteor word order
+gameplay = random.Random()
+visuals = random.Random()
+words = random.Random()
+
+_streams = {"gameplay": gameplay, "visuals": visuals, "words": words}
+current_seed = None
+
+
+def seed(value=None):
+    """
+    Reseed every stream from one master seed and return it.
+    None picks a fresh seed (printed by the game so a session can be reproduced).
+    """
+    global current_seed
+    if value is None:
+        value = random.SystemRandom().randrange(2 ** 32)
+    current_seed = value
+    for name, stream in _streams.items():
+        stream.seed(f"{value}:{name}")  # Same master seed, independent sequences
+    return value
+
+
+def stream(name):
+    return _streams[name]
+
+
+seed()
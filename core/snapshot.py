@@ -0,0 +1,452 @@
+"""
+World snapshots: the whole simulation of a Game in a few kilobytes.
+
+A snapshot holds every live enemy (all __slots__ fields of its class),
+bullets, particles, shockwaves and "+X" effects, the player, the campaign
+scheduler (tracks, emitters, conditions), the game clock, the hit-stop,
+the on-screen messages and the state of every random stream. Restoring it
+and playing on gives the same game as the one the snapshot was taken
+from, frame for frame.
+
+File layout (little-endian):
+    MAGIC, uint16 version, uint32 manifest length, uint32 body length
+    manifest: pickle of a dict (screen size, campaign, seed, ticks, and the
+              (class name, handle) of every enemy in store order, including
+              the ones killed this frame that the next compact() removes)
+    body:     zlib-compressed pickle of the rest
+
+Objects are stored field by field, never as whole objects. Anything that
+is not simulation state is stored as a reference and looked up again on
+restore:
+    - enemies (a bullet's target, the selected enemy) by entity handle
+    - the player, the enemy store and the checkpoint manager by role
+    - images and fonts by their Loader source (Loader.asset_sources);
+      generated images (shells, bullets) by their pixels
+
+Loading only accepts the few classes a snapshot can contain, so a
+snapshot file can't run code.
+
+Endless runs can't be snapshotted: the wave generator's state can't be
+saved.
+"""
+import io
+import pickle
+import struct
+import zlib
+from array import array
+from itertools import count
+
+import pygame
+
+from campaign.endless import GeneratedTimeline
+from campaign.scheduler import CampaignScheduler, Emitter, MAIN_TRACK, Track
+from config import constants, game_settings as settings
+from config.loader import Loader
+from core import game_clock, rng
+from effects.particles import Particle
+from effects.plus_one import PlusXEffect
+from effects.shockwave import Shockwave
+from enemies.checkpoint_divider import CheckpointDivider
+from enemies.enemy import Enemy
+from enemies.enemy_battleship import EnemyBattleship
+from enemies.enemy_cluster_bomb import EnemyClusterBomb
+from enemies.enemy_gunship import EnemyGunship
+from enemies.enemy_meteor import EnemyMeteor
+from enemies.enemy_proximity_mine import EnemyProximityMines
+from enemies.enemy_shell import EnemyShell, shell_pool
+from enemies.enemy_sucide_drone import EnemySuicideDrone
+from shooting.bullet import Bullet
+
+MAGIC = b"TSSN"
+SNAPSHOT_VERSION = 1  # Bump when the stored fields change; older snapshots are then refused
+PREFIX = struct.Struct("<4sHII")
+
+ENTITY_CLASSES = {cls.__name__: cls for cls in (
+    CheckpointDivider, EnemyMeteor, EnemyProximityMines, EnemyClusterBomb,
+    EnemySuicideDrone, EnemyGunship, EnemyBattleship, EnemyShell,
+)}
+
+# BulletManager list -> (class, name of the BulletManager pool its objects come from)
+EFFECT_LISTS = {
+    "bullets": (Bullet, "bullet_pool"),
+    "particles": (Particle, "particle_pool"),
+    "shockwaves": (Shockwave, "shockwave_pool"),
+    "plus_x_effects": (PlusXEffect, "plus_x_pool"),
+}
+
+# Plain attributes copied as they are
+GAME_FIELDS = ("game_over", "meteor_shower", "next_meteor_spawn_time", "start_time", "bosses_alive",
+               "last_campaign_tick", "enemy_selection_mode", "selected_enemy")
+PLAYER_FIELDS = ("rect", "gun_angle", "health", "ammo", "shield_health", "flame_index", "flame_timer",
+                 "hit_flash", "flash_start_time")
+WINDOW_FIELDS = ("incoming_message", "outgoing_message", "current_enemy_text", "current_ship_ai_text",
+                 "text_index_enemy", "text_index_ship_ai", "incoming_message_timer", "outgoing_message_timer",
+                 "message_end_time")
+HIT_STOP_FIELDS = ("end_time", "time_scale", "accumulator")
+
+# Store bookkeeping, set again on restore
+SKIPPED_SLOTS = {"pool", "alive", "handle", "store_index"}
+
+PLAIN_TYPES = {int, float, str, bool, type(None), bytes, tuple, list, dict, set}
+ALLOWED_CLASSES = {
+    ("pygame", "__rect_constructor"),
+    ("pygame", "__color_constructor"),
+    ("core.ring_buffer", "RingBuffer"),
+}
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot can't be taken or loaded."""
+
+
+# =============================================
+# Fields of __slots__ classes
+# =============================================
+_fields = {}
+
+
+def slot_fields(cls):
+    """Every __slots__ name along the class hierarchy, minus the store bookkeeping."""
+    fields = _fields.get(cls)
+    if fields is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if name not in SKIPPED_SLOTS and name not in names:
+                    names.append(name)
+        fields = _fields[cls] = tuple(names)
+    return fields
+
+
+def get_fields(obj, fields):
+    state = {}
+    for name in fields:
+        try:
+            state[name] = getattr(obj, name)
+        except AttributeError:
+            pass  # Slot never set (e.g. the round-shell fields of a square shell)
+    return state
+
+
+def set_fields(obj, state):
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
+# =============================================
+# Pickling with references
+# =============================================
+class SnapshotPickler(pickle.Pickler):
+    def __init__(self, file, game):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.roles = {
+            id(game.player): ("player",),
+            id(game.enemy_list): ("store",),
+            id(game.checkpoint_manager): ("checkpoints",),
+        }
+
+    def persistent_id(self, obj):
+        kind = type(obj)
+        if kind in PLAIN_TYPES:
+            return None
+        role = self.roles.get(id(obj))
+        if role is not None:
+            return role
+        if isinstance(obj, Enemy):
+            return ("entity", obj.handle)
+        if isinstance(obj, pygame.SurfaceType):  # SurfaceType/FontType: also the subclasses core/alloc_tracker.py installs
+            source = Loader.asset_sources.get(obj)
+            if source is not None:
+                return ("asset", source)
+            pixel_format = "RGBA" if obj.get_flags() & pygame.SRCALPHA else "RGB"
+            return ("pixels", obj.get_size(), pixel_format, pygame.image.tobytes(obj, pixel_format))
+        if isinstance(obj, pygame.font.FontType):
+            source = Loader.asset_sources.get(obj)
+            if source is None:
+                raise SnapshotError("found a font not loaded through Loader.load_font")
+            return ("asset", source)
+        return None
+
+
+class RestrictedUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if (module, name) not in ALLOWED_CLASSES:
+            raise SnapshotError(f"snapshot refers to {module}.{name}")
+        return super().find_class(module, name)
+
+
+class SnapshotUnpickler(RestrictedUnpickler):
+    def __init__(self, file, game, entities):
+        super().__init__(file)
+        self.roles = {"player": game.player, "store": game.enemy_list, "checkpoints": game.checkpoint_manager}
+        self.entities = entities
+        # Images and fonts already in memory, so restoring doesn't go back to the disk for them
+        self.assets = {source: asset for asset, source in Loader.asset_sources.items()}
+
+    def persistent_load(self, pid):
+        kind = pid[0]
+        if kind == "entity":
+            return self.entities.get(pid[1])  # None when it was already dead in the snapshot
+        if kind == "asset":
+            asset = self.assets.get(pid[1])
+            if asset is None:
+                asset = self.assets[pid[1]] = Loader.load_asset(pid[1])
+            return asset
+        if kind == "pixels":
+            _, size, pixel_format, data = pid
+            return pygame.image.frombytes(data, size, pixel_format)
+        if kind in self.roles:
+            return self.roles[kind]
+        raise SnapshotError(f"unknown reference {kind!r}")
+
+
+# =============================================
+# Capture
+# =============================================
+def capture(game):
+    """The game's whole simulation as bytes. Call between frames (after update_frame)."""
+    store = game.enemy_list
+    if isinstance(game.timeline, GeneratedTimeline):
+        raise SnapshotError("endless runs can't be snapshotted")
+
+    # The store as the next frame will find it: enemies killed after this frame's compact() (player
+    # collisions) still hold their place in the list, and spawns still wait in the queue. Both change
+    # the order the next compact() leaves the list in, so they are kept as they are.
+    entities = list(store.entities)
+    manifest = {
+        "screen": (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT),
+        "campaign": settings.campaign_file,
+        "events": len(game.timeline),
+        "seed": game.seed,
+        "ticks": game.time_source.ticks,
+        "entities": [(type(entity).__name__, entity.handle) for entity in entities],
+    }
+
+    bullets = game.bullets_manager
+    body = {
+        "entities": [get_fields(entity, slot_fields(type(entity))) for entity in entities],
+        "dead": [entity.handle for entity in store.dead],
+        "pending": [(type(entity).__name__, get_fields(entity, slot_fields(type(entity)))) for entity in store.pending],
+        "next_handle": store.next_handle,
+        "effects": {
+            name: [get_fields(obj, slot_fields(cls)) for obj in getattr(bullets, name)
+                   if name != "bullets" or obj.is_target_alive()]  # Bullets of dead targets go next frame anyway
+            for name, (cls, _) in EFFECT_LISTS.items()
+        },
+        "game": get_fields(game, GAME_FIELDS),
+        "near_player": [enemy for enemy in game.enemies_near_player if enemy.alive],
+        "player": get_fields(game.player, PLAYER_FIELDS),
+        "window": get_fields(game.game_window, WINDOW_FIELDS),
+        "hit_stop": get_fields(game.hit_stop, HIT_STOP_FIELDS),
+        "campaign": capture_campaign(game, game.campaign),
+        "meteor_word_index": EnemyMeteor.word_index,
+        "rng": {name: pack_random_state(rng.stream(name).getstate()) for name in ("gameplay", "visuals", "words")},
+    }
+
+    manifest_bytes = pickle.dumps(manifest, protocol=pickle.HIGHEST_PROTOCOL)
+    buffer = io.BytesIO()
+    SnapshotPickler(buffer, game).dump(body)
+    body_bytes = zlib.compress(buffer.getvalue(), 1)
+    return PREFIX.pack(MAGIC, SNAPSHOT_VERSION, len(manifest_bytes), len(body_bytes)) + manifest_bytes + body_bytes
+
+
+def capture_campaign(game, scheduler):
+    runners = []
+    for runner in scheduler.running.values():
+        if isinstance(runner, Track):
+            runners.append(("track", runner.name, runner.index, runner.last_time, runner.waiting_on, runner.due_sequence))
+        else:
+            runners.append(("emitter", runner.name, runner.action, runner.every, runner.remaining, runner.last_time,
+                            runner.due_sequence))
+    return {
+        "main_index": game.main_track.index,
+        "now": scheduler.now,
+        "next_sequence": next(scheduler.sequence),  # Later numbers stay larger, so the firing order is unchanged
+        "runners": runners,
+        "subscribers": {condition: [track.name for track in tracks] for condition, tracks in scheduler.subscribers.items()},
+    }
+
+
+def pack_random_state(state):
+    version, internal, gauss = state
+    return version, array("I", internal).tobytes(), gauss
+
+
+def unpack_random_state(packed):
+    version, internal, gauss = packed
+    return version, tuple(array("I", internal)), gauss
+
+
+# =============================================
+# Restore
+# =============================================
+def read_manifest(data):
+    """The header of a snapshot (screen size, campaign, seed, ticks, entities) without restoring it."""
+    if len(data) < PREFIX.size:
+        raise SnapshotError("not a snapshot (too short)")
+    magic, version, manifest_length, body_length = PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("not a snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"snapshot version {version}, expected {SNAPSHOT_VERSION}")
+    if len(data) != PREFIX.size + manifest_length + body_length:
+        raise SnapshotError("snapshot is truncated")
+    return RestrictedUnpickler(io.BytesIO(data[PREFIX.size:PREFIX.size + manifest_length])).load()
+
+
+def restore(game, data):
+    """Put the game back into the state `data` was captured in."""
+    manifest = read_manifest(data)
+    if manifest["campaign"] != settings.campaign_file or manifest["events"] != len(game.timeline):
+        raise SnapshotError(f"snapshot is of campaign {manifest['campaign']}, the game is playing {settings.campaign_file}")
+    if isinstance(game.timeline, GeneratedTimeline):
+        raise SnapshotError("endless runs can't be snapshotted")
+
+    # Same seed -> same meteor word order; otherwise shuffle it the way that seed did
+    if manifest["seed"] != game.seed:
+        game.seed = rng.seed(manifest["seed"])
+        EnemyMeteor.shuffle_words()
+
+    # Enemies: keep the live object when the handle is still around, so its images stay in memory
+    store = game.enemy_list
+    entities = {}
+    for class_name, handle in manifest["entities"]:
+        entity = store.by_handle.get(handle)
+        if type(entity) is not entity_class(class_name):
+            entity = new_entity(entity_class(class_name))
+        entities[handle] = entity
+
+    body_start = PREFIX.size + PREFIX.unpack_from(data)[2]
+    body = SnapshotUnpickler(io.BytesIO(zlib.decompress(data[body_start:])), game, entities).load()
+
+    restore_entities(store, entities, manifest["entities"], body)
+    restore_effects(game.bullets_manager, body["effects"])
+
+    set_fields(game, body["game"])
+    game.enemies_near_player = set(body["near_player"])
+    restore_player(game.player, body["player"])
+    set_fields(game.game_window, body["window"])
+    set_fields(game.hit_stop, body["hit_stop"])
+    game.campaign = restore_campaign(game, body["campaign"])
+    game.main_track = game.campaign.get_track(MAIN_TRACK)
+    if game.main_track is None:  # Main track already over
+        game.main_track = Track(MAIN_TRACK, game.timeline, body["campaign"]["main_index"], game.campaign.now)
+        game.main_track.active = False
+    EnemyMeteor.word_index = body["meteor_word_index"]
+    for name, packed in body["rng"].items():
+        rng.stream(name).setstate(unpack_random_state(packed))
+
+    # Clock last: a FrameClock keeps following wall time from the snapshot's ticks on
+    clock = game.time_source
+    if isinstance(clock, game_clock.FrameClock):
+        clock.offset += manifest["ticks"] - clock.ticks
+    clock.ticks = manifest["ticks"]
+
+    game.collision_grid.rebuild(store)  # Same positions in the same order -> the same grid
+
+
+def entity_class(class_name):
+    cls = ENTITY_CLASSES.get(class_name)
+    if cls is None:
+        raise SnapshotError(f"unknown enemy class {class_name}")
+    return cls
+
+
+def new_entity(cls):
+    # An empty enemy for set_fields() to fill in; shells come from (and are counted by) their pool
+    if cls is not EnemyShell:
+        entity = cls.__new__(cls)
+        entity.pool = None
+        return entity
+    if shell_pool.free:
+        entity = shell_pool.free.pop()
+    else:
+        entity = cls.__new__(cls)
+        entity.pool = shell_pool
+        shell_pool.created += 1
+    shell_pool.in_use += 1
+    return entity
+
+
+def restore_entities(store, entities, listed, body):
+    # Enemies that are not in the snapshot leave the store (pooled ones go back to their pool)
+    for entity in store.entities + store.pending:
+        if store.by_handle.get(entity.handle) is not entity or entities.get(entity.handle) is not entity:
+            entity.alive = False
+            entity.store_index = -1
+            if entity.pool is not None:
+                entity.pool.release(entity)
+
+    dead = set(body["dead"])
+    store.entities = []
+    store.by_handle = {}
+    store.pending = []
+    store.dead.clear()
+    for index, ((_, handle), state) in enumerate(zip(listed, body["entities"])):
+        entity = entities[handle]
+        set_fields(entity, state)
+        entity.handle = handle
+        entity.alive = handle not in dead
+        entity.store_index = index
+        store.entities.append(entity)
+        store.by_handle[handle] = entity
+    store.dead.extend(entities[handle] for handle in body["dead"])
+    for class_name, state in body["pending"]:
+        entity = new_entity(entity_class(class_name))
+        set_fields(entity, state)
+        entity.alive = False  # Set by add() on the next compact()
+        store.pending.append(entity)
+    store.live_count = len(store.entities) - len(store.dead)
+    store.next_handle = body["next_handle"]
+
+
+def restore_effects(bullets, effects):
+    for name, (cls, pool_name) in EFFECT_LISTS.items():
+        pool = getattr(bullets, pool_name)
+        for obj in getattr(bullets, name):
+            pool.release(obj)
+        restored = []
+        for state in effects[name]:
+            if pool.free:
+                obj = pool.free.pop()
+            else:
+                obj = cls.__new__(cls)
+                obj.pool = pool
+                pool.created += 1
+            set_fields(obj, state)
+            pool.in_use += 1
+            restored.append(obj)
+        pool.peak_in_use = max(pool.peak_in_use, pool.in_use)
+        setattr(bullets, name, restored)
+
+
+def restore_player(player, state):
+    was_dead = player.health == 0
+    set_fields(player, state)
+    if player.health == 0 and not was_dead:
+        player.set_dead()
+    elif player.health > 0 and was_dead:
+        player.set_alive()
+
+
+def restore_campaign(game, state):
+    scheduler = CampaignScheduler(game.handle_json_event)
+    scheduler.now = state["now"]
+    scheduler.sequence = count(state["next_sequence"])
+    for runner_state in state["runners"]:
+        if runner_state[0] == "track":
+            _, name, index, last_time, waiting_on, due_sequence = runner_state
+            timeline = game.timeline if name == MAIN_TRACK else game.timeline.tracks[name]
+            runner = Track(name, timeline, index, last_time)
+            runner.waiting_on = waiting_on
+        else:
+            _, name, action, every, remaining, last_time, due_sequence = runner_state
+            runner = Emitter(name, action, every, remaining, last_time)
+        runner.due_sequence = due_sequence
+        scheduler.running[name] = runner
+        if due_sequence is not None:
+            scheduler.heap.append((runner.next_time(), due_sequence, runner))
+    scheduler.heap.sort(key=lambda entry: entry[:2])  # A sorted list is a valid heap
+    scheduler.subscribers = {condition: [scheduler.running[name] for name in names]
+                             for condition, names in state["subscribers"].items()}
+    return scheduler
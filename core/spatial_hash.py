@@ -0,0 +1,116 @@
+# =============================================
+# SpatialHash Class (uniform-grid broadphase)
+# =============================================
+class SpatialHash:
+    """
+    Uniform grid that buckets objects by the cells their rect overlaps.
+    Queries only look at the cells touched by the query area, so the cost
+    depends on local density instead of the total number of objects.
+    """
+    def __init__(self, cell_size):
+        """
+        :param cell_size: Width and height of a grid cell in pixels. Should be
+                          close to the size of the largest common sprite.
+        """
+        self.cell_size = cell_size
+        self.cells = {}            # (cell_x, cell_y) -> list of objects
+        self.object_cells = {}     # id(object) -> list of cell keys it occupies
+
+    def _cell_range(self, left, top, right, bottom):
+        # Convert a pixel-space box into an inclusive range of cell coordinates
+        size = self.cell_size
+        return (int(left // size), int(top // size),
+                int(right // size), int(bottom // size))
+
+    def clear(self):
+        self.cells.clear()
+        self.object_cells.clear()
+
+    def insert(self, obj):
+        """Insert an object that exposes a pygame.Rect as `rect`."""
+        rect = obj.rect
+        x0, y0, x1, y1 = self._cell_range(rect.left, rect.top, rect.right, rect.bottom)
+        keys = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                key = (cx, cy)
+                bucket = self.cells.get(key)
+                if bucket is None:
+                    bucket = self.cells[key] = []
+                bucket.append(obj)
+                keys.append(key)
+        self.object_cells[id(obj)] = keys
+
+    def remove(self, obj):
+        """Remove an object from every cell it occupies (no-op if absent)."""
+        keys = self.object_cells.pop(id(obj), None)
+        if keys is None:
+            return
+        for key in keys:
+            bucket = self.cells.get(key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(obj)
+            except ValueError:
+                continue
+            if not bucket:
+                del self.cells[key]
+
+    def rebuild(self, objects):
+        """Clear the grid and insert every object again (called once per tick)."""
+        self.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    def __contains__(self, obj):
+        return id(obj) in self.object_cells
+
+    def __len__(self):
+        return len(self.object_cells)
+
+    # =============================================
+    # Queries
+    # =============================================
+    def query_rect(self, rect):
+        """Return the objects whose rect overlaps the given rect."""
+        x0, y0, x1, y1 = self._cell_range(rect.left, rect.top, rect.right, rect.bottom)
+        found = []
+        seen = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    key = id(obj)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if obj.rect.colliderect(rect):
+                        found.append(obj)
+        return found
+
+    def query_radius(self, center, radius):
+        """Return the objects whose rect center lies within `radius` of `center`."""
+        cx, cy = center
+        x0, y0, x1, y1 = self._cell_range(cx - radius, cy - radius, cx + radius, cy + radius)
+        radius_sq = radius * radius
+        found = []
+        seen = set()
+        for gx in range(x0, x1 + 1):
+            for gy in range(y0, y1 + 1):
+                bucket = self.cells.get((gx, gy))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    key = id(obj)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    dx = obj.rect.centerx - cx
+                    dy = obj.rect.centery - cy
+                    if dx * dx + dy * dy <= radius_sq:
+                        found.append(obj)
+        return found
+
@@ -0,0 +1,194 @@
+import _thread
+import builtins
+import json
+import os
+import sys
+import time
+
+# Imported by main.py before anything else, so this module stays free of pygame and project imports:
+# everything imported after it is timed
+
+
+# =============================================
+# Section Class (one timed step of the startup)
+# =============================================
+class Section:
+    """
+    Context manager for one step ("asset", "font", "init"...). Sections and
+    imports share a stack, so time spent in a nested step is taken out of
+    its parent's self time and every kind adds up without counting twice.
+    """
+    __slots__ = ("tracer", "kind", "label")
+
+    def __init__(self, tracer, kind, label):
+        self.tracer = tracer
+        self.kind = kind
+        self.label = label
+
+    def __enter__(self):
+        self.tracer.push()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tracer.pop(self.kind, self.label)
+        return False
+
+
+class NullSection:
+    """What section() hands out outside a startup trace."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SECTION = NullSection()
+
+
+# =============================================
+# StartupTracer Class (time-to-window / first frame / interactive)
+# =============================================
+class StartupTracer:
+    """
+    Where the time goes between launching main.py and a menu that answers
+    to input. Timestamps count from `origin`, the moment this module was
+    imported (the interpreter's own startup is not in them; the cold/warm
+    benchmark in benchmarks/startup_benchmark.py measures it from outside).
+
+    main.py calls install() first thing: it replaces builtins.__import__ so
+    every module imported for the first time is timed ("import"). Loader
+    times images, sounds and music ("asset") and fonts ("font") through
+    section(). mark() records the
+    milestones main.py reaches: "window" (set_mode returned), "first_frame"
+    (the start screen's first flip) and "interactive" (the first input
+    handled after it). The last one ends the trace: the import hook comes
+    off and section() becomes free.
+
+    report() breaks the time to interactive down by kind (self times, so
+    they add up; "other" is what no section covers) and lists the slowest
+    imports and assets.
+    """
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []            # (kind, label, start, end, self seconds)
+        self.milestones = {}        # name -> seconds since origin
+        self.stack = []             # [start, seconds spent in nested steps] per open step
+        self.active = False         # Set by install(): nothing is recorded for headless runs and tests
+        self.original_import = None
+        self.thread = _thread.get_ident()  # Only the main thread's imports are timed (one stack)
+
+    # ---------- Recording ----------
+    def install(self):
+        if self.original_import is None and not self.milestones:
+            self.active = True
+            self.original_import = builtins.__import__
+            builtins.__import__ = self.timed_import
+
+    def uninstall(self):
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if _thread.get_ident() != self.thread:
+            return self.original_import(name, globals, locals, fromlist, level)
+        if level == 0:
+            module = sys.modules.get(name)
+            # `from package import submodule` can load something new even when the package is loaded
+            if module is not None and all(hasattr(module, item) for item in fromlist or ()):
+                return self.original_import(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        self.push()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            if level and globals:
+                name = f"{globals.get('__package__') or ''}.{name}".strip(".")
+            # Nothing new in sys.modules: an import of something already loaded, not worth a line
+            self.pop("import", name, keep=len(sys.modules) > loaded)
+
+    def push(self):
+        self.stack.append([time.perf_counter(), 0.0])
+
+    def pop(self, kind, label, keep=True):
+        end = time.perf_counter()
+        start, nested = self.stack.pop()
+        total = end - start
+        if self.stack:
+            self.stack[-1][1] += total
+        if keep:
+            self.events.append((kind, label, start, end, total - nested))
+
+    def section(self, kind, label):
+        if not self.active:
+            return NULL_SECTION
+        return Section(self, kind, label)
+
+    def mark(self, name):
+        """Record a milestone the first time it is reached; "interactive" ends the trace."""
+        if not self.active or name in self.milestones:
+            return
+        self.milestones[name] = time.perf_counter() - self.origin
+        if name == "interactive":
+            self.active = False
+            self.uninstall()
+
+    # ---------- Figures ----------
+    def breakdown(self):
+        """Seconds of self time per kind up to the last milestone, plus "other" for the rest."""
+        end = self.origin + max(self.milestones.values(), default=time.perf_counter() - self.origin)
+        kinds = {}
+        for kind, _, start, _, self_time in self.events:
+            if start <= end:
+                kinds[kind] = kinds.get(kind, 0.0) + self_time
+        kinds["other"] = max(0.0, end - self.origin - sum(kinds.values()))
+        return kinds
+
+    def slowest(self, kind, top=10):
+        """[(label, self seconds)] of the slowest events of one kind, imports grouped by top-level package."""
+        totals = {}
+        for event_kind, label, _, _, self_time in self.events:
+            if event_kind == kind:
+                key = label.split(".")[0] if kind == "import" else label
+                totals[key] = totals.get(key, 0.0) + self_time
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    def to_json(self):
+        return {
+            "milestones_ms": {name: round(seconds * 1000, 2) for name, seconds in self.milestones.items()},
+            "breakdown_ms": {kind: round(seconds * 1000, 2) for kind, seconds in self.breakdown().items()},
+            "slowest_imports_ms": {label: round(seconds * 1000, 2) for label, seconds in self.slowest("import")},
+            "slowest_assets_ms": {label: round(seconds * 1000, 2) for label, seconds in self.slowest("asset")},
+            "fonts_ms": {label: round(seconds * 1000, 2) for label, seconds in self.slowest("font")},
+            "events": [{"kind": kind, "label": label, "start_ms": round((start - self.origin) * 1000, 3),
+                        "ms": round((end - start) * 1000, 3), "self_ms": round(self_time * 1000, 3)}
+                       for kind, label, start, end, self_time in self.events],
+        }
+
+    def report(self):
+        lines = ["Startup (ms since launch)"]
+        for name, seconds in self.milestones.items():
+            lines.append(f"  {name:<14} {seconds * 1000:>8.1f}")
+        lines.append("Breakdown")
+        for kind, seconds in self.breakdown().items():
+            lines.append(f"  {kind:<14} {seconds * 1000:>8.1f}")
+        for title, kind in (("Slowest imports", "import"), ("Slowest assets", "asset"), ("Fonts", "font")):
+            lines.append(title)
+            for label, seconds in self.slowest(kind, 5):
+                lines.append(f"  {label[-40:]:<40} {seconds * 1000:>8.1f}")
+        return "\n".join(lines)
+
+    def write(self, path):
+        # Once per run and needed before the process exits, so written inline rather than by the writer thread
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, indent=2)
+
+
+# Shared by main.py, the Loader and the menu screens
+startup = StartupTracer()
@@ -1,17 +1,26 @@
 import pygame
-import random
+
+from core import rng
+
 # =============================================
 # Particle Class (for bullet hit particles)
 # =============================================
 class Particle:
+    __slots__ = ("pool", "x", "y", "color", "size", "lifetime", "velocity_x", "velocity_y")
+
     def __init__(self, x, y, color, lifetime=20):
+        self.pool = None  # Set by ObjectPool when the particle is pooled
+        self.reset(x, y, color, lifetime)
+
+    def reset(self, x, y, color, lifetime=20):
+        # Re-arm the particle (also used by the BulletManager's particle pool)
         self.x = x
         self.y = y
         self.color = color
-        self.size = random.randint(1, 2)
+        self.size = rng.visuals.randint(1, 2)
         self.lifetime = lifetime
-        self.velocity_x = random.uniform(-2, 2)
-        self.velocity_y = random.uniform(-2, 2)
+        self.velocity_x = rng.visuals.uniform(-2, 2)
+        self.velocity_y = rng.visuals.uniform(-2, 2)
 
     def update(self):
         # Update particle position based on velocity
@@ -3,6 +3,7 @@ import math
 import pygame
 
 from config import constants, utils
+from core import game_clock
 
 HIT_EFFECT_DURATION = 1000        # milliseconds
 MAX_ALPHA = 200                   # maximum opacity for hit effect
@@ -29,13 +30,13 @@ class HitEffect:
     def trigger(self):
         """Activate the hit effect."""
         self.active = True
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
 
     def update_and_draw(self):
         """Update and draw the hit effect if active."""
         if not self.active:
             return
-        elapsed_time = pygame.time.get_ticks() - self.start_time
+        elapsed_time = game_clock.get_ticks() - self.start_time
         if elapsed_time < self.duration:
             alpha = int(self.max_alpha * abs(math.sin(elapsed_time / 200)))
             overlay = pygame.Surface((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT), pygame.SRCALPHA)
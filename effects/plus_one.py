@@ -1,7 +1,7 @@
 import pygame
-import random
 
 from config.utils import loader_scale_image
+from core import rng
 
 PLUS_ONE_LIFETIME = 80  # Duration the "+X" effect remains visible
 
@@ -10,14 +10,21 @@ PLUS_ONE_LIFETIME = 80  # Duration the "+X" effect remains visible
 # PlusXEffect Class (for ammo gain visual effect)
 # =============================================
 class PlusXEffect:
+    __slots__ = ("pool", "ammo_image", "x", "y", "alpha", "lifetime", "amount")
+
     def __init__(self, x, y, amount):
+        self.pool = None  # Set by ObjectPool when the effect is pooled
+        self.ammo_image = loader_scale_image("assets/images/animated/ammo_plus.png", 30)
+        self.reset(x, y, amount)
+
+    def reset(self, x, y, amount):
+        # Restart the effect; the ammo image is kept, so pooled effects skip the disk load
         randomizer = 20
-        self.x = x + random.randint(-randomizer, randomizer)
-        self.y = y + random.randint(-randomizer, randomizer)
+        self.x = x + rng.visuals.randint(-randomizer, randomizer)
+        self.y = y + rng.visuals.randint(-randomizer, randomizer)
         self.alpha = 255
         self.lifetime = PLUS_ONE_LIFETIME
         self.amount = amount
-        self.ammo_image = loader_scale_image("assets/images/animated/ammo_plus.png", 30)
 
     def update(self):
         # Move the '+X' effect upward and fade it out
@@ -8,7 +8,14 @@ from config import constants
 # Shockwave Effect Class
 # =============================================
 class Shockwave:
+    __slots__ = ("pool", "x", "y", "radius", "alpha", "color")
+
     def __init__(self, x, y):
+        self.pool = None  # Set by ObjectPool when the shockwave is pooled
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        # Restart the shockwave at a new position
         self.x = x
         self.y = y
         self.radius = 10
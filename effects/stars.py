@@ -1,8 +1,10 @@
 import pygame
-import random
 import math
 from config import constants
 from config.loader import Loader
+from core import rng
+from core import game_clock
+from core.culling import view_culler
 
 # Named constants for cloud positioning
 CLOUD_SPAWN_Y = -1000         # Y position where clouds spawn
@@ -38,28 +40,28 @@ class StarBackground:
         self.clouds = self.generate_initial_clouds(10)
 
         # Timer-based cloud spawning.
-        self.last_cloud_spawn_time = pygame.time.get_ticks()
-        self.cloud_spawn_interval = random.randint(CLOUD_SPAWN_INTERVAL_MIN, CLOUD_SPAWN_INTERVAL_MAX)
+        self.last_cloud_spawn_time = game_clock.get_ticks()
+        self.cloud_spawn_interval = rng.visuals.randint(CLOUD_SPAWN_INTERVAL_MIN, CLOUD_SPAWN_INTERVAL_MAX)
 
     # Generate regular stars as lists [x, y, size] (in-place updates)
     def generate_stars(self, count, sizes):
-        return [[random.randint(0, constants.SCREEN_WIDTH),
-                 random.randint(0, constants.SCREEN_HEIGHT),
-                 random.choice(sizes)] for _ in range(count)]
+        return [[rng.visuals.randint(0, constants.SCREEN_WIDTH),
+                 rng.visuals.randint(0, constants.SCREEN_HEIGHT),
+                 rng.visuals.choice(sizes)] for _ in range(count)]
 
     # Generate twinkling stars as lists [x, y, size, phase]
     def generate_twinkling_stars(self, count, sizes):
-        return [[random.randint(0, constants.SCREEN_WIDTH),
-                 random.randint(0, constants.SCREEN_HEIGHT),
-                 random.choice(sizes),
-                 random.uniform(0, 2 * math.pi)] for _ in range(count)]
+        return [[rng.visuals.randint(0, constants.SCREEN_WIDTH),
+                 rng.visuals.randint(0, constants.SCREEN_HEIGHT),
+                 rng.visuals.choice(sizes),
+                 rng.visuals.uniform(0, 2 * math.pi)] for _ in range(count)]
 
     # Update a star's vertical position; reset if off-screen.
     def update_star_position(self, star, speed):
         star[1] += speed
         if star[1] > constants.SCREEN_HEIGHT:
             star[1] = 0
-            star[0] = random.randint(0, constants.SCREEN_WIDTH)
+            star[0] = rng.visuals.randint(0, constants.SCREEN_WIDTH)
         return star
 
     # Update a twinkling star's position (preserving phase).
@@ -67,7 +69,7 @@ class StarBackground:
         star[1] += speed
         if star[1] > constants.SCREEN_HEIGHT:
             star[1] = 0
-            star[0] = random.randint(0, constants.SCREEN_WIDTH)
+            star[0] = rng.visuals.randint(0, constants.SCREEN_WIDTH)
         return star
 
     # Draw a regular star as a white rectangle.
@@ -132,16 +134,16 @@ class StarBackground:
 
     # Helper to get a random cloud image from the cached list.
     def load_random_cloud_image(self):
-        return random.choice(self.cloud_images)
+        return rng.visuals.choice(self.cloud_images)
 
     # Create a single cloud that spawns at y = CLOUD_SPAWN_Y.
     # The x position is random between -CLOUD_X_MARGIN and SCREEN_WIDTH + CLOUD_X_MARGIN.
     def create_random_cloud(self):
         cloud_image = self.load_random_cloud_image()
         rect = cloud_image.get_rect()
-        rect.x = random.randint(-CLOUD_X_MARGIN, constants.SCREEN_WIDTH + CLOUD_X_MARGIN)
+        rect.x = rng.visuals.randint(-CLOUD_X_MARGIN, constants.SCREEN_WIDTH + CLOUD_X_MARGIN)
         rect.y = CLOUD_SPAWN_Y
-        speed = random.uniform(0.5, 1.0)
+        speed = rng.visuals.uniform(0.5, 1.0)
         return cloud_image, rect, speed
 
     # Generate an initial set of clouds that are already on screen.
@@ -151,15 +153,16 @@ class StarBackground:
         for _ in range(count):
             cloud_image = self.load_random_cloud_image()
             rect = cloud_image.get_rect()
-            rect.x = random.randint(-CLOUD_X_MARGIN, constants.SCREEN_WIDTH + CLOUD_X_MARGIN)
-            rect.y = random.randint(CLOUD_SPAWN_Y, constants.SCREEN_HEIGHT)
-            speed = random.uniform(0.5, 1.0)
+            rect.x = rng.visuals.randint(-CLOUD_X_MARGIN, constants.SCREEN_WIDTH + CLOUD_X_MARGIN)
+            rect.y = rng.visuals.randint(CLOUD_SPAWN_Y, constants.SCREEN_HEIGHT)
+            speed = rng.visuals.uniform(0.5, 1.0)
             clouds.append((cloud_image, rect, speed))
         return clouds
 
     # Update and draw clouds:
     # - Spawn a new cloud when the spawn interval has elapsed.
     # - Move each cloud downward.
+    # - Skip the blit while a cloud is off-screen (they spawn far above the view).
     # - Remove clouds that have moved past CLOUD_DELETE_Y.
     def update_and_draw_clouds(self, screen, current_time):
         # Check if it's time to spawn a new cloud.
@@ -168,11 +171,12 @@ class StarBackground:
             self.clouds.append(new_cloud)
             # Reset the spawn timer and choose a new interval.
             self.last_cloud_spawn_time = current_time
-            self.cloud_spawn_interval = random.randint(CLOUD_SPAWN_INTERVAL_MIN, CLOUD_SPAWN_INTERVAL_MAX)
+            self.cloud_spawn_interval = rng.visuals.randint(CLOUD_SPAWN_INTERVAL_MIN, CLOUD_SPAWN_INTERVAL_MAX)
         updated_clouds = []
         for cloud_image, rect, speed in self.clouds:
             rect.y += speed
-            screen.blit(cloud_image, rect)
+            if view_culler.is_visible(rect, "clouds"):
+                screen.blit(cloud_image, rect)
             if rect.y <= CLOUD_DELETE_Y:
                 updated_clouds.append((cloud_image, rect, speed))
         self.clouds = updated_clouds
@@ -7,6 +7,8 @@ from enemies.enemy import Enemy
 
 
 class CheckpointDivider(Enemy):
+    __slots__ = ("id", "checkpoint_manager", "y", "checkpoint_text", "color", "triggered")
+
     def __init__(self, player, checkpoint_manager, checkpoint_id:int):
         super().__init__(player)
 
@@ -25,6 +27,14 @@ class CheckpointDivider(Enemy):
         self.y += self.speed  # Move down
         self.check_collision()
 
+        # Once the line has left the screen, move the rect below it too so the game removes the divider
+        if self.y > constants.SCREEN_HEIGHT:
+            self.rect.top = self.y
+
+    def draw_bounds(self):
+        # Dashed line across the screen with its label just above it
+        return pygame.Rect(0, self.y - 40, constants.SCREEN_WIDTH, 42)
+
     def draw(self, screen):
         self.draw_dashed_line(screen,(0, self.y), (constants.SCREEN_WIDTH, self.y))
 
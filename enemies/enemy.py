@@ -2,9 +2,11 @@ import string
 from enum import Enum
 import pygame
 import math
-import random
-from config import utils, constants
+from config import utils, constants, game_settings as settings
 from config.loader import Loader
+from core import rng
+from core.ring_buffer import RingBuffer
+from core.culling import view_culler
 
 
 # class DropType(Enum):
@@ -15,12 +17,29 @@ from config.loader import Loader
 
 # === Enemy Base Class (Mother Class) === #
 class Enemy:
-    def __init__(self, player):
+    # Fixed attribute layout (no per-instance __dict__); subclasses declare only what they add
+    __slots__ = (
+        "player", "selected", "alive", "handle", "store_index", "pool",
+        "image", "rect", "font", "word", "hit_count", "drop_count",
+        "velocity_x", "velocity_y", "friction",
+        "original_speed", "speed", "entry_speed",
+        "jet_effect", "jet_effect_length", "player_in_range", "on_screen",
+    )
+
+    def __init__(self, player, random_spawn=True):
+        # random_spawn=False skips the random word and position: pooled enemies (shells) get theirs in
+        # reset(), so a new and a recycled one draw the same random numbers
 
         # Basic init
         self.player = player
         self.selected = False
 
+        # Entity store bookkeeping (set by EntityStore.add)
+        self.alive = False
+        self.handle = None
+        self.store_index = -1
+        self.pool = None  # Set by ObjectPool for pooled enemies (shells)
+
 
         # Core attributes
         # self.image = pygame.image.load("assets/images/enemy_ships/alien_ship_0.png").convert_alpha()
@@ -28,9 +47,10 @@ class Enemy:
         self.rect = self.image.get_rect(center=(200, 200))
         # self.font = pygame.font.Font("assets/fonts/Righteous-Regular.ttf", 21)
         self.font = Loader.load_font("assets/fonts/Righteous-Regular.ttf", 21)
-        self.word = utils.generate_random_word(4,8)  # Default word if not provided
+        self.word = utils.generate_random_word(4,8) if random_spawn else ""  # Default word if not provided
         self.hit_count = max(len(self.word), 1)  # Hit count based on word length
-        self.set_position(height=50)  # Set the initial position on the screen
+        if random_spawn:
+            self.set_position(height=50)  # Set the initial position on the screen
 
         # Behavioral attributes
         self.drop_count = 0
@@ -45,8 +65,13 @@ class Enemy:
         self.speed = self.original_speed
         self.entry_speed = self.original_speed * 10  # Hyper-speed entry
 
-        self.jet_effect = []  # List to store previous positions
         self.jet_effect_length = 10  # Adjust for a longer or shorter trail
+        self.jet_effect = RingBuffer(self.jet_effect_length)  # Previous positions, oldest first
+
+        # Broadphase flag: the game clears this when the collision grid finds the enemy far from the player
+        self.player_in_range = True
+        # Culling flag: the game clears this while the enemy's draw bounds are off-screen
+        self.on_screen = True
 
 
 
@@ -55,18 +80,14 @@ class Enemy:
     def set_position(self, height):
         text_width, _ = self.font.size(self.word)  # Get text width for positioning
         max_x = constants.SCREEN_WIDTH - text_width - 20  # Max X within screen bounds
-        self.rect.x = random.randint(20, max_x)  # Random X position within the screen
+        self.rect.x = rng.gameplay.randint(20, max_x)  # Random X position within the screen
         self.rect.y = -self.rect.height - height  # Spawn just above the screen
 
     def move(self, game_over):
         """Handles enemy movement and stores previous positions for trail effect."""
 
-        # Save the current position for trail effect
-        self.jet_effect.append(self.rect.center)
-
-        # Limit the trail length to avoid excessive memory usage
-        if len(self.jet_effect) > self.jet_effect_length:
-            self.jet_effect.pop(0)
+        # Save the current position for trail effect (the ring buffer drops the oldest when full)
+        self.record_trail(self.rect.center)
 
         self.move_handle_pushback()  # Handle pushback if hit
 
@@ -85,16 +106,39 @@ class Enemy:
 
 
 
+    # === Trail bookkeeping (skipped while off-screen) === #
+    def record_trail(self, position):
+        if self.on_screen or not settings.cull_offscreen_trails:
+            self.jet_effect.append(position)
+        elif len(self.jet_effect):
+            self.jet_effect.clear()  # Don't show a stale trail when the enemy comes back into view
+
+    # === Screen area the enemy draws into (view culling) === #
+    def draw_bounds(self):
+        bounds = self.rect.copy()
+        if len(self.jet_effect):
+            # Straight-line trail: the oldest point is the far end
+            oldest = self.jet_effect[0]
+            bounds.union_ip(self.rect.move(oldest[0] - self.rect.centerx, oldest[1] - self.rect.centery))
+        if self.word:
+            # The word sits under the sprite and is kept inside the screen horizontally by draw_word()
+            bounds.union_ip((0, self.rect.bottom, constants.SCREEN_WIDTH, self.font.get_linesize()))
+        return bounds
+
     # === Draw the enemy on the screen === #
     def draw(self, screen):
         """Draws the enemy and its trail effect on the screen."""
 
         # Draw the trail effect (fade-out effect)
-        for i, pos in enumerate(self.jet_effect):
-            alpha = int(255 * (i / len(self.jet_effect)))  # Create a fading effect
+        trail_rect = self.rect.copy()
+        for fade, pos in self.jet_effect.fade_items():
+            trail_rect.center = pos
+            if not view_culler.is_visible(trail_rect, "trails"):
+                continue
+            alpha = int(255 * fade)  # Create a fading effect
             trail_surface = self.image.copy()
             trail_surface.set_alpha(alpha)  # Apply transparency
-            screen.blit(trail_surface, (pos[0] - self.rect.width // 2, pos[1] - self.rect.height // 2))
+            screen.blit(trail_surface, trail_rect.topleft)
 
         # Draw the enemy's main sprite
         screen.blit(self.image, self.rect.topleft)
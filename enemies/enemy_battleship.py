@@ -1,40 +1,42 @@
 import pygame
 import math
-import random
 
 from config import utils
 from config.loader import Loader
+from core import rng
+from core.ring_buffer import RingBuffer
+from core.culling import view_culler
 from enemies.enemy import Enemy
-from enemies.enemy_shell import EnemyShell
+from enemies.enemy_shell import shell_pool
 from enemies.enemy_sucide_drone import EnemySuicideDrone
 
 
 class EnemyBattleship(Enemy):
+    __slots__ = ("entry_done", "direction", "enemy_list")
+
     def __init__(self, player, enemy_list):
         super().__init__(player)  # Initialize using Enemy class
         # Load the battleship image using Loader
         self.image = Loader.load_image("assets/images/battleships/battleship_0.png")
         # Set a random starting X position and off-screen Y position
-        self.rect = self.image.get_rect(center=(random.randint(100, 700), -50))
+        self.rect = self.image.get_rect(center=(rng.gameplay.randint(100, 700), -50))
         self.speed = 2  # Movement speed
         self.entry_done = False  # Track entry completion
-        self.direction = random.choice([-1, 1])  # Random start direction (left or right)
+        self.direction = rng.gameplay.choice([-1, 1])  # Random start direction (left or right)
         self.jet_effect_length = 5  # Adjust jet effect length for smoother trail
         self.word = utils.generate_random_word(15,20)
 
-        # Store reference to the main enemy list (passed from main game)
+        # Store reference to the main enemy store (passed from main game); children go through its spawn queue
         self.enemy_list = enemy_list
 
-        # List to store previous positions for jet trail effect
-        self.jet_effect = []
+        # Previous positions for jet trail effect
+        self.jet_effect = RingBuffer(self.jet_effect_length)
 
     def move(self, game_over):
         """Handles Battleship movement: Entry, Shell & Drone Spawning, and Horizontal Patrol"""
 
         # Store previous positions for jet effect
-        self.jet_effect.append(self.rect.center)
-        if len(self.jet_effect) > self.jet_effect_length:
-            self.jet_effect.pop(0)
+        self.record_trail(self.rect.center)
 
         # === If game is over, move straight down ===
         if game_over:
@@ -53,11 +55,11 @@ class EnemyBattleship(Enemy):
         # Spawn a shell with a random horizontal drift.
         if self.entry_done and self.should_fire():
             new_shell = self.spawn_shell()
-            self.enemy_list.append(new_shell)
+            self.enemy_list.spawn(new_shell)
         # Spawn a suicide drone at the battleship's position.
         if self.entry_done and self.should_spawn_drone():
             new_drone = self.spawn_suicide_drone()
-            self.enemy_list.append(new_drone)
+            self.enemy_list.spawn(new_drone)
 
         # === After Entry: Move Left-Right Horizontally ===
         self.rect.x += self.speed * self.direction
@@ -75,11 +77,15 @@ class EnemyBattleship(Enemy):
         - Draws the battleship image and its associated word.
         """
         if not self.entry_done:
-            for i, pos in enumerate(self.jet_effect):
-                alpha = int(255 * (i / len(self.jet_effect)))  # Create a fading effect for the trail
+            trail_rect = self.rect.copy()
+            for fade, pos in self.jet_effect.fade_items():
+                trail_rect.topleft = (int(pos[0] - self.rect.width / 2), int(pos[1] - self.rect.height / 2))
+                if not view_culler.is_visible(trail_rect, "trails"):
+                    continue
+                alpha = int(255 * fade)  # Create a fading effect for the trail
                 trail_surface = self.image.copy()
                 trail_surface.set_alpha(alpha)
-                screen.blit(trail_surface, (int(pos[0] - self.rect.width / 2), int(pos[1] - self.rect.height / 2)))
+                screen.blit(trail_surface, trail_rect.topleft)
         # Draw the battleship image at its current position
         screen.blit(self.image, self.rect.topleft)
         # Draw the associated word (using method from the parent class)
@@ -87,17 +93,17 @@ class EnemyBattleship(Enemy):
 
     def spawn_shell(self):
         """
-        Create a new shell at the battleship's position.
+        Take a shell from the shared pool and place it at the battleship's position.
         The shell will have a random horizontal drift.
         """
-        return EnemyShell(self.player, self, horizontal_speed=random.choice([-2, -1, 0, 1, 2]))
+        return shell_pool.acquire(self.player, self, horizontal_speed=rng.gameplay.choice([-2, -1, 0, 1, 2]))
 
     def should_fire(self):
         """
         Determine if the battleship should fire a shell.
         For demonstration purposes, we use a random chance.
         """
-        return random.random() < 0.01  # Adjust probability as needed
+        return rng.gameplay.random() < 0.01  # Adjust probability as needed
 
     def spawn_suicide_drone(self):
         """
@@ -113,4 +119,4 @@ class EnemyBattleship(Enemy):
         Determine if the battleship should spawn a suicide drone.
         For demonstration purposes, we use a random chance.
         """
-        return random.random() < 0.005  # Adjust probability as needed
+        return rng.gameplay.random() < 0.005  # Adjust probability as needed
@@ -1,17 +1,18 @@
-import random
 import pygame
 import math
 from config import constants, utils
+from core import rng
 from enemies.enemy import Enemy
 
 
 class EnemyClusterBomb(Enemy):
+    __slots__ = ("angle", "entry_done", "bomb_activation_distance", "pulse", "pulse_direction")
 
     def __init__(self, player):
         super().__init__(player)
         # Set initial position: random X between 50 and screen width-50, off-screen Y (-50)
         self.rect = pygame.Rect(
-            random.randint(50, constants.SCREEN_WIDTH - 50), -50,
+            rng.gameplay.randint(50, constants.SCREEN_WIDTH - 50), -50,
             20,20  # Enemy size is small
         )
         # self.word = "badname"  # Label or identifier for the enemy
@@ -57,10 +58,12 @@ class EnemyClusterBomb(Enemy):
             self.rect.y += self.speed * 2
             return
 
-        # Get vector information to the player.
-        _, _, distance, ndx, ndy = self._get_vector_to_player()
+        # Get vector information to the player (skipped when the collision grid says it is far away).
+        distance = None
+        if self.player_in_range:
+            _, _, distance, ndx, ndy = self._get_vector_to_player()
 
-        if distance > self.bomb_activation_distance:
+        if distance is None or distance > self.bomb_activation_distance:
             # If far from the player, move straight down.
             self.rect.y += self.speed
         else:
@@ -84,6 +87,11 @@ class EnemyClusterBomb(Enemy):
         if self.pulse > 2 or self.pulse < -2:
             self.pulse_direction *= -1  # Reverse the pulse direction at bounds
 
+    def draw_bounds(self):
+        # The activation aura is drawn around the core, and the dotted line stays inside it
+        aura = self.bomb_activation_distance
+        return super().draw_bounds().union(self.rect.inflate(2 * aura, 2 * aura))
+
     def draw(self, screen):
         """
         Render the enemy on the screen by drawing its glowing effect,
@@ -113,6 +121,8 @@ class EnemyClusterBomb(Enemy):
         If the enemy is within the bomb activation distance from the player,
         draw a dotted line from the enemy to the player.
         """
+        if not self.player_in_range:
+            return
         # Calculate the distance to the player.
         _, _, distance, _, _ = self._get_vector_to_player()
         if distance < self.bomb_activation_distance:
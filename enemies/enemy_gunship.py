@@ -1,26 +1,34 @@
-import random
 import math
 import pygame
 
 from config import constants
 from config.loader import Loader
+from core import rng
+from core.ring_buffer import RingBuffer
+from core.culling import view_culler
 from enemies.enemy import Enemy
 # Note: Removed EnemyBullet and bullet_manager references
 
 
 class EnemyGunship(Enemy):
+    __slots__ = (
+        "player_x_history", "delay_frames",
+        "oscillation_range", "oscillation_speed", "oscillation_offset", "follow_speed",
+        "is_show_flame_effect", "fall_speed", "stop_at", "enemy_list",
+    )
+
     def __init__(self, player, enemy_list):
         super().__init__(player)
 
-        random_number = random.randint(1, 5)
+        random_number = rng.gameplay.randint(1, 5)
         # Load the enemy gunship image using Loader
         self.image = Loader.load_image(f"assets/images/enemy_ships/enemyRed{random_number}.png")
         # Start off-screen (centered at X=400; adjust as needed)
         self.rect = self.image.get_rect(center=(400, 0))
 
         # === We need this to follow player's movements ===
-        self.player_x_history = []  # Store past x-positions of the player
         self.delay_frames = 20  # How many frames behind the enemy follows
+        self.player_x_history = RingBuffer(self.delay_frames)  # Past x-positions of the player
 
         self.oscillation_range = 100  # How far it moves left and right
         self.oscillation_speed = 0.04  # Controls oscillation speed (lower = slower)
@@ -30,12 +38,12 @@ class EnemyGunship(Enemy):
         # Just jet effect
         self.is_show_flame_effect = True  # Flag to show flame effect during fall
         self.fall_speed = 10  # Initial fast drop; speed becomes normal later
-        self.jet_effect = []  # Store positions for jet trail effect
         self.jet_effect_length = 15  # Number of trail points to display
+        self.jet_effect = RingBuffer(self.jet_effect_length)  # Store positions for jet trail effect
         self.stop_at = 50  # Stop moving down at this Y position
 
         # Removed bullet_manager and shooting timers;
-        # Store reference to the main enemy list to add shells directly
+        # Store reference to the main enemy store; shells go through its deferred spawn queue
         self.enemy_list = enemy_list
 
     # Removed the 'shoot' method since we're replacing it with shell spawning
@@ -58,10 +66,9 @@ class EnemyGunship(Enemy):
         else:
             self.is_show_flame_effect = False
             # Store player's x-position history for delayed following
-            self.player_x_history.append(self.player.rect.centerx)
-            if len(self.player_x_history) > self.delay_frames:
-                delayed_x = self.player_x_history.pop(0)  # Get the oldest x-position
-            else:
+            # Once the buffer is full, appending hands back the x-position from delay_frames ago
+            delayed_x = self.player_x_history.append(self.player.rect.centerx)
+            if delayed_x is None:
                 delayed_x = self.player.rect.centerx  # Fallback if not enough data
 
             # Oscillation logic for horizontal movement
@@ -82,32 +89,32 @@ class EnemyGunship(Enemy):
             # Once the gunship has finished falling (flame effect off), attempt to fire a shell.
             if self.should_fire():
                 new_shell = self.spawn_shell()
-                self.enemy_list.append(new_shell)
+                self.enemy_list.spawn(new_shell)
 
         # Store jet trail positions only when moving downward
         if self.rect.y < self.stop_at:
-            self.jet_effect.append((self.rect.centerx, self.rect.centery))
-            if len(self.jet_effect) > self.jet_effect_length:
-                self.jet_effect.pop(0)  # Keep the trail length fixed
+            self.record_trail((self.rect.centerx, self.rect.centery))  # Ring buffer keeps the length fixed
 
         # Handle pushback if hit (assumed to be implemented in the parent or elsewhere)
         self.move_handle_pushback()
 
     def spawn_shell(self):
-        """Spawn a new shell at the gunship's current position."""
-        from enemies.enemy_shell import EnemyShell  # Import here if not already imported at top
-        return EnemyShell(self.player, self)
+        """Take a shell from the shared pool and place it at the gunship's current position."""
+        from enemies.enemy_shell import shell_pool  # Import here if not already imported at top
+        return shell_pool.acquire(self.player, self)
 
     def should_fire(self):
         """Determine if the gunship should fire a shell.
            Using a random chance for demonstration purposes."""
-        return random.random() < 0.01  # Adjust probability as needed
+        return rng.gameplay.random() < 0.01  # Adjust probability as needed
 
     def draw(self, screen):
         """ Draw the enemy and its trail effect. """
         if self.is_show_flame_effect:
-            for i, pos in enumerate(self.jet_effect):
-                alpha = int(255 * (i / len(self.jet_effect)))  # Create a fade effect for the trail
+            for fade, pos in self.jet_effect.fade_items():
+                if not view_culler.is_visible((pos[0] - 5, pos[1] - 5, 10, 10), "trails"):
+                    continue
+                alpha = int(255 * fade)  # Create a fade effect for the trail
                 trail_surface = pygame.Surface((10, 10), pygame.SRCALPHA)
                 pygame.draw.circle(trail_surface, (0, 255, 255, alpha), (5, 5), 5)
                 screen.blit(trail_surface, (pos[0] - 5, pos[1] - 5))
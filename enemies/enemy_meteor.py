@@ -1,34 +1,44 @@
 import pygame
 from config import constants
 import math
-import random
 from enemies.enemy import Enemy
 from config.loader import Loader
+from core import rng
+from core.startup_tracer import startup
 
 
 def load_words():
     txt_path = Loader.resource_path("config/meteor_names.txt")
-    with open(txt_path, "r", encoding="utf-8") as file:
+    with startup.section("asset", "config/meteor_names.txt"), open(txt_path, "r", encoding="utf-8") as file:
         words = [word for line in file for word in line.strip().split()]
-    random.shuffle(words)
-    return words
+    return words  # File order; EnemyMeteor.shuffle_words() shuffles it per session from the seed
 
 
 # ENEMY_METEOR CLASS (CHILD OF ENEMY)
 class EnemyMeteor(Enemy):
-    WORD_LIST = load_words()  # Global word list for all EnemyMeteor instances
+    __slots__ = ("is_target_player", "rotate", "rotate_direction", "original_image", "dx", "dy")
+
+    BASE_WORD_LIST = load_words()  # Words in file order
+    WORD_LIST = list(BASE_WORD_LIST)  # Global word list for all EnemyMeteor instances
     word_index = 0  # Shared index to iterate through WORD_LIST
 
+    @classmethod
+    def shuffle_words(cls):
+        # Called by the game after seeding, so the word order only depends on the seed
+        cls.WORD_LIST = list(cls.BASE_WORD_LIST)
+        rng.words.shuffle(cls.WORD_LIST)
+        cls.word_index = 0
+
     def __init__(self, player, target_player=False):
         super().__init__(player)  # Call the base class constructor
 
         self.is_target_player = target_player
 
         # Set a random speed for the meteor
-        self.speed = random.uniform(1.5, 3.5)
+        self.speed = rng.gameplay.uniform(1.5, 3.5)
         self.rotate = 0  # Initial rotation angle
 
-        self.rotate_direction = random.choice([-1, 1])
+        self.rotate_direction = rng.gameplay.choice([-1, 1])
 
         # Assign a word from the global WORD_LIST to this meteor
         if EnemyMeteor.word_index < len(EnemyMeteor.WORD_LIST):
@@ -39,10 +49,10 @@ class EnemyMeteor(Enemy):
             self.word = EnemyMeteor.WORD_LIST[EnemyMeteor.word_index][:15]
 
         # Set ammo drop count based on word length
-        self.drop_count = random.randint(len(self.word), len(self.word) + 10)
+        self.drop_count = rng.gameplay.randint(len(self.word), len(self.word) + 10)
 
         # Load and set meteor image
-        rand_num = random.randint(0, 19)
+        rand_num = rng.gameplay.randint(0, 19)
         # self.original_image = pygame.image.load(f"assets/images/meteors/meteor_{rand_num}.png").convert_alpha()
         self.original_image = Loader.load_image(f"assets/images/meteors/meteor_{rand_num}.png")
         self.image = self.original_image
@@ -52,12 +62,12 @@ class EnemyMeteor(Enemy):
         # self.rect = pygame.Rect(0, 0, 40, 40)
 
         self.rect = self.image.get_rect()
-        self.rect.x = random.randint(50, constants.SCREEN_WIDTH - 50)
+        self.rect.x = rng.gameplay.randint(50, constants.SCREEN_WIDTH - 50)
         self.rect.y = -150
 
 
         # Calculate falling direction using a random angle
-        angle = random.uniform(-30, 30)  # Angle range for diagonal movement
+        angle = rng.gameplay.uniform(-30, 30)  # Angle range for diagonal movement
         radians = math.radians(angle)
         self.dx = math.sin(radians) * self.speed
         self.dy = math.cos(radians) * self.speed
@@ -116,6 +126,10 @@ class EnemyMeteor(Enemy):
     #     self.rect.y += self.dy  # Move meteor along the y-axis
     #     self.rotate += self.rotate_direction   # Increase rotation angle for visual effect
 
+    def draw_bounds(self):
+        # The rotated sprite can be up to ~1.5x wider than the rect
+        return super().draw_bounds().inflate(self.rect.width // 2, self.rect.height // 2)
+
     # Override draw methods
     def draw(self, screen):
         rotated_image = pygame.transform.rotate(self.image, self.rotate)  # Rotate the meteor image
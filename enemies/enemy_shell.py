@@ -3,29 +3,51 @@ from math import sin
 from config import utils, constants
 from config.loader import Loader
 from enemies.enemy import Enemy
+from config import game_settings as settings
+from core.object_pool import ObjectPool
 
 
 class EnemyShell(Enemy):
+    __slots__ = ("is_round", "speed_x", "diameter", "outer_min_radius", "outer_max_radius", "size_phase")
+
     def __init__(self, player, battleship, horizontal_speed=0, is_round=False):
-        super().__init__(player)
-        self.is_round = is_round  # Boolean to determine shape type
+        super().__init__(player, random_spawn=False)  # reset() draws the word, as for a recycled shell
+        self.is_round = None  # Shape is built by reset()
+        self.reset(player, battleship, horizontal_speed, is_round)
+
+    def reset(self, player, battleship, horizontal_speed=0, is_round=False):
+        """
+        Re-arm the shell at the battleship's position.
+        Pooled shells come back through here, so the Enemy image and font are not loaded again.
+        """
+        self.player = player
+        self.selected = False
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.player_in_range = True
+        self.on_screen = True
         self.speed = 5  # Vertical speed (drop rate)
         self.speed_x = horizontal_speed  # Horizontal drift speed
         self.word = utils.generate_random_letter()
+        self.hit_count = 1
+
+        if is_round != self.is_round:
+            self.is_round = is_round  # Boolean to determine shape type
+            if self.is_round:
+                # For round shells, use a circular design with an animated outer yellow circle.
+                self.diameter = 20  # Overall surface size
+                self.image = pygame.Surface((self.diameter, self.diameter), pygame.SRCALPHA)
+                # Outer circle oscillates between a minimum and maximum radius.
+                self.outer_min_radius = 7  # Minimum radius for the yellow circle
+                self.outer_max_radius = self.diameter // 2  # Maximum radius (10 if diameter is 20)
+            else:
+                # For square (rectangular) shells, use a fixed rectangle.
+                self.image = pygame.Surface((5, 20))
+                self.draw_square_bullet()
 
         if self.is_round:
-            # For round shells, use a circular design with an animated outer yellow circle.
-            self.diameter = 20  # Overall surface size
-            self.image = pygame.Surface((self.diameter, self.diameter), pygame.SRCALPHA)
-            # Outer circle oscillates between a minimum and maximum radius.
-            self.outer_min_radius = 7  # Minimum radius for the yellow circle
-            self.outer_max_radius = self.diameter // 2  # Maximum radius (10 if diameter is 20)
             self.size_phase = 0.0  # Phase for oscillation of the outer circle size
             self.draw_round_bullet()
-        else:
-            # For square (rectangular) shells, use a fixed rectangle.
-            self.image = pygame.Surface((5, 20))
-            self.draw_square_bullet()
 
         # Position the shell at the battleship's center.
         self.rect = self.image.get_rect(center=battleship.rect.center)
@@ -74,3 +96,7 @@ class EnemyShell(Enemy):
             # Apply horizontal drift and vertical drop.
             self.rect.x += self.speed_x
             self.rect.y += self.speed
+
+
+# Shared by gunships and battleships; dead shells are handed back by EntityStore.compact()
+shell_pool = ObjectPool(EnemyShell, settings.pool_high_water["EnemyShell"])
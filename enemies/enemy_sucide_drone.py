@@ -1,9 +1,9 @@
-import random
 import string
 
 import pygame
 import math
 from config import constants, utils
+from core import rng
 from enemies.enemy import Enemy
 
 class EnemySuicideDrone(Enemy):
@@ -12,6 +12,8 @@ class EnemySuicideDrone(Enemy):
     it draws a guiding line to the player and homes directly toward them.
     Its appearance is a pulsating, plane-like shape that always points toward the player.
     """
+    __slots__ = ("angle", "pulse", "pulse_direction")
+
     def __init__(self, player):
         """
         Initialize the drone with a random horizontal start position (off-screen vertically),
@@ -19,12 +21,12 @@ class EnemySuicideDrone(Enemy):
         """
         super().__init__(player)
         self.rect = pygame.Rect(
-            random.randint(50, constants.SCREEN_WIDTH - 50),
+            rng.gameplay.randint(50, constants.SCREEN_WIDTH - 50),
             -50,
             30, 30  # Adjust size as needed
         )
-        self.word = ''.join(random.choices(string.ascii_lowercase, k=3))  # Optional label
-        self.speed = random.uniform(2, 4)  # Drone's speed
+        self.word = ''.join(rng.words.choices(string.ascii_lowercase, k=3))  # Optional label
+        self.speed = rng.gameplay.uniform(2, 4)  # Drone's speed
         self.angle = 0  # Angle the drone is facing; used for rotating the shape
         self.pulse = 0  # Controls the pulsating effect magnitude
         self.pulse_direction = 1  # Determines whether the pulse is increasing or decreasing
@@ -83,6 +85,14 @@ class EnemySuicideDrone(Enemy):
         if self.pulse > 2 or self.pulse < -2:
             self.pulse_direction *= -1
 
+    def draw_bounds(self):
+        # Pulsing shape around the center, plus the guiding line to the player once on screen
+        size = 2 * (10 + self.pulse)
+        bounds = super().draw_bounds().union(self.rect.inflate(size, size))
+        if self.rect.y >= 0:
+            bounds.union_ip(self.player.rect)
+        return bounds
+
     def draw(self, screen):
         """
         Draw the drone on the screen.
@@ -1,5 +1,8 @@
-import random
+import datetime
+import os
 import sys
+import time
+from collections import deque
 
 import pygame
 
@@ -20,27 +23,83 @@ from shooting.bullet_manager import BulletManager
 from menu_screens.in_game_menu import InGameMenu
 from game_window import GameWindow
 from campaign import jcon
+from campaign.timeline import open_campaign
+from campaign.endless import GeneratedTimeline, endless_waves
+from campaign.scheduler import CampaignScheduler, MAIN_TRACK
+from core.entity_store import EntityStore
+from core.object_pool import report_pools
+from core.spatial_hash import SpatialHash
+from core import game_clock
+from core.replay import ReplayRecorder
+from core.hit_stop import HitStop
+from core.culling import view_culler
+from core.auto_typer import AutoTyper
+from core.persistence import writer
+from core.profiler import profiler
+from core.alloc_tracker import alloc_tracker
+from core import snapshot
+from core import rng
+from effects.stars import StarBackground
 
 
 # ----------------- Game Class (Main Game Logic) -----------------
 class Game:
-    def __init__(self, checkpoint_selected, star_background, screen=None):
-        pygame.init()
+    def __init__(self, checkpoint_selected, star_background=None, screen=None,
+                 headless=False, clock=None, checkpoint_manager=None, seed=None):
+        # Headless: no window and no mixer, time comes from `clock` and the game is driven with step()
+        self.headless = headless
+        if headless:
+            pygame.font.init()  # Fonts are the only pygame module the simulation needs
+        else:
+            pygame.init()
 
         if screen is None:
-            self.screen = pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+            if headless:
+                self.screen = pygame.Surface((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+            else:
+                self.screen = pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
         else:
             self.screen = screen
 
+        # Gameplay time source: real time sampled once per frame, or a ManualClock advanced by step() when headless
+        if clock is None:
+            clock = game_clock.ManualClock() if headless else game_clock.FrameClock()
+        self.time_source = clock
+        game_clock.set_clock(clock)
+
+        self.render = not headless  # False runs the simulation without drawing anything
+        self.held_keys = set()      # Keys held down, tracked from KEYDOWN/KEYUP events
+        self.read_keyboard = not headless  # False moves the player from held_keys (headless runs, replays)
+        self.show_cull_stats = False  # F7: last frame's culling counters in the corner
+
+        # Fast-forward: several simulation frames per displayed frame, drawing only some of them (see run_fast_forward)
+        self.fast_forward = 1
+        self.fast_forward_render_every = settings.fast_forward_render_every
+        self.fast_forward_until = settings.fast_forward_until
+        self.auto_typer = AutoTyper()  # Types during fast-forward when settings.fast_forward_autoplay is on
+        self.frames_displayed = 0
+
+        # Seed the gameplay/visuals/words streams: the same seed and inputs replay the same session
+        self.seed = rng.seed(seed)
+        EnemyMeteor.shuffle_words()
+        print(f"Random seed {self.seed}")
+
+        if star_background is None:
+            star_background = StarBackground()
+
         # self.screen = pygame.display.set_mode(
         #     (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)
         # )
         self.clock = pygame.time.Clock()  # Controls FPS
 
         self.player = Player()  # Create the player object
-        self.bullets_manager = BulletManager(self.player)  # Bullet manager
+        self.hit_stop = HitStop()  # Kill feedback: briefly freezes the simulation, not the main loop
+        self.bullets_manager = BulletManager(self.player, self.hit_stop)  # Bullet manager
         self.stars = star_background  # Star background effect for gameplay
-        self.enemy_list: list[Enemy] = []  # List to store enemy objects
+        self.enemy_list = EntityStore()  # Live enemies (O(1) kill and membership, deferred spawns)
+        self.enemy_list.kill_listeners.append(self.on_enemy_killed)
+        self.collision_grid = SpatialHash(constants.COLLISION_CELL_SIZE)  # Broadphase, rebuilt once per tick
+        self.enemies_near_player = set()  # Enemies the grid found within proximity_query_radius last tick
 
 
 
@@ -49,35 +108,47 @@ class Game:
         self.game_window = GameWindow(self.screen, self.player)  # HUD/info window
         self.game_over = False      # Game over a flag
         self.paused = False         # Pause flag
-        self.start_time = pygame.time.get_ticks()  # Record game start time
+        self.start_time = game_clock.get_ticks()  # Record game start time
 
-        # Set time for the next meteor spawn using a random interval
+        # Campaign-clock time of the next meteor spawn, using a random interval
         self.next_meteor_spawn_time = self.get_next_meteor_spawn_delay()
         self.meteor_shower = False # When True Start spawning meteors
         # Additional game state variables
         self.enemy_selection_mode = False # if True player needs to select the enemy first before shooting
         self.selected_enemy = None  # Currently focused on an enemy
 
-        self.is_boss_active = False  # Temp way to tigger the end of a Boss fight so that a campaign can continue
+        self.bosses_alive = 0  # Gunships/battleships in play; "boss_defeated" is signalled when this drops to 0
 
         # Campaign Management
-        self.checkpoint_manager = CheckpointManager()
-        self.game_campaign_event_list = {}
-        self.last_campaign_event_time = 0
-        self.next_campaign_event_index = 0
+        self.checkpoint_manager = checkpoint_manager or CheckpointManager()
+        self.timeline = None                # Compiled settings.campaign_file (shared, read-only)
+        self.campaign = None                # CampaignScheduler playing the tracks, its clock stands still while paused
+        self.main_track = None              # The "events" track, its index is the campaign progress
+        self.last_campaign_tick = 0         # game_clock ticks at the last process_json_campaign()
+        self.frame_time_ms = 0.0            # Smoothed update_frame() time, part of the endless-mode frame load
 
         # # Checkpoint handling
-
-        self.checkpoint_map = {}
         self.load_game_campaign(checkpoint_selected)
 
         # Upgrade window screen
         self.upgrade_window = UpgradeWindow(self.screen)
 
+        # Input recording for replays (saved when the game is left)
+        self.recorder = None
+        if settings.record_replay:
+            self.start_recording(checkpoint_selected)
+
+        # World snapshots every snapshot_interval ms of game time, kept for rewinding (see core/snapshot.py)
+        self.snapshots = deque(maxlen=settings.snapshot_history)  # (ticks, snapshot bytes), newest last
+        self.next_snapshot_time = game_clock.get_ticks() + settings.snapshot_interval
+
+        if settings.fast_forward > 1:
+            self.set_fast_forward(settings.fast_forward)
+
 
     def reset_game(self):
         # Reset game state for a new game session
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
 
         # Resetting Player
         self.player = Player()
@@ -95,15 +166,18 @@ class Game:
 
 
 
-        self.bullets_manager = BulletManager(self.player)
+        self.hit_stop = HitStop()
+        self.bullets_manager = BulletManager(self.player, self.hit_stop)
         self.enemy_list.clear()
+        self.collision_grid.clear()
+        self.enemies_near_player = set()
 
         # Resetting Enemy
         self.next_meteor_spawn_time = self.get_next_meteor_spawn_delay()
         self.meteor_shower = False
         self.selected_enemy = None
 
-        self.is_boss_active = False  # Temp way to tigger the end of a Boss fight so that a campaign can continue
+        self.bosses_alive = 0
 
         # Reset campaign events so they start from the beginning
         # self.triggered_events.clear()
@@ -114,28 +188,20 @@ class Game:
 
 
     def load_game_campaign(self,checkpoint_level):
-        data = Loader.load_json("campaign/game_event.json")
-        self.game_campaign_event_list = data["events"]  # Extract the list of events from the JSON data
-        # self.next_campaign_event_index = start_from_index  # Reset the event index from 0
-
-        self.build_checkpoint_map()
-        checkpoint_index = self.checkpoint_map.get(f"{checkpoint_level}")
-        self.next_campaign_event_index = checkpoint_index
-
-        self.last_campaign_event_time = pygame.time.get_ticks()  # Record the current time for delays
-
-    def build_checkpoint_map(self):
+        # Compiled once per campaign file and cached (see campaign/timeline.py), so "Load Last Checkpoint" is a seek
+        # (.jsonl campaigns are streamed instead, see campaign/streaming.py)
+        if self.timeline is not None:
+            self.timeline.close()
+        if settings.endless_mode:
+            self.timeline = GeneratedTimeline(endless_waves(self.live_frame_load))  # Waves generated as they are needed
+        else:
+            self.timeline = open_campaign(settings.campaign_file)
+        checkpoint_index, _ = self.timeline.checkpoint_start(checkpoint_level)
 
-        for index, event in enumerate(self.game_campaign_event_list):
-            action = event.get("action", {})
-            # Check if the action contains a 'checkpoint'
-            if "checkpoint" in action:
-                checkpoint_info = action["checkpoint"]
-                # Ensure checkpoint_info is a dictionary and has an 'id'
-                if isinstance(checkpoint_info, dict) and "id" in checkpoint_info:
-                    checkpoint_id = checkpoint_info["id"]
-                    self.checkpoint_map[checkpoint_id] = index
+        self.campaign = CampaignScheduler(self.handle_json_event)
+        self.main_track = self.campaign.start_track(MAIN_TRACK, self.timeline, checkpoint_index)
 
+        self.last_campaign_tick = game_clock.get_ticks()  # Record the current time for delays
 
 
     def handle_json_event(self, json_campaign_data):
@@ -150,32 +216,36 @@ class Game:
     def spawn_entities(self, json_campaign_data):
         # Execute game actions based on the keys in the action data
         for key, jsonObject in json_campaign_data.items():
+            profiler.instant("campaign", action=key, data=jsonObject)
 
             if self.player.health > 0 and not self.paused:
                 if key == "spawn":
 
                     # Spawn an enemy based on its type
                     if jsonObject[jcon.ENEMY_TYPE] == jcon.EnemyType.ENEMY_METEOR:
-                        self.enemy_list.append(EnemyMeteor(self.player,target_player=True))
+                        self.enemy_list.add(EnemyMeteor(self.player,target_player=True))
 
                     elif jsonObject[jcon.ENEMY_TYPE] == jcon.EnemyType.ENEMY_PROXIMITY_MINE:
-                        self.enemy_list.append(EnemyProximityMines(self.player))
+                        self.enemy_list.add(EnemyProximityMines(self.player))
 
                     elif jsonObject[jcon.ENEMY_TYPE] == jcon.EnemyType.ENEMY_CLUSTER_BOMB:
-                        self.enemy_list.append(EnemyClusterBomb(self.player))
+                        self.enemy_list.add(EnemyClusterBomb(self.player))
 
                     elif jsonObject[jcon.ENEMY_TYPE] == jcon.EnemyType.ENEMY_SUICIDE_DRONE:
-                        self.enemy_list.append(EnemySuicideDrone(self.player))
+                        self.enemy_list.add(EnemySuicideDrone(self.player))
 
                     elif jsonObject[jcon.ENEMY_TYPE] == jcon.EnemyType.ENEMY_GUNSHIP:
-                        self.enemy_list.append(EnemyGunship(self.player, self.enemy_list))
-                        self.is_boss_active = True
+                        self.enemy_list.add(EnemyGunship(self.player, self.enemy_list))
+                        self.bosses_alive += 1
+                        self.campaign.wait("boss_defeated")  # This track carries on once the boss is gone
 
                     elif jsonObject[jcon.ENEMY_TYPE] == jcon.EnemyType.ENEMY_BATTLESHIP:
-                        self.enemy_list.append(EnemyBattleship(self.player, self.enemy_list))
-                        self.is_boss_active = True
+                        self.enemy_list.add(EnemyBattleship(self.player, self.enemy_list))
+                        self.bosses_alive += 1
+                        self.campaign.wait("boss_defeated")
 
                     print(f"({key}) Enemy-spawn {jsonObject[jcon.ENEMY_TYPE]}")
+                    self.check_fast_forward_target(jsonObject[jcon.ENEMY_TYPE])
 
                 elif key == "message":
                     # Display a message on the game window
@@ -206,7 +276,30 @@ class Game:
 
                     id = int(jsonObject["id"])
                     print(f"Starting from checkpoint id {id}")
-                    self.enemy_list.append(CheckpointDivider(self.player, self.checkpoint_manager, id))
+                    self.enemy_list.add(CheckpointDivider(self.player, self.checkpoint_manager, id))
+                    self.check_fast_forward_target(str(id))
+
+                elif key == "track":
+                    # Start another track from game_event.json "tracks", running alongside this one
+                    name = jsonObject["name"]
+                    if name in self.timeline.tracks:
+                        self.campaign.start_track(name, self.timeline.tracks[name])
+                    else:
+                        print(f"Unknown campaign track '{name}'")
+
+                elif key == "repeat":
+                    # Repeating emitter: run "action" now and then every "every" ms, "count" times (or until stopped)
+                    self.campaign.start_emitter(jsonObject["id"], jsonObject["action"],
+                                                jsonObject["every"], jsonObject.get("count"))
+
+                elif key == "stop":
+                    self.campaign.stop(jsonObject["id"])  # A track or an emitter
+
+                elif key == "wait":
+                    self.campaign.wait(jsonObject["condition"])  # e.g. "boss_defeated"
+
+                elif key == "signal":
+                    self.campaign.signal(jsonObject["condition"])
 
 
                     # if isinstance(jsonObject["action"], dict):
@@ -220,22 +313,31 @@ class Game:
 
 
     def process_json_campaign(self):
-        # Don't process campaign events while paused
+        current_time = game_clock.get_ticks()  # Current time in milliseconds
+        # Simulation time: frozen or slowed down like everything else during a hit-stop
+        elapsed = self.hit_stop.scaled_elapsed(self.last_campaign_tick, current_time)
+        self.last_campaign_tick = current_time
+
+        # The campaign clock stands still while paused, so the events after the pause keep their delays
         if self.paused:
             return
+        # Fire every action that is due by now, on every track (tracks waiting on a boss are off the queue)
+        self.campaign.advance(elapsed)
 
-        # Check if there's an active enemy that's still alive
-        if self.is_boss_active:
-            return
+    def live_frame_load(self):
+        # What is on screen now, in endless_frame_costs units; "full" while windowed frames run over budget
+        if not self.headless and self.frame_time_ms > settings.endless_frame_budget_ms:
+            return float("inf")
+        costs = settings.endless_frame_costs
+        return sum(costs.get(type(enemy).__name__, 1.0) for enemy in self.enemy_list)
 
-        current_time = pygame.time.get_ticks()  # Current time in milliseconds
-        if self.next_campaign_event_index < len(self.game_campaign_event_list):  # If there are remaining events
-            next_event = self.game_campaign_event_list[self.next_campaign_event_index]
-            delay = next_event.get("delay", 0)  # Get the event's delay (ms)
-            if current_time - self.last_campaign_event_time >= delay:
-                self.handle_json_event(next_event["action"])  # Trigger the event action
-                self.last_campaign_event_time = current_time  # Update reference time
-                self.next_campaign_event_index += 1  # Move to the next event
+    def on_enemy_killed(self, enemy):
+        # EntityStore kill listener: shot down, rammed or gone off-screen
+        profiler.instant("kill", enemy=type(enemy).__name__, handle=enemy.handle)
+        if isinstance(enemy, (EnemyGunship, EnemyBattleship)):
+            self.bosses_alive -= 1
+            if self.bosses_alive == 0:
+                self.campaign.signal("boss_defeated")
 
 
 
@@ -251,17 +353,50 @@ class Game:
             # self.paused = not self.paused  # Toggle pause state
             # self.upgrade_window.toggle()
 
+        elif event.key == pygame.K_F5 and settings.practice_mode:
+            self.take_snapshot()
+            print(f"Snapshot taken at {game_clock.get_ticks() / 1000:.1f} s")
+
+        elif event.key == pygame.K_F6 and settings.practice_mode:
+            self.rewind()
+
+        elif event.key == pygame.K_F2:
+            alloc_tracker.toggle_overlay()  # Surface allocations per frame by caller (needs settings.alloc_tracking)
+
+        elif event.key == pygame.K_F3:
+            profiler.toggle_overlay()  # Per-phase frame timings in the bottom-left corner
+
+        elif event.key == pygame.K_F4:
+            profiler.toggle_trace()  # Start/stop recording a Chrome trace of the next frames
+
+        elif event.key == pygame.K_F7:
+            self.show_cull_stats = not self.show_cull_stats
+
+        elif event.key == pygame.K_F9:
+            report_pools()  # Allocations avoided by the object pools
+            print(writer.report())  # Background save queue depth and flush latency
+            if profiler.enabled:
+                print(profiler.report())
+
+        elif event.key == pygame.K_F8:
+            # Drawing while fast-forwarding: every k-th frame <-> not at all
+            self.fast_forward_render_every = 0 if self.fast_forward_render_every else max(settings.fast_forward_render_every, 1)
+            print(f"Fast-forward drawing every {self.fast_forward_render_every or 'no'} frame(s)")
+
         elif event.key == pygame.K_F10:
-            # self.reset_game()
-            # self.load_game_campaign(start_from_index=15)
-            self.next_campaign_event_index = 15
-            print("F10 pressed!")
+            # Fast-forward: next speed, Shift+F10 back to 1x
+            if event.mod & pygame.KMOD_SHIFT:
+                self.set_fast_forward(1)
+            else:
+                speeds = settings.fast_forward_speeds
+                self.set_fast_forward(speeds[(speeds.index(self.fast_forward) + 1) % len(speeds)]
+                                      if self.fast_forward in speeds else speeds[0])
         elif event.key == pygame.K_F11:
             # checkpoints = self.checkpoint_manager.load_checkpoints()
             self.checkpoint_manager.print_checkpoints()
 
         elif event.key == pygame.K_INSERT:
-            pygame.image.save(self.screen, "screenshot.png")
+            writer.save_surface(self.screen, "screenshot.png")  # Saved off the game thread
 
         elif event.key == pygame.K_TAB:
             if self.selected_enemy:
@@ -337,56 +472,65 @@ class Game:
             return
 
         if self.player.health > 0:
-            # Iterate over enemies and shoot the first enemy whose word starts with the typed letter.
-            for enemy in self.enemy_list:
-
-                # it's not working because I'm check is enemy defeated only when im typing which won't always work
-                # This way of enemy death detection does not work
-                # This is a temp way to handle boss fight it help with pausing the campaign events until boss defeated
-                # if isinstance(enemy, (EnemyGunship, EnemyBattleship)) :
-                #
-                #     if enemy.is_defeated():
-                #         print("Boss dead")
-
-
-
-                if enemy.word and enemy.word[0].lower() == letter_typed:
-                    if self.player.ammo > 0:
-                        # Rotate the player's gun toward this enemy.
-                        self.player.gun_rotate_toward(enemy)
-                        # Remove the letter from the enemy.
-                        enemy.remove_letter()
-                        # Shoot a bullet at the enemy.
-                        self.bullets_manager.shoot(
-                            self.player.get_gun_end_firing_point(),
-                            enemy,
-                            letter_typed,
-                        )
-                        self.player.loss_ammo()
-                    else:
-                        # Play a sound if there’s no ammo.
-                        Loader.load_sound("assets/sounds/no_ammo.mp3").play()
-                    # Stop after handling the first matching enemy.
-                    break
-                else:
-                    pass
-                    # If no enemy starts with the letter, you can play an error sound.
-                    # Loader.load_sound("assets/sounds/spring.wav").play()
-
-    def process_events(self):
-        # Process all game events (keyboard, mouse, etc.)
-        self.process_json_campaign()
-        for event in pygame.event.get():
+            # Shoot the oldest enemy whose word starts with the typed letter.
+            # The enemy store does not keep spawn order, so compare handles (they only grow).
+            enemy = None
+            for candidate in self.enemy_list:
+                if candidate.word and candidate.word[0].lower() == letter_typed:
+                    if enemy is None or candidate.handle < enemy.handle:
+                        enemy = candidate
+
+            # If no enemy starts with the letter, you can play an error sound.
+            # Loader.load_sound("assets/sounds/spring.wav").play()
+            if enemy is None:
+                return
+
+            if self.player.ammo > 0:
+                # Rotate the player's gun toward this enemy.
+                self.player.gun_rotate_toward(enemy)
+                # Remove the letter from the enemy.
+                enemy.remove_letter()
+                # Shoot a bullet at the enemy.
+                self.bullets_manager.shoot(
+                    self.player.get_gun_end_firing_point(),
+                    enemy,
+                    letter_typed,
+                )
+                self.player.loss_ammo()
+            else:
+                # Play a sound if there’s no ammo.
+                Loader.load_sound("assets/sounds/no_ammo.mp3").play()
+
+    def process_events(self, events=None):
+        # Process all game events (keyboard, mouse, etc.); step() passes its own events instead of the queue
+        if self.recorder is not None:
+            self.recorder.begin_frame(game_clock.get_ticks())
+        with profiler.phase("campaign"):
+            self.process_json_campaign()
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            if self.recorder is not None:
+                self.recorder.record(event)
 
             self.player.handle_event_continuously(event)
 
             if event.type == pygame.QUIT:
+                if self.headless:
+                    return False
+                self.save_recording()
+                profiler.stop_trace()  # A capture still running is written out
+                alloc_tracker.flush_log()
+                writer.flush()  # Queued checkpoint/screenshot/trace saves
                 sys.exit() # Close the window when close button is clicked
 
 
             if event.type == pygame.KEYDOWN:
                 # handle key events
+                self.held_keys.add(event.key)
                 self.handle_keydown(event)
+            if event.type == pygame.KEYUP:
+                self.held_keys.discard(event.key)
             if event.type == pygame.MOUSEBUTTONDOWN:
                 clicked_option = self.menu.handle_mouse_click(event.pos)
                 if clicked_option == "resume":
@@ -402,81 +546,118 @@ class Game:
     def update_game_state(self):
         # Update all game objects and check for collisions
         if not self.paused:
-            self.stars.update_and_draw(self.screen, pygame.time.get_ticks())
-            self.bullets_manager.update_and_draw(self.screen, self.enemy_list)
-            self.player.handle_movement()
-            self.player.draw(self.screen) # updated
+            # During a hit-stop the simulation skips frames; input and drawing carry on
+            simulate = self.hit_stop.should_step()
+            view_culler.begin_frame()
+
+            if self.render:
+                with profiler.phase("stars"):
+                    self.stars.update_and_draw(self.screen, game_clock.get_ticks())
+            with profiler.phase("bullets"):
+                if simulate:
+                    self.bullets_manager.update_and_draw(self.screen if self.render else None, self.enemy_list, self.collision_grid)
+                elif self.render:
+                    self.bullets_manager.draw(self.screen)
+            if simulate:
+                self.player.handle_movement(None if self.read_keyboard else self.held_keys)
+            if self.render:
+                self.player.draw(self.screen) # updated
 
 
             if not self.game_over:
 
-                # Update Meteors in the game
+                # Update Meteors in the game (on the campaign clock, which stops while paused or in a hit-stop)
                 if self.meteor_shower:
-                    current_time = pygame.time.get_ticks()
+                    current_time = self.campaign.now
                     if current_time >= self.next_meteor_spawn_time:
-                        self.enemy_list.append(EnemyMeteor(self.player))
+                        self.enemy_list.add(EnemyMeteor(self.player))
                         self.next_meteor_spawn_time = current_time + self.get_next_meteor_spawn_delay()
 
 
-            for enemy in self.enemy_list[:]:
-                enemy.move(self.game_over)
-                enemy.draw(self.screen)
-
-
-                # Checking for a boss enemy and resuming the campaign
-                if isinstance(enemy, (EnemyGunship, EnemyBattleship)):
-                    if enemy.is_defeated():
-                        self.is_boss_active = False
-
-                # Shoot() function specific to Enemy Gunships
-                # if isinstance(enemy, EnemyGunship):  # Ensure only battleships shoot
-                #     enemy.shoot()
-
-                # # If the enemy is a battleship, update its shells too.
-                # if isinstance(enemy, EnemyBattleship):
-                #     for shell in enemy.shells[:]:
-                #         shell.move()  # Update the shell's position
-                #         shell.draw(self.screen)  # Draw the shell
-                #
-                #         # Optionally, remove the shell if it's off-screen
-                #         if shell.rect.top >= constants.SCREEN_HEIGHT:
-                #             enemy.shells.remove(shell)
-
-
-                # Delete off-screen enemy
-                if (
-                    enemy.rect.top >= constants.SCREEN_HEIGHT + 20
-                    or enemy.rect.left <= -50
-                    or enemy.rect.right >= constants.SCREEN_WIDTH + 50
-                ):
-                    self.enemy_list.remove(enemy)
-                    if enemy == self.selected_enemy:
-                        self.selected_enemy = None
-
-                # Player Coalition detection
-                if not self.game_over and enemy.rect.colliderect(self.player.rect):
-                    self.player.take_damage(1, self.game_window)
-                    # pygame.mixer.Sound("assets/sounds/player_got_hit.mp3").play()
-                    self.enemy_list.remove(enemy)
-                    self.selected_enemy = None
-                if self.player.health == 0:
-                    self.game_over = True
-                    self.player.set_dead()
-
-
-
-            self.game_window.display_states()
-        self.menu.draw_menu()
-        self.game_window.draw_player_hit_effect()
+            with profiler.phase("enemies"):
+                for enemy in self.enemy_list:
+                    if simulate:
+                        enemy.player_in_range = enemy in self.enemies_near_player
+                        with profiler.span("move", enemy):
+                            enemy.move(self.game_over)
+                    if self.render:
+                        # Skip the draw (and trail bookkeeping, see Enemy.record_trail) while off-screen
+                        enemy.on_screen = view_culler.is_visible(enemy.draw_bounds(), "enemies")
+                        if enemy.on_screen:
+                            with profiler.span("draw", enemy):
+                                enemy.draw(self.screen)
+
+                    # Shoot() function specific to Enemy Gunships
+                    # if isinstance(enemy, EnemyGunship):  # Ensure only battleships shoot
+                    #     enemy.shoot()
+
+                    # # If the enemy is a battleship, update its shells too.
+                    # if isinstance(enemy, EnemyBattleship):
+                    #     for shell in enemy.shells[:]:
+                    #         shell.move()  # Update the shell's position
+                    #         shell.draw(self.screen)  # Draw the shell
+                    #
+                    #         # Optionally, remove the shell if it's off-screen
+                    #         if shell.rect.top >= constants.SCREEN_HEIGHT:
+                    #             enemy.shells.remove(shell)
+
+
+                    # Delete off-screen enemy
+                    if (
+                        enemy.rect.top >= constants.SCREEN_HEIGHT + 20
+                        or enemy.rect.left <= -50
+                        or enemy.rect.right >= constants.SCREEN_WIDTH + 50
+                    ):
+                        self.enemy_list.kill(enemy)
+                        if enemy == self.selected_enemy:
+                            self.selected_enemy = None
+
+            # Drop dead enemies and add the children spawned during this tick
+            self.enemy_list.compact()
+
+            # Rebuild the broadphase grid from this tick's positions (nothing moved during a hit-stop frame)
+            if simulate:
+                with profiler.phase("collisions"):
+                    self.collision_grid.rebuild(self.enemy_list)
+                    self.handle_player_collisions()
+                    self.enemies_near_player = set(self.collision_grid.query_radius(
+                        self.player.rect.center, settings.proximity_query_radius))
+
+            if self.render:
+                with profiler.phase("hud"):
+                    self.game_window.display_states()
+                if self.show_cull_stats:
+                    self.game_window.draw_debug_line(view_culler.report())
+            else:
+                self.game_window.update_messages()  # Keep message timers running without drawing
+        if self.render:
+            with profiler.phase("menu"):
+                self.menu.draw_menu()
+            self.game_window.draw_player_hit_effect()
+
+    def handle_player_collisions(self):
+        # Player Coalition detection, only against enemies sharing a grid cell with the player
+        if not self.game_over:
+            for enemy in self.collision_grid.query_rect(self.player.rect):
+                self.player.take_damage(1, self.game_window)
+                # pygame.mixer.Sound("assets/sounds/player_got_hit.mp3").play()
+                self.enemy_list.kill(enemy)
+                self.collision_grid.remove(enemy)
+                self.selected_enemy = None
+        if self.player.health == 0 and not self.game_over:
+            self.game_over = True
+            self.player.set_dead()  # Once: it loads and scales the game-over picture
 
     def get_next_meteor_spawn_delay(self):
-        return random.randint(
+        return rng.gameplay.randint(
             settings.meteor_spawn_interval[0],
             settings.meteor_spawn_interval[1]
         )
 
     def manage_game_sounds(self):
         # Centralized global sound management:
+        if not pygame.mixer.get_init():
+            return  # Headless: no mixer
         if self.paused:
             pygame.mixer.pause()
         else:
@@ -495,24 +676,182 @@ class Game:
         while running:
 
             self.clock.tick(constants.FPS)
+            self.time_source.start_frame(self.clock.get_time())
+            profiler.begin_frame()
+            alloc_tracker.begin_frame()
 
-            result = self.process_events()
+            with profiler.phase("events"):
+                result = self.process_events()
             if result == "main_menu":
+                self.save_recording()
                 return "main_menu"
             elif not result:
+                self.save_recording()
                 return False
 
-            if not self.paused:
-                self.screen.fill(constants.BLACK)
-            self.update_game_state()
+            if self.fast_forward > 1 and not self.paused:
+                self.run_fast_forward()
+            else:
+                self.update_frame()
+            self.frames_displayed += 1
+
+            profiler.draw_overlay(self.screen)
+            alloc_tracker.draw_overlay(self.screen)
+            with profiler.phase("display_update"):
+                pygame.display.update()
+            profiler.end_frame()
+            alloc_tracker.end_frame()
+        pygame.quit()
 
-            self.manage_game_sounds()
+    def update_frame(self):
+        # One frame of the game after input (shared by run() and step())
+        frame_start = time.perf_counter()
+        if not self.paused and self.render:
+            self.screen.fill(constants.BLACK)
+        self.update_game_state()
+        self.frame_time_ms += ((time.perf_counter() - frame_start) * 1000 - self.frame_time_ms) * 0.1
 
-            # Upgrade window
-            self.upgrade_window.draw()
+        self.manage_game_sounds()
 
-            pygame.display.update()
-        pygame.quit()
+        # Upgrade window
+        if self.render:
+            with profiler.phase("upgrade_window"):
+                self.upgrade_window.draw()
+
+        self.update_snapshots()
+
+    def update_snapshots(self):
+        # Automatic snapshot between frames every snapshot_interval ms (not while paused, after game over or in endless mode)
+        if not settings.snapshot_interval or self.paused or self.game_over or isinstance(self.timeline, GeneratedTimeline):
+            return
+        if game_clock.get_ticks() >= self.next_snapshot_time:
+            self.take_snapshot(autosave=True)
+
+    def take_snapshot(self, autosave=False):
+        # Capture the whole simulation (about a millisecond), keep it for rewind and autosave it off the game thread
+        now = game_clock.get_ticks()
+        self.next_snapshot_time = now + settings.snapshot_interval
+        data = snapshot.capture(self)
+        self.snapshots.append((now, data))
+        if autosave and settings.snapshot_autosave_file and not self.headless:
+            path = Loader.resource_path(settings.snapshot_autosave_file)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            writer.save_bytes(path, data)
+        return data
+
+    def rewind(self):
+        # Back to the newest snapshot that is at least a second old; pressing again goes further back
+        now = game_clock.get_ticks()
+        while len(self.snapshots) > 1 and now - self.snapshots[-1][0] < 1000:
+            self.snapshots.pop()
+        if not self.snapshots:
+            print("No snapshot to rewind to")
+            return
+        ticks, data = self.snapshots[-1]
+        self.restore_snapshot(data)
+        print(f"Rewound {(now - ticks) / 1000:.1f} s to {ticks / 1000:.1f} s")
+
+    def restore_snapshot(self, data):
+        # Put the simulation back into a captured state (see core/snapshot.py)
+        snapshot.restore(self, data)
+        self.next_snapshot_time = game_clock.get_ticks() + settings.snapshot_interval
+
+    def load_snapshot_file(self, path):
+        with open(path, "rb") as f:
+            self.restore_snapshot(f.read())
+        print(f"Resumed from snapshot {path}")
+
+    def run_fast_forward(self):
+        # The rest of a displayed frame at fast_forward x: this frame's input was already processed,
+        # so update it and then run the extra frames, each one a full frame of game time with its
+        # campaign events. Only the last frame is drawn, and only on every k-th displayed frame.
+        frame_time = 1000 / constants.FPS
+        draw = self.render and self.fast_forward_render_every and \
+            self.frames_displayed % self.fast_forward_render_every == 0
+        render = self.render
+
+        self.render = False
+        self.update_frame()
+        for sub_frame in range(1, self.fast_forward):
+            if self.fast_forward == 1 or self.paused:
+                break  # Target reached (or paused): the rest of this frame runs at normal speed
+            self.time_source.advance(frame_time)
+            self.process_events(self.auto_typer.inputs(self) if settings.fast_forward_autoplay else ())
+            self.render = draw and sub_frame == self.fast_forward - 1
+            self.update_frame()
+        self.render = render
+
+        if render and not self.fast_forward_render_every and self.fast_forward > 1:
+            # Not drawing at all: just the progress on a black screen
+            self.screen.fill(constants.BLACK)
+            self.game_window.draw_debug_line(
+                f"Fast-forward {self.fast_forward}x (F8 to draw, Shift+F10 to stop)  "
+                f"event {self.main_track.index}/{len(self.timeline)}", line=1)
+
+    def set_fast_forward(self, speed):
+        # Simulation frames per displayed frame (1 = normal speed)
+        self.fast_forward = max(int(speed), 1)
+        target = f", until {self.fast_forward_until}" if self.fast_forward > 1 and self.fast_forward_until else ""
+        print(f"Fast-forward {self.fast_forward}x{target}")
+
+    def check_fast_forward_target(self, name):
+        # Campaign actions call this with the checkpoint id or enemy type they just started
+        if self.fast_forward_until is not None and name == str(self.fast_forward_until):
+            print(f"Fast-forward reached {name}")
+            self.fast_forward_until = None
+            self.set_fast_forward(1)
+
+    def step(self, dt=None, inputs=()):
+        """
+        Advance the game by exactly one frame, without the real clock or the event queue.
+
+        :param dt: Milliseconds of game time for this frame (defaults to one frame at constants.FPS).
+                   Only a ManualClock uses it; movement itself is per frame.
+        :param inputs: pygame events for this frame (KEYDOWN/KEYUP/mouse), used instead of pygame.event.get().
+        :return: True to keep going, "main_menu" or False when the game asked to leave.
+        """
+        if dt is None:
+            dt = 1000 / constants.FPS
+        self.time_source.start_frame(dt)
+        profiler.begin_frame()
+        alloc_tracker.begin_frame()
+
+        with profiler.phase("events"):
+            result = self.process_events(inputs)
+        if result is not True:
+            return result
+
+        self.update_frame()
+        profiler.end_frame()
+        alloc_tracker.end_frame()
+        return True
+
+    def start_recording(self, checkpoint):
+        # Record every input from now on; the clock is stored per frame so replays hit the same ticks.
+        # Movement follows the recorded KEYDOWN/KEYUP events so playback moves the player the same way.
+        self.read_keyboard = False
+        self.recorder = ReplayRecorder(
+            self.seed, checkpoint, game_clock.get_ticks(),
+            (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT),
+        )
+
+    def save_recording(self, path=None):
+        # Write the recording (if any); by default a timestamped file in settings.replay_dir
+        if self.recorder is None:
+            return None
+        if path is None:
+            replay_dir = Loader.resource_path(settings.replay_dir)
+            os.makedirs(replay_dir, exist_ok=True)
+            path = os.path.join(replay_dir, f"replay_{datetime.datetime.now():%Y%m%d_%H%M%S}.tsr")
+        self.recorder.save(path)
+        return path
+
+    def is_campaign_finished(self):
+        # Every campaign event has fired and nothing is left on screen
+        return (
+            self.campaign.is_finished()
+            and len(self.enemy_list) == 0
+        )
 
 
 
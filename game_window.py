@@ -1,6 +1,7 @@
 import pygame
 from config import utils, constants
 from config.loader import Loader
+from core import game_clock
 from effects.player_hit_effect import HitEffect
 from menu_screens.gui_button import HintButton
 
@@ -166,7 +167,7 @@ class GameWindow:
         Initiate an incoming message with a typewriter effect.
         :param message: The full incoming message string to be displayed.
         """
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         self.incoming_message = message
         self.current_enemy_text = ""
         self.text_index_enemy = 0
@@ -179,7 +180,7 @@ class GameWindow:
         Initiate an outgoing message with a typewriter effect.
         :param message: The full outgoing message string to be displayed.
         """
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         self.outgoing_message = message
         self.current_ship_ai_text = ""
         self.text_index_ship_ai = 0
@@ -203,7 +204,7 @@ class GameWindow:
 
     def update_messages(self):
         """Update the typing effect for enemy and ship AI messages."""
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if self.incoming_message:
             self.current_enemy_text, self.text_index_enemy, self.incoming_message_timer = self._update_text(
                 self.incoming_message, self.current_enemy_text, self.text_index_enemy, self.incoming_message_timer, now)
@@ -265,6 +266,11 @@ class GameWindow:
     #     self.screen.blit(health_text, (10 + 30, 50 + 40 + 35))
 
 
+    def draw_debug_line(self, text, line=0):
+        """Draw a line of debug text in the top-left corner, under the ESC hint."""
+        text_surface = self.control_font.render(text, True, (255, 255, 0))
+        self.screen.blit(text_surface, (10, 45 + line * 18))
+
     def display_states(self):
         """Display UI elements including player status and messages."""
         # Render control buttons and messages
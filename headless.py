@@ -0,0 +1,220 @@
+"""
+Runs the campaign headless (no window, no audio) as fast as the CPU allows.
+
+Run from the project root:
+    python headless.py [--checkpoint N] [--keys-per-second K] [--render] [--max-minutes M] [--seed S]
+                       [--record FILE] [--until TARGET] [--campaign FILE] [--endless] [--track-allocations]
+                       [--splash RADIUS] [--pierce]
+    python headless.py --replay FILE [--render]
+    python headless.py --resume SNAPSHOT [--keys-per-second K] [--render] [--max-minutes M]
+    python headless.py --verify-snapshot FRAME [--verify-frames N] [--checkpoint N] [--seed S]
+
+Game time comes from a ManualClock that moves one frame (1000 / FPS ms) per
+step, so a 20 minute campaign plays out in seconds. A simple bot does the
+typing: it presses the first letter of the oldest enemy that still has a
+word, at most K keys per second of game time. Checkpoints are written to a
+temporary file so the real save file is left alone.
+
+--until stops the run as soon as the given checkpoint id ("8") or enemy
+type ("enemy_battleship") comes up in the campaign.
+
+--record saves the run's inputs as a replay; --replay plays a replay file
+(recorded here or in the windowed game) back at the recorded ticks. The
+printed state digest is the same every time a given replay is played.
+
+--resume continues a world snapshot (an autosave from saves/, or one
+written with Game.take_snapshot) with the bot typing from there on.
+
+--verify-snapshot checks that a world snapshot continues exactly like the
+run it was taken from: it plays FRAME frames, snapshots, plays N more, then
+restores the snapshot into a new Game and plays the same N frames again. The
+two state digests must match (exit status 1 if they don't). Checkpoint 8
+(gunships and battleships firing shells) is a good scene for it.
+
+--track-allocations writes the new Surfaces of every frame, by caller, to
+settings.alloc_log_file (see core/alloc_tracker.py); use it with --render.
+
+Replays assume the session did not use "Load Last Checkpoint" (that reads
+the save file, which is not part of the recording).
+"""
+import argparse
+import copy
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+from campaign.checkpoint_manager import CheckpointManager
+from config import constants, game_settings as settings
+from core import game_clock, snapshot
+from core.alloc_tracker import alloc_tracker
+from core.auto_typer import AutoTyper
+from core.replay import Replay
+from game import Game
+
+
+def temporary_checkpoint_manager():
+    save_dir = tempfile.mkdtemp(prefix="typing_shooter_")
+    return CheckpointManager(os.path.join(save_dir, "checkpoints.json"))
+
+
+def state_digest(game):
+    """Short hash of the simulation state, for checking that two runs match."""
+    state = (
+        game_clock.get_ticks(),
+        game.main_track.index,
+        tuple(game.player.rect), game.player.health, game.player.ammo,
+        tuple(sorted((enemy.handle, type(enemy).__name__, enemy.word, tuple(enemy.rect)) for enemy in game.enemy_list)),
+    )
+    return hashlib.sha1(repr(state).encode("utf-8")).hexdigest()[:16]
+
+
+def summarize(game, frames, wall_seconds):
+    return {
+        "seed": game.seed,
+        "finished": game.is_campaign_finished(),
+        "frames": frames,
+        "game_seconds": round(game_clock.get_ticks() / 1000, 1),
+        "wall_seconds": round(wall_seconds, 2),
+        "speedup": round(game_clock.get_ticks() / 1000 / wall_seconds, 1) if wall_seconds else 0,
+        "events_fired": game.main_track.index,
+        "player_health": game.player.health,
+        "player_ammo": game.player.ammo,
+        "state_digest": state_digest(game),
+    }
+
+
+def run_campaign(checkpoint=1, keys_per_second=8, render=False, max_minutes=60, seed=None, record_path=None,
+                 until=None, resume_path=None):
+    """
+    Play the campaign headless from `checkpoint` (or the snapshot at `resume_path`) until it finishes,
+    reaches `until` (a checkpoint id or enemy type) or runs for `max_minutes` of game time.
+    Returns a summary dict.
+    """
+    if resume_path:
+        with open(resume_path, "rb") as f:
+            manifest = snapshot.read_manifest(f.read())
+        constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT = manifest["screen"]
+        settings.campaign_file = manifest["campaign"]
+        seed = manifest["seed"]
+
+    game = Game(checkpoint, headless=True, checkpoint_manager=temporary_checkpoint_manager(), seed=seed)
+    if resume_path:
+        game.load_snapshot_file(resume_path)
+    game.render = render
+    game.fast_forward_until = until  # Cleared by the game when the target comes up
+    if record_path:
+        game.start_recording(checkpoint)
+    typer = AutoTyper(keys_per_second)
+
+    max_frames = int(max_minutes * 60 * constants.FPS)
+    frames = 0
+    wall_start = time.perf_counter()
+    while frames < max_frames and not game.is_campaign_finished():
+        if until is not None and game.fast_forward_until is None:
+            break
+        if not game.step(inputs=typer.inputs(game)):
+            break
+        frames += 1
+    wall_seconds = time.perf_counter() - wall_start
+
+    if record_path:
+        game.save_recording(record_path)
+    return summarize(game, frames, wall_seconds)
+
+
+def verify_snapshot(checkpoint=1, snapshot_frame=3000, frames_after=1500, seed=None, keys_per_second=8):
+    """
+    Snapshot round trip: the digest after `frames_after` more frames of the uninterrupted run, and the
+    digest after the same frames played from the snapshot restored into a new Game. Returns both.
+    """
+    game = Game(checkpoint, headless=True, checkpoint_manager=temporary_checkpoint_manager(), seed=seed)
+    typer = AutoTyper(keys_per_second)
+    for _ in range(snapshot_frame):
+        game.step(inputs=typer.inputs(game))
+    data = snapshot.capture(game)
+    restored_typer = copy.deepcopy(typer)  # The bot's own timing is not part of the world
+    for _ in range(frames_after):
+        game.step(inputs=typer.inputs(game))
+
+    # A new Game in the same process: pools and module state are already warm, as after a rewind
+    restored = Game(checkpoint, headless=True, checkpoint_manager=temporary_checkpoint_manager(), seed=seed)
+    snapshot.restore(restored, data)
+    for _ in range(frames_after):
+        restored.step(inputs=restored_typer.inputs(restored))
+    return state_digest(game), state_digest(restored)
+
+
+def run_replay(path, render=False):
+    """Play a replay file back headless, frame by frame at the recorded ticks. Returns a summary dict."""
+    replay = Replay.load(path)
+    header = replay.header
+    constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT = header["screen_width"], header["screen_height"]
+
+    game = Game(
+        header["checkpoint"], headless=True, clock=game_clock.ManualClock(header["start_ticks"]),
+        checkpoint_manager=temporary_checkpoint_manager(), seed=header["seed"],
+    )
+    game.render = render
+
+    frames = 0
+    wall_start = time.perf_counter()
+    for dt, events in replay.frames():
+        if game.step(dt, events) is not True:
+            break
+        frames += 1
+    return summarize(game, frames, time.perf_counter() - wall_start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the campaign without a window or audio.")
+    parser.add_argument("--checkpoint", type=int, default=1, help="Checkpoint id to start from")
+    parser.add_argument("--keys-per-second", type=float, default=8, help="Typing speed of the bot")
+    parser.add_argument("--render", action="store_true", help="Still draw every frame to an off-screen surface")
+    parser.add_argument("--max-minutes", type=float, default=60, help="Give up after this much game time")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (the same seed replays the same run)")
+    parser.add_argument("--record", metavar="FILE", help="Save this run's inputs as a replay file")
+    parser.add_argument("--replay", metavar="FILE", help="Play back a replay file instead of using the bot")
+    parser.add_argument("--campaign", metavar="FILE", default=settings.campaign_file,
+                        help="Campaign to play (.json, or .jsonl to stream it)")
+    parser.add_argument("--endless", action="store_true", help="Play generated endless waves (stops at --max-minutes)")
+    parser.add_argument("--splash", type=int, metavar="RADIUS", default=settings.bullet_splash_radius,
+                        help="Bullet upgrade: enemies within RADIUS px of a hit lose a letter too")
+    parser.add_argument("--pierce", action="store_true", default=settings.bullet_pierce,
+                        help="Bullet upgrade: enemies a bullet flies through lose a letter")
+    parser.add_argument("--resume", metavar="SNAPSHOT", help="Continue from a world snapshot file")
+    parser.add_argument("--verify-snapshot", type=int, metavar="FRAME",
+                        help="Snapshot at FRAME and check the restored run matches the uninterrupted one")
+    parser.add_argument("--verify-frames", type=int, default=1500, help="Frames played after the snapshot")
+    parser.add_argument("--track-allocations", action="store_true", help="Log new Surfaces per frame by caller")
+    parser.add_argument("--until", metavar="TARGET", help='Stop at this checkpoint id ("8") or enemy type ("enemy_battleship")')
+    args = parser.parse_args()
+    settings.campaign_file = args.campaign
+    settings.endless_mode = args.endless
+    settings.bullet_splash_radius = args.splash
+    settings.bullet_pierce = args.pierce
+    if args.track_allocations:
+        alloc_tracker.install()
+
+    if args.verify_snapshot is not None:
+        uninterrupted, restored = verify_snapshot(args.checkpoint, args.verify_snapshot, args.verify_frames,
+                                                  args.seed, args.keys_per_second)
+        print(f"{'uninterrupted':<14} {uninterrupted}")
+        print(f"{'restored':<14} {restored}")
+        if uninterrupted != restored:
+            print("Snapshot round trip diverged")
+            sys.exit(1)
+        return
+    if args.replay:
+        summary = run_replay(args.replay, args.render)
+    else:
+        summary = run_campaign(args.checkpoint, args.keys_per_second, args.render, args.max_minutes,
+                               args.seed, args.record, args.until, args.resume)
+    for key, value in summary.items():
+        print(f"{key:<14} {value}")
+    alloc_tracker.flush_log()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,22 @@
 
 # Make .exe using "auto-py-to-exe"
 
+from core.startup_tracer import startup
+startup.install()  # Before the other imports, so they are timed
+
+import argparse
 import ctypes
 import pygame
 
-from config import constants
+from config import constants, game_settings as settings
 from game import Game
 from menu_screens.layout_menu_screen import LayoutMenu
 from menu_screens.level_loading_screen import LevelLoadingScreen
 from menu_screens.setting_menu_screen import SettingsMenu
 from menu_screens.start_menu_screen import StartScreen
 from effects.stars import StarBackground
+from core.persistence import writer
+from core.alloc_tracker import alloc_tracker
 
 # Set DPI awareness (Windows only)
 try:
@@ -55,12 +61,29 @@ def run_start_screen(screen, star_background, clock):
     while not chosen_option:
         events = pygame.event.get()
         chosen_option = start_screen.handle_events(events)
+        if startup.active and "first_frame" in startup.milestones:
+            end_startup_trace()
+            if settings.exit_after_startup:
+                chosen_option = "Exit"
         start_screen.draw()
+        startup.mark("first_frame")
         clock.tick(60)
 
     return chosen_option
 
 
+def end_startup_trace():
+    """
+    The start menu has handled input for the first time: report where the
+    startup time went (see core/startup_tracer.py).
+    """
+    startup.mark("interactive")
+    if settings.startup_report:
+        print(startup.report())
+    if settings.startup_report_file:
+        startup.write(settings.startup_report_file)
+
+
 def run_level_loading_screen(screen, star_background, clock):
     """
     Runs the level loading screen and returns the result.
@@ -147,12 +170,58 @@ def run_layout_menu(screen, clock):
     return result
 
 
+def parse_arguments():
+    """
+    Command line options for testing; the defaults come from config/game_settings.py.
+    e.g. `python main.py --fast-forward 64 --render-every 0 --until 8` races to checkpoint 8.
+    """
+    parser = argparse.ArgumentParser(description="Typing Shooter")
+    parser.add_argument("--fast-forward", type=int, default=settings.fast_forward,
+                        help="Simulation frames per displayed frame when a game starts (F10 changes it in game)")
+    parser.add_argument("--render-every", type=int, default=settings.fast_forward_render_every,
+                        help="While fast-forwarding, draw every k-th displayed frame (0 = don't draw)")
+    parser.add_argument("--until", metavar="TARGET", default=settings.fast_forward_until,
+                        help='Stop fast-forwarding at this checkpoint id ("8") or enemy type ("enemy_battleship")')
+    parser.add_argument("--endless", action="store_true", default=settings.endless_mode,
+                        help="Play generated endless waves instead of the campaign")
+    parser.add_argument("--splash", type=int, metavar="RADIUS", default=settings.bullet_splash_radius,
+                        help="Bullet upgrade: enemies within RADIUS px of a hit lose a letter too")
+    parser.add_argument("--pierce", action="store_true", default=settings.bullet_pierce,
+                        help="Bullet upgrade: enemies a bullet flies through lose a letter")
+    parser.add_argument("--track-allocations", action="store_true", default=settings.alloc_tracking,
+                        help="Count new Surfaces per frame by caller (F2 shows them, see core/alloc_tracker.py)")
+    parser.add_argument("--startup-report", action="store_true", default=settings.startup_report,
+                        help="Print where the startup time went once the menu is interactive")
+    parser.add_argument("--startup-json", metavar="FILE", default=settings.startup_report_file,
+                        help="Also write the startup trace to this JSON file")
+    parser.add_argument("--exit-after-startup", action="store_true", default=settings.exit_after_startup,
+                        help="Quit as soon as the menu is interactive (benchmarks/startup_benchmark.py)")
+    args = parser.parse_args()
+
+    settings.fast_forward = args.fast_forward
+    settings.fast_forward_render_every = args.render_every
+    settings.fast_forward_until = args.until
+    settings.endless_mode = args.endless
+    settings.bullet_splash_radius = args.splash
+    settings.bullet_pierce = args.pierce
+    settings.alloc_tracking = args.track_allocations
+    settings.startup_report = args.startup_report
+    settings.startup_report_file = args.startup_json
+    settings.exit_after_startup = args.exit_after_startup
+
+
 def main():
-    pygame.init()
+    parse_arguments()
+    if settings.alloc_tracking:
+        alloc_tracker.install()  # Before any font or surface is made
+    with startup.section("init", "pygame.init"):
+        pygame.init()
 
     # Calculate dimensions only once and create the display window.
     constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT = get_monitor_height_width()
-    screen = pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+    with startup.section("init", "set_mode"):
+        screen = pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
+    startup.mark("window")
     star_background = StarBackground()
     clock = pygame.time.Clock()
 
@@ -186,6 +255,8 @@ def main():
             if result == "Exit":
                 running = False
 
+    alloc_tracker.flush_log()
+    writer.flush()  # Saves still queued on the persistence thread
     pygame.quit()
 
 
@@ -106,15 +106,13 @@ class LevelLoadingScreen:
         self.screen = screen                       # Display surface
         self.background = star_background          # Star background animation
         self.clickable_levels = []                 # List of level icons
-        checkpoint_manager = CheckpointManager()
-        unlocked = checkpoint_manager.get_list_of_unlocked_checkpoints()  # Get unlocked levels
+        self.checkpoint_manager = CheckpointManager()  # Also deletes checkpoints when clicking the delete button
+        unlocked = self.checkpoint_manager.get_list_of_unlocked_checkpoints()  # Get unlocked levels
         unlock_threshold = len(unlocked)
         self.setup_levels(unlock_threshold)        # Create level icons based on an unlocked threshold
         self.selected_index = 0                    # Currently selected level index
         self.should_exit = False                   # Flag to exit the level selection screen
 
-        self.checkpoint_manager = CheckpointManager()  # Delete checkpoint when clicking delete button
-
         # Load navigation sound if available
         try:
             self.move_sound = Loader.load_sound("assets/sounds/menu_hover_sound.wav")
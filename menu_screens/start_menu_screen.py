@@ -97,7 +97,7 @@ class StartScreen:
 
         # Music setup
         self.music_on = True
-        self.music_font = pygame.font.Font(None, 24)
+        self.music_font = Loader.load_font(None, 24)
         Loader.load_music("assets/sounds/music/ambientmain_0.ogg")
         pygame.mixer.music.play(-1)  # Loop music indefinitely
         button_width = 130
@@ -2,6 +2,7 @@ import pygame
 from config import constants, utils
 import math
 from config.loader import Loader
+from core import game_clock
 
 
 
@@ -29,7 +30,7 @@ class Player:
             ) for i in range(3)
         ]
         self.flame_index = 0
-        self.flame_timer = pygame.time.get_ticks()
+        self.flame_timer = game_clock.get_ticks()
         self.flame_delay = 5
 
         self.hit_flash = False
@@ -39,7 +40,7 @@ class Player:
         # Engine sound setup
         self.engine_sound = Loader.load_sound("assets/sounds/jet_engine.ogg")
         self.engine_sound.set_volume(0.2)
-        self.engine_channel = pygame.mixer.Channel(1)
+        self.engine_channel = Loader.get_channel(1)
         if not self.engine_channel.get_busy():
             self.engine_channel.play(self.engine_sound, loops=-1)
 
@@ -56,7 +57,7 @@ class Player:
 
         # Handle hit flash effect.
         if self.hit_flash:
-            elapsed = pygame.time.get_ticks() - self.flash_start_time
+            elapsed = game_clock.get_ticks() - self.flash_start_time
             if elapsed < self.FLASH_DURATION:
                 if elapsed // 50 % 2 == 0:
                     screen.blit(self.image, self.rect.topleft)
@@ -65,7 +66,7 @@ class Player:
                 screen.blit(self.image, self.rect.topleft)
 
     def draw_and_update_flame(self, screen):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.flame_timer > self.flame_delay:
             self.flame_index = (self.flame_index + 1) % len(self.flame_sprites)
             self.flame_timer = now
@@ -74,12 +75,19 @@ class Player:
         screen.blit(flame, flame_rect.topleft)
 
 
-    def handle_movement(self):
+    def handle_movement(self, held_keys=None):
+        # held_keys: set of key codes held down, fed by headless/replay drivers; None reads the keyboard
+        if held_keys is None:
+            keys = pygame.key.get_pressed()
+            left = keys[pygame.K_LEFT] or keys[pygame.K_LSHIFT]
+            right = keys[pygame.K_RIGHT] or keys[pygame.K_RSHIFT]
+        else:
+            left = pygame.K_LEFT in held_keys or pygame.K_LSHIFT in held_keys
+            right = pygame.K_RIGHT in held_keys or pygame.K_RSHIFT in held_keys
 
-        keys = pygame.key.get_pressed()
-        if (keys[pygame.K_LEFT] or keys[pygame.K_LSHIFT]) and self.rect.left > 0:
+        if left and self.rect.left > 0:
             self.rect.move_ip(-constants.PLAYER_SPEED, 0)
-        if (keys[pygame.K_RIGHT] or keys[pygame.K_RSHIFT]) and self.rect.right < constants.SCREEN_WIDTH:
+        if right and self.rect.right < constants.SCREEN_WIDTH:
             self.rect.move_ip(constants.PLAYER_SPEED, 0)
 
     def handle_event_continuously(self, event):
@@ -109,7 +117,7 @@ class Player:
         else:
             Loader.load_sound("assets/sounds/player_hit.wav").play()
             self.hit_flash = True
-            self.flash_start_time = pygame.time.get_ticks()
+            self.flash_start_time = game_clock.get_ticks()
             if game_window:
                 game_window.trigger_player_hit_effect()
 
@@ -124,6 +132,11 @@ class Player:
         self.image = pygame.transform.smoothscale(self.image, (100, 100))
         self.engine_channel.stop()
 
+    def set_alive(self):
+        # Undo set_dead() (a world snapshot from before the death was restored)
+        self.image = Loader.load_image("assets/images/player_ship.png")
+        self.image = pygame.transform.smoothscale(self.image, (50, 50))
+
 
     def get_gun_end_firing_point(self):
         # Use the current gun_angle to compute the firing point
@@ -1,15 +1,27 @@
 import pygame
-from config import constants
+from config import constants, game_settings as settings
+from config.loader import Loader
 import math
 
 class Bullet:
+    __slots__ = ("pool", "surface", "font", "pierced", "x", "y", "target", "target_handle",
+                 "angle", "rect", "letter", "splash_radius", "pierce")
+
     def __init__(self, firing_point, target_enemy, letter):
+        self.pool = None  # Set by ObjectPool when the bullet is pooled
+        self.surface = pygame.Surface((constants.BULLET_WIDTH, constants.BULLET_HEIGHT), pygame.SRCALPHA)
+        self.surface.fill(constants.YELLOW)
+        self.font = Loader.load_font(None, 30)
+        self.pierced = set()  # Handles of enemies already knocked back by a piercing bullet
+        self.reset(firing_point, target_enemy, letter)
+
+    def reset(self, firing_point, target_enemy, letter):
+        # Aim the bullet at a new target; the surface and font are reused by pooled bullets
         self.x, self.y = firing_point
 
 
         self.target = target_enemy
-        self.surface = pygame.Surface((constants.BULLET_WIDTH, constants.BULLET_HEIGHT), pygame.SRCALPHA)
-        self.surface.fill(constants.YELLOW)
+        self.target_handle = target_enemy.handle  # Detects a target recycled by a pool
 
         # Calculate correct angle
         dx = target_enemy.rect.centerx - self.x
@@ -20,7 +32,18 @@ class Bullet:
 
         # Attaching letter to bullet
         self.letter = letter
-        self.font = pygame.font.Font(None, 30)
+
+        # Upgrade behaviour
+        self.splash_radius = settings.bullet_splash_radius
+        self.pierce = settings.bullet_pierce
+        self.pierced.clear()
+
+    def on_release(self):
+        # Back in the pool: don't keep the (usually killed) target and its surfaces alive
+        self.target = None
+
+    def is_target_alive(self):
+        return self.target.alive and self.target.handle == self.target_handle
 
     def update(self):
         # Move bullet toward the enemy in a homing manner.
@@ -44,4 +67,3 @@ class Bullet:
         # Drawing letter with bullet
         # letter_surface = self.font.render(self.letter, True, (255, 255, 255))
         # screen.blit(letter_surface, (self.rect.x + 20, self.rect.y + 20))
-
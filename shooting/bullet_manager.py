@@ -1,7 +1,8 @@
 import pygame
 
-from config import utils, constants
+from config import utils, constants, game_settings as settings
 from config.loader import Loader
+from core.object_pool import ObjectPool
 from shooting.bullet import Bullet
 from effects.particles import Particle
 from effects.plus_one import PlusXEffect
@@ -12,14 +13,21 @@ from effects.shockwave import Shockwave
 # Bullet Manager Class
 # =============================================
 class BulletManager:
-    def __init__(self, player):
+    def __init__(self, player, hit_stop=None):
         self.player = player
+        self.hit_stop = hit_stop  # HitStop triggered on kills (None: no hit-stop)
         self.bullets = []  # Active bullets
         self.enemy_bullets = []  # Enemy bullets list
         self.shockwaves = []  # Shockwave animated
         self.plus_x_effects = []  # '+X' ammo animated
         self.particles = []  # Bullet hit particles
 
+        # Pools for the short-lived objects (high-water marks live in game_settings)
+        self.bullet_pool = ObjectPool(Bullet, settings.pool_high_water["Bullet"])
+        self.particle_pool = ObjectPool(Particle, settings.pool_high_water["Particle"])
+        self.shockwave_pool = ObjectPool(Shockwave, settings.pool_high_water["Shockwave"])
+        self.plus_x_pool = ObjectPool(PlusXEffect, settings.pool_high_water["PlusXEffect"])
+
         # Load and set up sounds
         # self.bullet_hit_sound = pygame.mixer.Sound("assets/sounds/bullet_hit.ogg")
         # self.explosion_sound = pygame.mixer.Sound("assets/sounds/explosion.wav")
@@ -28,34 +36,67 @@ class BulletManager:
 
         self.bullet_hit_sound.set_volume(1.0)
         self.explosion_sound.set_volume(1.0)
-        pygame.mixer.set_num_channels(32)
-        self.explosion_channel = pygame.mixer.Channel(31)
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(32)
+        self.explosion_channel = Loader.get_channel(31)
 
     # =============================================
     # Bullet-related Functions
     # =============================================
     def shoot(self, firing_point, target_enemy, letter):
-        # Create a new bullet and add it to the list
-        bullet = Bullet(firing_point, target_enemy, letter)
+        # Take a bullet from the pool and add it to the list
+        bullet = self.bullet_pool.acquire(firing_point, target_enemy, letter)
         self.bullets.append(bullet)
 
-    def handle_bullet_collision(self, bullet, enemy_list):
+    def handle_bullet_collision(self, bullet, enemy_list, collision_grid=None):
         # Handle what happens when a bullet hits an enemy
         if bullet.rect.colliderect(bullet.target.rect):
             bullet.target.reduce_hit_count()
             self.create_particle_effect(bullet.rect.centerx, bullet.rect.centery)
             bullet.target.apply_pushback(bullet, force=2)
-            self.bullets.remove(bullet)
             self.bullet_hit_sound.play()
 
+            if bullet.splash_radius > 0 and collision_grid is not None:
+                self.apply_splash(bullet, enemy_list, collision_grid)
+
             if bullet.target.is_defeated():
-                self.handle_enemy_defeated(bullet.target, enemy_list)
+                self.handle_enemy_defeated(bullet.target, enemy_list, collision_grid)
 
+            # Only once the hit is fully handled: the pool clears the bullet's target
+            self.bullets.remove(bullet)
+            self.bullet_pool.release(bullet)
+
+        elif bullet.pierce and collision_grid is not None:
+            self.apply_pierce(bullet, enemy_list, collision_grid)
+
+    def apply_splash(self, bullet, enemy_list, collision_grid):
+        # Every other enemy within the splash radius of the impact takes a hit
+        for enemy in collision_grid.query_radius(bullet.rect.center, bullet.splash_radius):
+            if enemy is not bullet.target and enemy.alive:
+                self.apply_secondary_hit(enemy, bullet, enemy_list, collision_grid)
+
+    def apply_pierce(self, bullet, enemy_list, collision_grid):
+        # Non-target enemies the bullet flies through take a hit, once each
+        for enemy in collision_grid.query_rect(bullet.rect):
+            if enemy is not bullet.target and enemy.alive and enemy.handle not in bullet.pierced:
+                bullet.pierced.add(enemy.handle)
+                self.create_particle_effect(bullet.rect.centerx, bullet.rect.centery, amount=5)
+                self.apply_secondary_hit(enemy, bullet, enemy_list, collision_grid)
+
+    def apply_secondary_hit(self, enemy, bullet, enemy_list, collision_grid):
+        # A splash/pierce hit costs the enemy a letter, as if it had been typed and shot
+        if not enemy.word:
+            return  # Nothing to shoot off: checkpoint dividers, or an enemy whose last letter is already in flight
+        enemy.remove_letter()
+        enemy.reduce_hit_count()
+        enemy.apply_pushback(bullet, force=2)
+        if enemy.is_defeated():
+            self.handle_enemy_defeated(enemy, enemy_list, collision_grid)
 
     # =============================================
     # Enemy Interaction Functions
     # =============================================
-    def handle_enemy_defeated(self, enemy, enemy_list):
+    def handle_enemy_defeated(self, enemy, enemy_list, collision_grid=None):
         # Handle the logic when an enemy is defeated
         self.explosion_channel.play(self.explosion_sound)
         self.create_shockwave(enemy.rect.centerx, enemy.rect.centery)
@@ -64,37 +105,57 @@ class BulletManager:
         if drop_count > 0:
             self.create_plus_x_effect(enemy.rect.centerx, enemy.rect.centery, drop_count)
             self.player.ammo += drop_count
-        pygame.time.delay(50)
-        enemy_list.remove(enemy)
+        if self.hit_stop is not None:
+            self.hit_stop.trigger(settings.hit_stop_duration, settings.hit_stop_time_scale)
+        enemy_list.kill(enemy)
+        if collision_grid is not None:
+            collision_grid.remove(enemy)
 
     # =============================================
     # Main Update and Draw Function
     # =============================================
-    def update_and_draw(self, screen, enemy_list):
+    def update_and_draw(self, screen, enemy_list, collision_grid=None):
         # Update and draw all bullets, particles, shockwaves, and animated
-        self.update_bullets(screen, enemy_list)
+        # (screen=None updates everything without drawing, for headless runs)
+        self.update_bullets(screen, enemy_list, collision_grid)
         self.update_enemy_bullets(screen)
         self.update_particles(screen)
         self.update_shockwaves(screen)
         self.update_plus_x_effects(screen)
 
+    def draw(self, screen):
+        # Draw everything in place without updating (hit-stop frames)
+        for bullet in self.bullets:
+            bullet.draw(screen)
+        for bullet in self.enemy_bullets:
+            bullet.draw(screen)
+        for particle in self.particles:
+            particle.draw(screen)
+        for shockwave in self.shockwaves:
+            shockwave.draw(screen)
+        for plus_x in self.plus_x_effects:
+            plus_x.draw(screen)
+
     # =============================================
     # Individual Update and Draw Methods
     # =============================================
-    def update_bullets(self, screen, enemy_list):
+    def update_bullets(self, screen, enemy_list, collision_grid=None):
         # Update and draw all bullets
         for bullet in self.bullets[:]:
-            if bullet.target not in enemy_list:
+            if not bullet.is_target_alive():
                 self.bullets.remove(bullet)
+                self.bullet_pool.release(bullet)
                 continue
             bullet.update()
-            bullet.draw(screen)
-            self.handle_bullet_collision(bullet, enemy_list)
+            if screen is not None:
+                bullet.draw(screen)
+            self.handle_bullet_collision(bullet, enemy_list, collision_grid)
 
     def update_enemy_bullets(self, screen):
         for bullet in self.enemy_bullets[:]:
             bullet.update()
-            bullet.draw(screen)
+            if screen is not None:
+                bullet.draw(screen)
 
             # Check collision with player
             if bullet.rect.colliderect(self.player.rect):
@@ -109,25 +170,31 @@ class BulletManager:
         # Update and draw all particles
         for particle in self.particles[:]:
             particle.update()
-            particle.draw(screen)
+            if screen is not None:
+                particle.draw(screen)
             if particle.lifetime <= 0:
                 self.particles.remove(particle)
+                self.particle_pool.release(particle)
 
     def update_shockwaves(self, screen):
         # Update and draw all shockwaves
         for shockwave in self.shockwaves[:]:
             shockwave.update()
-            shockwave.draw(screen)
+            if screen is not None:
+                shockwave.draw(screen)
             if shockwave.alpha == 0:
                 self.shockwaves.remove(shockwave)
+                self.shockwave_pool.release(shockwave)
 
     def update_plus_x_effects(self, screen):
         # Update and draw all '+X' ammo animated
         for plus_x in self.plus_x_effects[:]:
             plus_x.update()
-            plus_x.draw(screen)
+            if screen is not None:
+                plus_x.draw(screen)
             if plus_x.lifetime <= 0:
                 self.plus_x_effects.remove(plus_x)
+                self.plus_x_pool.release(plus_x)
 
     # =============================================
     # Visual Effects Functions
@@ -135,12 +202,12 @@ class BulletManager:
     def create_particle_effect(self, x, y, color=(utils.color("FFF300")), amount=20):
         # Generate particle animated at a given position
         for _ in range(amount):
-            self.particles.append(Particle(x, y, color))
+            self.particles.append(self.particle_pool.acquire(x, y, color))
 
     def create_shockwave(self, x, y):
         # Create a shockwave effect at a given position
-        self.shockwaves.append(Shockwave(x, y))
+        self.shockwaves.append(self.shockwave_pool.acquire(x, y))
 
     def create_plus_x_effect(self, x, y, amount):
         # Create a '+X' effect at a given position with specified amount
-        self.plus_x_effects.append(PlusXEffect(x, y, amount))
+        self.plus_x_effects.append(self.plus_x_pool.acquire(x, y, amount))
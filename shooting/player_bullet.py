@@ -5,6 +5,8 @@ import math
 from bullet import Bullet
 
 class PlayerBullet(Bullet):
+    __slots__ = ()
+
     def __init__(self, firing_point, target_enemy, letter):
         """
         Initialize a player bullet.